@@ -0,0 +1,189 @@
+import numpy as np
+
+# marge angulaire (rad) des requêtes sur l'index des plans méridiens : couvre les écarts d'arrondi entre
+# les angles des sommets (arctan2) et le signe de leur distance au plan
+ANGLE_TOL = 1e-9
+
+    # ========================================== #
+    # ========== INDEX D'INTERVALLES =========== #
+    # ========================================== #
+
+def _interval_index(lo, hi, owner, v_min, v_max, n_bins):
+    """
+    Index d'intervalles par casiers (format CSR) : chaque intervalle [lo, hi] est inscrit dans tous les
+    casiers qu'il recouvre, de sorte qu'une valeur v ne visite que les intervalles proches de v.
+    """
+    width = (v_max - v_min) / n_bins if v_max > v_min else 1.0
+
+    b_lo = np.clip(np.floor((lo - v_min) / width), 0, n_bins - 1).astype(np.intp)
+    b_hi = np.clip(np.floor((hi - v_min) / width), 0, n_bins - 1).astype(np.intp)
+
+    # --> une entrée par couple (intervalle, casier recouvert)
+    counts = b_hi - b_lo + 1
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    entry_bin = np.repeat(b_lo, counts) + (np.arange(counts.sum()) - offsets)
+    entry_owner = np.repeat(owner, counts)
+
+    order = np.argsort(entry_bin, kind="stable")
+
+    index = {
+        "MIN": v_min,
+        "WIDTH": width,
+        "N_BINS": n_bins,
+        "PTR": np.searchsorted(entry_bin[order], np.arange(n_bins + 1)),
+        "IDS": entry_owner[order],
+    }
+
+    return index
+
+def _query_index(index, v, tol=0.0, period=None):
+    """
+    Retourne les triangles candidats (sans doublon) dont un intervalle peut contenir une valeur de [v - tol, v + tol]
+    (valeurs ramenées modulo `period` si elle est donnée).
+    """
+    bounds = np.array([v - tol, v + tol])
+    if period is not None:
+        bounds = bounds % period
+
+    ks = np.clip(np.floor((bounds - index["MIN"]) / index["WIDTH"]), 0, index["N_BINS"] - 1).astype(np.intp)
+    ks = range(ks[0], ks[1] + 1) if ks[0] <= ks[1] else list(range(ks[0], index["N_BINS"])) + list(range(0, ks[1] + 1))
+
+    return np.unique(np.concatenate([index["IDS"][index["PTR"][k]:index["PTR"][k + 1]] for k in ks]))
+
+def _bin_count(extent, span, n_entries):
+    scale = np.median(extent) if np.median(extent) > 0 else np.mean(extent)
+
+    return int(np.clip(span / scale, 1, max(4 * n_entries, 1))) if scale > 0 else 1
+
+def _edge_angles(triangles, center):
+    """
+    Intervalles angulaires (modulo π) balayés par les arêtes des triangles autour de l'axe du lanceur.
+
+    Un plan méridien contenant la direction ψ contient aussi ψ + π : un triangle ne peut le couper que si
+    l'une de ses arêtes balaie l'angle ψ modulo π.
+    """
+    alpha = np.arctan2(triangles[..., 2] - center[1], triangles[..., 1] - center[0])
+    alpha_next = np.roll(alpha, -1, axis=1)
+
+    delta = (alpha_next - alpha + np.pi) % (2 * np.pi) - np.pi
+    start = np.where(delta >= 0, alpha, alpha + delta) % np.pi
+    length = np.abs(delta)
+
+    owner = np.repeat(np.arange(len(triangles)), 3)
+    start, length = start.ravel(), length.ravel()
+    end = start + length
+
+    # --> arêtes passant par l'axe (arc de π) : tout l'intervalle ; arcs dépassant π : découpés en deux
+    full = length >= np.pi
+    wrap = ~full & (end > np.pi)
+
+    lo = np.concatenate([np.where(full, 0.0, start), np.zeros(wrap.sum())])
+    hi = np.concatenate([np.where(full, np.pi, np.minimum(end, np.pi)), end[wrap] - np.pi])
+
+    return lo, hi, np.concatenate([owner, owner[wrap]])
+
+def Build_SliceIndex(triangles, axis_center=None, n_bins=None):
+    """
+    Prépare un maillage pour des coupes multiples : les triangles sont indexés une seule fois selon leur
+    étendue en Y (plans parallèles) et selon leur étendue angulaire autour de l'axe du lanceur (plans méridiens).
+
+    **Paramètres** :
+        - `triangles` (array-like) : Triangles (N, 3, 3) (sortie de `Load_Triangles`), l'axe du lanceur
+          étant la première coordonnée.
+        - `axis_center` (tuple, optionnel) : Position (Y, X) de l'axe du lanceur. Par défaut, centre de la boîte englobante.
+        - `n_bins` (int, optionnel) : Nombre de casiers des index. Par défaut, étendue totale / étendue médiane d'un triangle.
+
+    **Retourne** :
+        - `slice_index` (dict) : "TRIANGLES", "CENTRE", "Y" (index des plans parallèles) et "ANGLE" (index des plans méridiens).
+    """
+    triangles = np.asarray(triangles, dtype=float)
+
+    if axis_center is None:
+        points = triangles.reshape(-1, 3)
+        axis_center = 0.5 * (points[:, 1:].min(axis=0) + points[:, 1:].max(axis=0))
+    center = np.asarray(axis_center, dtype=float)
+
+    # --> plans Y = cste : étendue en Y de chaque triangle
+    y_lo, y_hi = triangles[..., 1].min(axis=1), triangles[..., 1].max(axis=1)
+    y_min, y_max = (y_lo.min(), y_hi.max()) if len(triangles) else (0.0, 0.0)
+    y_bins = _bin_count(y_hi - y_lo, y_max - y_min, len(triangles)) if n_bins is None else n_bins
+
+    # --> plans méridiens : étendue angulaire (modulo π) des arêtes
+    a_lo, a_hi, a_owner = _edge_angles(triangles, center)
+    a_bins = _bin_count(a_hi - a_lo, np.pi, len(a_lo)) if n_bins is None else n_bins
+
+    slice_index = {
+        "TRIANGLES": triangles,
+        "CENTRE": center,
+        "Y": _interval_index(y_lo, y_hi, np.arange(len(triangles)), y_min, y_max, y_bins),
+        "ANGLE": _interval_index(a_lo, a_hi, a_owner, 0.0, np.pi, a_bins),
+    }
+
+    return slice_index
+
+    # ========================================== #
+    # ========== COUPES ======================== #
+    # ========================================== #
+
+def _slice_plane(triangles, normal, offset, radial, origin):
+    """
+    Coupe des triangles candidats par le plan normal·p = offset ; points exprimés en (radial·(p - origin), hauteur).
+    """
+    s = triangles @ normal - offset
+    s_next = np.roll(s, -1, axis=1)
+
+    crossing = ((s < 0) & (s_next > 0)) | ((s > 0) & (s_next < 0))
+    cut = crossing.sum(axis=1) == 2
+
+    p1 = triangles[cut]
+    p2 = np.roll(p1, -1, axis=1)
+    s1, s2, crossing = s[cut], s_next[cut], crossing[cut]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        points = p1 + (s1 / (s1 - s2))[..., np.newaxis] * (p2 - p1)
+
+    edges = np.argsort(~crossing, axis=1, kind="stable")[:, :2]
+    points = np.take_along_axis(points, edges[..., np.newaxis], axis=1)
+
+    return np.stack([(points - origin) @ radial, points[..., 0]], axis=-1)
+
+def Slice_Planes(slice_index, Y_FIXES=(), angles=()):
+    """
+    Coupe un maillage indexé par plusieurs plans en une passe : plans Y = cste et plans méridiens tournés autour de l'axe.
+
+    **Paramètres** :
+        - `slice_index` (dict) : Sortie de `Build_SliceIndex`.
+        - `Y_FIXES` (array-like, optionnel) : Valeurs de Y des plans parallèles.
+        - `angles` (array-like, optionnel) : Angles (rad) des plans méridiens, mesurés depuis le plan Y = Y_axe
+          autour de l'axe du lanceur.
+
+    **Retourne** :
+        - `cuts` (dict) :
+            - "Y" : liste de tableaux (M, 2, 2) de segments, un par plan Y, points (X, Z) comme `Slice_Triangles`.
+            - "ANGLE" : liste de tableaux (M, 2, 2) de segments, un par plan méridien, points (distance signée
+              à l'axe dans le plan, hauteur).
+
+    **Remarque** :
+        - Chaque plan ne teste que les triangles de son casier (ceux dont l'étendue recouvre le plan),
+          et non l'ensemble du maillage.
+        - Comme `Slice_Triangles`, une arête est coupée si ses extrémités sont strictement de part et d'autre
+          du plan, et un segment est enregistré pour chaque triangle coupé en exactement deux points.
+    """
+    triangles, center = slice_index["TRIANGLES"], slice_index["CENTRE"]
+    height = np.array([1.0, 0.0, 0.0])
+
+    cuts = {"Y": [], "ANGLE": []}
+
+    for Y_FIXE in np.atleast_1d(np.asarray(Y_FIXES, dtype=float)):
+        candidates = triangles[_query_index(slice_index["Y"], Y_FIXE)]
+        cuts["Y"].append(_slice_plane(candidates, np.array([0.0, 1.0, 0.0]), Y_FIXE, np.array([0.0, 0.0, 1.0]), np.zeros(3)))
+
+    for angle in np.atleast_1d(np.asarray(angles, dtype=float)):
+        normal = np.array([0.0, np.cos(angle), np.sin(angle)])
+        origin = np.array([0.0, center[0], center[1]])
+
+        # --> le plan de normale d'angle φ contient les directions φ ± π/2
+        candidates = triangles[_query_index(slice_index["ANGLE"], angle + 0.5 * np.pi, tol=ANGLE_TOL, period=np.pi)]
+        cuts["ANGLE"].append(_slice_plane(candidates, normal, normal @ origin, np.cross(height, normal), origin))
+
+    return cuts
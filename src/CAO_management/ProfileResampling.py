@@ -0,0 +1,202 @@
+import numpy as np
+
+# angle de virage (rad) au-delà duquel un sommet est traité comme une discontinuité de pente (conservé tel quel et
+# limite de section du profil de sortie) ; même seuil que `SECTION_ANGLE` pour les profils de CAO
+CORNER_ANGLE = np.deg2rad(15.0)
+
+# rapport maximal entre deux panneaux voisins en s'éloignant d'un point conservé (extrémité de section ou coin)
+GROWTH_RATIO = 1.1
+
+    # ========================================== #
+    # ========== DENSITÉ DE POINTS ============= #
+    # ========================================== #
+
+def _split_sections(x_shape, y_faces, section_idx):
+    """
+    Coupe les sections aux panneaux de longueur nulle (sommet répété, par exemple aux raccords de `Get_2D_vectors`,
+    à l'arrondi près) et écarte les sections de moins de deux points.
+    """
+    zero_length = 1e-9 * max(np.ptp(x_shape), 1.0)
+
+    sections = []
+    for start, stop in section_idx:
+        dy = np.nanmax(np.abs(np.diff(y_faces[:, start:stop], axis=1)), axis=0, initial=0.0)
+        zero = np.hypot(np.diff(x_shape[start:stop]), dy) <= zero_length
+        bounds = np.concatenate([[start], start + np.flatnonzero(zero) + 1, [stop]])
+        sections += [(int(i0), int(i1)) for i0, i1 in zip(bounds[:-1], bounds[1:]) if i1 - i0 >= 2]
+
+    return sections
+
+def _face_curvature(x, y, corner_angle):
+    """
+    Courbure discrète aux sommets d'une face (angle de virage rapporté à la longueur moyenne des arêtes voisines).
+    Les sommets dont l'angle de virage dépasse `corner_angle` sont des coins : leur courbure est mise à zéro.
+    """
+    dx, dy = np.diff(x), np.diff(y)
+    length = np.hypot(dx, dy)
+
+    phi = np.arctan2(dy, dx)
+    turn = np.abs((np.diff(phi) + np.pi) % (2 * np.pi) - np.pi)
+
+    corner = np.zeros(shape=len(x), dtype=bool)
+    corner[1:-1] = turn > corner_angle
+
+    kappa = np.zeros(shape=len(x))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa[1:-1] = np.where(corner[1:-1], 0.0, turn / (0.5 * (length[:-1] + length[1:])))
+
+    return length, np.nan_to_num(kappa), corner
+
+def _pieces(x_shape, y_faces, section_idx, corner_angle, max_step, growth):
+    """
+    Découpe chaque section en morceaux sans coin (sections du profil de sortie) et calcule, aux sommets d'entrée
+    de chaque morceau, la densité de courbure (√(κ/8), à multiplier par le facteur d'échelle) et la densité
+    minimale (gradation depuis les extrémités du morceau et pas maximal).
+    """
+    pieces = []
+    for start, stop in section_idx:
+        x = x_shape[start:stop]
+        lengths, kappas, corners = zip(*[_face_curvature(x, y[start:stop], corner_angle) for y in y_faces])
+
+        length = np.nan_to_num(np.nanmax(lengths, axis=0))
+        kappa = np.max(kappas, axis=0)
+
+        breaks = np.unique(np.concatenate([[0, len(x) - 1], np.flatnonzero(np.any(corners, axis=0))]))
+
+        for i0, i1 in zip(breaks[:-1], breaks[1:]):
+            l = length[i0:i1]
+            s = np.concatenate([[0.0], np.cumsum(l)])
+
+            # --> espacement maximal autorisé : croissance géométrique depuis le pas d'entrée aux deux extrémités
+            #     (borné loin de zéro pour un panneau d'extrémité dégénéré)
+            h_end = np.minimum(l[0] + (growth - 1) * s, l[-1] + (growth - 1) * (s[-1] - s))
+            d_min = 1.0 / np.maximum(h_end, np.finfo(float).eps * max(s[-1], 1.0))
+            if max_step is not None:
+                d_min = np.maximum(d_min, 1.0 / max_step)
+
+            pieces.append((start + i0, start + i1, l, np.sqrt(kappa[i0:i1 + 1] / 8), d_min))
+
+    return pieces
+
+def _cumulative(piece, scale):
+    """
+    Nombre cumulé de panneaux le long d'un morceau (intégrale de la densité par la méthode des trapèzes).
+    """
+    _, _, l, d_curv, d_min = piece
+    density = np.maximum(scale * d_curv, d_min)
+
+    return np.concatenate([[0.0], np.cumsum(0.5 * (density[:-1] + density[1:]) * l)])
+
+def _n_panels(piece, scale):
+    """
+    Nombre de panneaux d'un morceau, au plus celui du profil d'entrée (atteint pour un facteur d'échelle infini).
+    """
+    if np.isinf(scale):
+        return piece[1] - piece[0]
+
+    return min(piece[1] - piece[0], max(1, int(np.ceil(_cumulative(piece, scale)[-1] - 1e-9))))
+
+def _n_points(pieces, scale):
+    return sum(1 + _n_panels(piece, scale) for piece in pieces)
+
+    # ========================================== #
+    # ========== RÉÉCHANTILLONNAGE ============= #
+    # ========================================== #
+
+def Resample_Profile(x_shape, y_upper_, y_lower_, tol=None, n_points=None, section_idx=None, max_step=None,
+                     growth=GROWTH_RATIO, corner_angle=CORNER_ANGLE):
+    """
+    Rééchantillonne un profil 2D en répartissant les points selon la courbure locale et les discontinuités de pente.
+
+    **Paramètres** :
+        - `x_shape`, `y_upper_`, `y_lower_` (array-like) : Profil d'entrée (sortie de `Get_2D_vectors` ou de
+          `Get_2D_vectors_From_Segments`).
+        - `tol` (float, optionnel) : Écart maximal visé (m) entre la corde d'un panneau et le profil d'entrée.
+        - `n_points` (int, optionnel) : Budget de points du profil de sortie (utilisé si `tol` n'est pas donné).
+        - `section_idx` (array-like, optionnel) : Couples (début, fin) des sections du profil d'entrée. Si None,
+          les sections sont déduites des sommets répétés (panneaux de longueur nulle) et des coins.
+        - `max_step` (float, optionnel) : Longueur maximale d'un panneau (m).
+        - `growth` (float, optionnel) : Rapport de croissance des panneaux en s'éloignant d'une extrémité de
+          section ou d'un coin, `GROWTH_RATIO` par défaut.
+        - `corner_angle` (float, optionnel) : Angle de virage (rad) au-delà duquel un sommet est une discontinuité
+          de pente, `CORNER_ANGLE` par défaut.
+
+    **Conditions et gestion des erreurs** :
+        - Lève une `ValueError` si ni `tol` ni `n_points` (ou les deux) ne sont donnés.
+        - Lève une `ValueError` si `n_points` est inférieur au nombre minimal de points (gradation et `max_step`).
+
+    **Retourne** :
+        - `tuple` : (x_shape, y_upper_, y_lower_, section_idx) du profil rééchantillonné, `section_idx` donnant ses
+          sections : une par morceau entre deux points conservés, le point de raccord étant répété.
+
+    **Remarque** :
+        - Les extrémités des sections et les coins (raccords coiffe / fuselage, transition, pente, arêtes d'un
+          profil de CAO) sont conservés exactement et deviennent des limites de section du profil de sortie. Les
+          panneaux de longueur nulle séparent deux sections.
+        - Entre deux, l'espacement local est le plus petit de :
+            - h = √(8 tol / κ), qui borne l'écart corde / profil à `tol` ;
+            - `max_step` ;
+            - le pas d'entrée au point conservé le plus proche, multiplié par `growth` à chaque panneau.
+        - La gradation conserve le pas d'entrée aux extrémités des sections : les intégrales de la chaîne
+          aérodynamique (sommes par point pondérées par `np.gradient`) y sont sensibles, en particulier aux
+          raccords où l'angle de déviation du point de raccord est hérité de la section précédente.
+        - Avec un budget `n_points`, le facteur d'échelle de la courbure est ajusté par dichotomie pour ne pas
+          dépasser le budget.
+        - Les nouveaux points sont interpolés linéairement le long du profil d'entrée. Un morceau n'a jamais plus
+          de panneaux que dans le profil d'entrée : s'il en faudrait autant, ses sommets d'entrée sont conservés
+          tels quels (cas des profils de CAO à facettes, déjà limités par le maillage).
+    """
+    if (tol is None) == (n_points is None):
+        raise ValueError("Donner exactement un critère : `tol` ou `n_points`.")
+
+    x_shape = np.asarray(x_shape, dtype=float)
+    y_faces = np.stack([np.asarray(y_upper_, dtype=float), np.asarray(y_lower_, dtype=float)])
+    section_idx = [(0, x_shape.size)] if section_idx is None else [tuple(idx) for idx in section_idx]
+    section_idx = _split_sections(x_shape, y_faces, section_idx)
+
+    pieces = _pieces(x_shape, y_faces, section_idx, corner_angle, max_step, growth)
+
+    if tol is not None:
+        scale = 1.0 / np.sqrt(tol)
+    elif _n_points(pieces, 0.0) > n_points:
+        raise ValueError(f"Budget insuffisant : au moins {_n_points(pieces, 0.0)} points sont nécessaires.")
+    elif _n_points(pieces, np.inf) <= n_points:
+        # --> budget suffisant pour conserver tous les sommets d'entrée
+        scale = np.inf
+    else:
+        # --> dichotomie sur le facteur d'échelle (nombre de points croissant avec l'échelle)
+        lo, hi = 0.0, 1.0
+        while _n_points(pieces, hi) <= n_points:
+            lo, hi = hi, 2 * hi
+        for _ in range(50):
+            mid = 0.5 * (lo + hi)
+            lo, hi = (mid, hi) if _n_points(pieces, mid) <= n_points else (lo, mid)
+        scale = lo
+
+    index = np.arange(x_shape.size)
+
+    t_out, new_idx = [], []
+    for piece in pieces:
+        # --> indices fractionnaires du profil d'entrée, équirépartis en nombre cumulé de panneaux dans le morceau
+        i0, i1 = piece[0], piece[1]
+        m = _n_panels(piece, scale)
+
+        if m == i1 - i0:
+            # --> morceau déjà assez fin : sommets d'entrée conservés tels quels
+            frac = np.arange(i0 + 1, i1 + 1, dtype=float)
+        else:
+            cum = _cumulative(piece, scale)
+            frac = np.interp(cum[-1] * np.arange(1, m + 1) / m, cum, np.arange(i0, i1 + 1))
+            frac[-1] = i1
+
+        offset = sum(len(t_sec) for t_sec in t_out)
+        t_out.append(np.concatenate([[float(i0)], frac]))
+        new_idx.append((offset, offset + int(m) + 1))
+
+    t = np.concatenate(t_out)
+
+    # --> interpolation le long du profil d'entrée (indices entiers aux extrémités des morceaux)
+    x_new = np.interp(t, index, x_shape)
+    y_upper_new, y_lower_new = [np.interp(t, index, y) for y in y_faces]
+
+    return x_new, y_upper_new, y_lower_new, new_idx
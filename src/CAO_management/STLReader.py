@@ -0,0 +1,124 @@
+import os
+import numpy as np
+
+# enregistrement d'un triangle dans un fichier STL binaire (50 octets, petit-boutiste)
+STL_DTYPE = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+
+STL_HEADER_SIZE = 80
+
+def Is_Binary_STL(stl_file: str):
+    """
+    Indique si un fichier STL est binaire : sa taille doit valoir exactement 84 + 50 × (nombre de triangles annoncé).
+
+    **Remarque** :
+        - Certains fichiers binaires commencent par "solid" : le test ne repose donc pas sur l'en-tête.
+    """
+    size = os.path.getsize(stl_file)
+    if size < STL_HEADER_SIZE + 4:
+        return False
+
+    with open(stl_file, "rb") as file:
+        file.seek(STL_HEADER_SIZE)
+        n_triangles = int(np.frombuffer(file.read(4), dtype="<u4")[0])
+
+    return size == STL_HEADER_SIZE + 4 + n_triangles * STL_DTYPE.itemsize
+
+def _read_ascii_stl(stl_file: str):
+    """
+    Lecture d'un fichier STL ASCII : les mots du fichier sont découpés en une fois et les coordonnées
+    suivant les mots-clés "normal" et "vertex" sont converties en bloc.
+    """
+    with open(stl_file, "rb") as file:
+        words = np.array(file.read().split())
+
+    n_idx = np.flatnonzero(words == b"normal")
+    v_idx = np.flatnonzero(words == b"vertex")
+
+    if len(v_idx) != 3 * len(n_idx):
+        raise ValueError(f"Fichier STL ASCII invalide : {stl_file}")
+
+    normals = words[n_idx[:, np.newaxis] + np.arange(1, 4)].astype(np.float32)
+    vertices = words[v_idx[:, np.newaxis] + np.arange(1, 4)].astype(np.float32).reshape(-1, 3, 3)
+
+    return normals, vertices, np.zeros(shape=len(n_idx), dtype=np.uint16)
+
+def Read_STL(stl_file: str):
+    """
+    Lit un fichier STL (binaire ou ASCII) sans passer par un fichier CSV intermédiaire.
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier STL.
+
+    **Retourne** :
+        - `stl_data` (dict) :
+            - "NORMALES" : Normales enregistrées dans le fichier, tableau (N, 3) en float32.
+            - "SOMMETS" : Sommets des triangles, tableau (N, 3, 3) en float32.
+            - "ATTRIBUTS" : Champ d'attribut de chaque triangle (N,) (nul en ASCII).
+            - "BINAIRE" : True si le fichier est binaire.
+
+    **Conditions et gestion des erreurs** :
+        - Lève une `FileNotFoundError` si le fichier STL est introuvable.
+        - Lève une `ValueError` si un fichier ASCII est mal formé.
+
+    **Remarque** :
+        - Un fichier binaire est ouvert avec `np.memmap` et un type structuré (`STL_DTYPE`) : les tableaux
+          retournés sont des vues en lecture seule sur le fichier, sans copie ni lecture préalable.
+        - Un fichier ASCII est analysé en mémoire (lecture complète, conversion vectorisée).
+    """
+    if not os.path.exists(stl_file):
+        raise FileNotFoundError(f"Le fichier STL n'existe pas : {stl_file}")
+
+    if Is_Binary_STL(stl_file):
+        with open(stl_file, "rb") as file:
+            file.seek(STL_HEADER_SIZE)
+            n_triangles = int(np.frombuffer(file.read(4), dtype="<u4")[0])
+
+        if n_triangles == 0:
+            records = np.zeros(shape=0, dtype=STL_DTYPE)
+        else:
+            records = np.memmap(stl_file, dtype=STL_DTYPE, mode="r", offset=STL_HEADER_SIZE + 4, shape=(n_triangles,))
+
+        return {"NORMALES": records["normal"], "SOMMETS": records["vertices"], "ATTRIBUTS": records["attribute"], "BINAIRE": True}
+
+    normals, vertices, attributes = _read_ascii_stl(stl_file)
+
+    return {"NORMALES": normals, "SOMMETS": vertices, "ATTRIBUTS": attributes, "BINAIRE": False}
+
+def Compute_Normals(vertices):
+    """
+    Calcule les normales (non normalisées) des triangles : (S2 - S1) × (S3 - S1), comme numpy-stl.
+
+    **Paramètres** :
+        - `vertices` (array-like) : Sommets (N, 3, 3).
+
+    **Retourne** :
+        - `numpy.ndarray` : Normales (N, 3).
+    """
+    vertices = np.asarray(vertices)
+
+    return np.cross(vertices[:, 1] - vertices[:, 0], vertices[:, 2] - vertices[:, 0])
+
+def Write_Binary_STL(stl_file: str, vertices, normals=None, header: bytes = b""):
+    """
+    Écrit un fichier STL binaire (en un seul bloc) à partir de sommets (N, 3, 3).
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier de sortie.
+        - `vertices` (array-like) : Sommets (N, 3, 3).
+        - `normals` (array-like, optionnel) : Normales (N, 3). Par défaut `Compute_Normals`.
+        - `header` (bytes, optionnel) : En-tête (80 octets au plus).
+    """
+    vertices = np.asarray(vertices, dtype=np.float32)
+
+    records = np.zeros(shape=len(vertices), dtype=STL_DTYPE)
+    records["vertices"] = vertices
+    records["normal"] = Compute_Normals(vertices) if normals is None else normals
+
+    with open(stl_file, "wb") as file:
+        file.write(header[:STL_HEADER_SIZE].ljust(STL_HEADER_SIZE, b"\0"))
+        file.write(np.uint32(len(records)).astype("<u4").tobytes())
+        records.tofile(file)
@@ -1,18 +1,93 @@
-from stl import mesh
-import csv
+import numpy as np
 import os
 
+from CAO_management.STLReader import Read_STL, Compute_Normals
 
-def Get_CSV(stl_name: str, csv_name: str):
+STL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "STL_files")
+CSV_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "CSV_files")
+
+CSV_HEADER = ["Normale X", "Normale Y", "Normale Z",
+              "S1 X", "S1 Y", "S1 Z",
+              "S2 X", "S2 Y", "S2 Z",
+              "S3 X", "S3 Y", "S3 Z"]
+
+def Get_STL_Array(stl_file: str):
+    """
+    Charge un fichier STL sous la forme d'un unique tableau contigu (une ligne par triangle).
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier STL.
+
+    **Retourne** :
+        - `np.ndarray` : Tableau (N, 12) en float32, colonnes dans l'ordre de `CSV_HEADER`
+          (normale, puis les trois sommets).
+
+    **Conditions et gestion des erreurs** :
+        - Lève une `FileNotFoundError` si le fichier STL est introuvable.
+
+    **Remarque** :
+        - Lecture par `Read_STL` (sans numpy-stl). Les normales sont recalculées à partir des sommets
+          (`Compute_Normals`, non normalisées), comme le faisait numpy-stl à l'ouverture d'un fichier.
+    """
+    vertices = Read_STL(stl_file)["SOMMETS"]
+    n_triangles = len(vertices)
+
+    # --> normales et sommets copiés en bloc dans un seul tableau (N, 12)
+    stl_array = np.empty(shape=(n_triangles, 12), dtype=np.float32)
+    stl_array[:, :3] = Compute_Normals(vertices)
+    stl_array[:, 3:] = vertices.reshape(n_triangles, 9)
+
+    return stl_array
+
+def Get_NPY(stl_file: str, npy_file: str):
+    """
+    Convertit un fichier STL en fichier `.npy` binaire contenant les normales et les sommets des triangles.
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier STL à convertir.
+        - `npy_file` (str) : Chemin du fichier `.npy` de sortie (le dossier est créé si nécessaire).
+
+    **Structure du fichier généré** :
+        - Tableau (N, 12) en float32, colonnes dans l'ordre de `CSV_HEADER`.
+        - Relecture sans copie avec `np.load(npy_file, mmap_mode="r")` (voir `Load_NPY`).
+
+    **Retourne** :
+        - `str` : Chemin du fichier `.npy` généré.
+    """
+    stl_array = Get_STL_Array(stl_file)
+
+    os.makedirs(os.path.dirname(os.path.abspath(npy_file)), exist_ok=True)
+    np.save(npy_file, stl_array)
+
+    return npy_file
+
+def Load_NPY(npy_file: str, mmap_mode="r"):
+    """
+    Relit un fichier produit par `Get_NPY`.
+
+    **Paramètres** :
+        - `npy_file` (str) : Chemin du fichier `.npy`.
+        - `mmap_mode` (str, optionnel) : Mode d'ouverture (voir `np.load`), "r" par défaut.
+
+    **Retourne** :
+        - `tuple` : (normals, vertices), vues de forme (N, 3) et (N, 3, 3) sur le fichier.
+    """
+    stl_array = np.load(npy_file, mmap_mode=mmap_mode)
+
+    return stl_array[:, :3], stl_array[:, 3:].reshape(-1, 3, 3)
+
+def Get_CSV(stl_name: str, csv_name: str, stl_dir: str = None, csv_dir: str = None):
     """
     Convertit un fichier STL en fichier CSV contenant les informations des triangles du maillage.
 
-    Cette fonction prend un fichier STL en entrée, extrait les normales et les sommets de chaque triangle 
+    Cette fonction prend un fichier STL en entrée, extrait les normales et les sommets de chaque triangle
     composant le maillage, puis enregistre ces informations dans un fichier CSV.
 
     **Paramètres** :
-        - `stl_name` (str) : Nom du fichier STL à convertir (doit être présent dans `docs/STL_files`).
-        - `csv_name` (str) : Nom du fichier CSV de sortie (enregistré dans `docs/CSV_files`).
+        - `stl_name` (str) : Nom du fichier STL à convertir.
+        - `csv_name` (str) : Nom du fichier CSV de sortie.
+        - `stl_dir` (str, optionnel) : Dossier du fichier STL, `docs/STL_files` par défaut.
+        - `csv_dir` (str, optionnel) : Dossier du fichier CSV, `docs/CSV_files` par défaut.
 
     **Structure du fichier CSV généré** :
         - Colonne "Normale X, Normale Y, Normale Z" : Composantes du vecteur normal du triangle.
@@ -26,34 +101,20 @@ def Get_CSV(stl_name: str, csv_name: str):
 
     **Retourne** :
         - `str` : Chemin du fichier CSV généré.
+
+    **Remarque** :
+        - Les dossiers par défaut sont définis par rapport à ce module (et non au dossier courant).
+        - Le fichier est écrit en un seul appel à `np.savetxt` (9 chiffres significatifs, sans perte en float32) ;
+          pour les gros maillages, préférer `Get_NPY`.
     """
-    
-    current_dir = os.getcwd()
-    stl_dir = os.path.join(current_dir, "..\docs", "STL_files")
-    stl_file = os.path.join(stl_dir, stl_name)
-
-    if not os.path.exists(stl_file):
-        raise FileNotFoundError(f"Le fichier STL n'existe pas : {stl_file}")
-
-    mesh_data = mesh.Mesh.from_file(stl_file)
-
-    csv_dir = os.path.join(current_dir, "../docs", "CSV_files")
-    csv_file = os.path.join(csv_dir, csv_name)
-
-    with open(csv_file, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(["Normale X", "Normale Y", "Normale Z", 
-                        "S1 X", "S1 Y", "S1 Z",
-                        "S2 X", "S2 Y", "S2 Z",
-                        "S3 X", "S3 Y", "S3 Z"])
-        
-        for i in range(len(mesh_data.normals)):
-            normale = mesh_data.normals[i]
-            sommet1 = mesh_data.vectors[i][0]
-            sommet2 = mesh_data.vectors[i][1]
-            sommet3 = mesh_data.vectors[i][2]
-            writer.writerow([*normale, *sommet1, *sommet2, *sommet3])
-            
+    stl_file = os.path.join(STL_DIR if stl_dir is None else stl_dir, stl_name)
+    csv_file = os.path.join(CSV_DIR if csv_dir is None else csv_dir, csv_name)
+
+    stl_array = Get_STL_Array(stl_file)
+
+    os.makedirs(os.path.dirname(os.path.abspath(csv_file)), exist_ok=True)
+    np.savetxt(csv_file, stl_array, fmt="%.9g", delimiter=",", header=",".join(CSV_HEADER), comments="")
+
     print(f"Conversion terminée ! Fichier enregistré sous {csv_file}")
 
-    return csv_file
\ No newline at end of file
+    return csv_file
@@ -0,0 +1,214 @@
+import numpy as np
+
+# pas de quantification (m) des extrémités de segments : deux extrémités tombant dans la même cellule sont soudées
+WELD_TOL = 1e-6
+
+# écart minimal (m) entre deux hauteurs du profil 2D : les sommets plus proches sont confondus (pas de micro-panneau)
+HEIGHT_TOL = 1e-3
+
+# angle de virage (rad) au-delà duquel un sommet du profil 2D est une discontinuité de pente (limite de section)
+SECTION_ANGLE = np.deg2rad(15.0)
+
+    # ========================================== #
+    # ========== SOUDURE DES EXTRÉMITÉS ======== #
+    # ========================================== #
+
+def _weld(points, tol):
+    """
+    Soude des points par hachage de leurs coordonnées quantifiées (tri des clés entières, O(n log n)).
+    Retourne les nœuds (points moyens de chaque cellule) et l'indice du nœud de chaque point.
+    """
+    keys = np.floor(points / tol + 0.5).astype(np.int64)
+    _, node_id, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+    node_id = node_id.ravel()
+
+    nodes = np.zeros(shape=(len(counts), points.shape[1]))
+    np.add.at(nodes, node_id, points)
+
+    return nodes / counts[:, np.newaxis], node_id
+
+def _graph_edges(segments, tol):
+    """
+    Arêtes (i, j) du graphe des segments soudés, sans segment dégénéré (longueur nulle) ni doublon.
+    """
+    nodes, node_id = _weld(np.asarray(segments, dtype=float).reshape(-1, 2), tol)
+
+    edges = node_id.reshape(-1, 2)
+    edges = np.unique(np.sort(edges[edges[:, 0] != edges[:, 1]], axis=1), axis=0)
+
+    return nodes, edges
+
+    # ========================================== #
+    # ========== CHAÎNAGE ====================== #
+    # ========================================== #
+
+def Stitch_Segments(segments, tol: float = WELD_TOL):
+    """
+    Chaîne des segments donnés dans un ordre quelconque (sortie de `Slice_Triangles` ou de `Slice_Planes`) en polylignes ordonnées.
+
+    **Paramètres** :
+        - `segments` (array-like) : Segments (M, 2, 2).
+        - `tol` (float, optionnel) : Pas de quantification des extrémités (m), `WELD_TOL` par défaut.
+
+    **Traitements effectués** :
+        1. **Soudure des extrémités** : coordonnées quantifiées au pas `tol` puis regroupées par tri des clés.
+        2. **Nettoyage** : suppression des segments de longueur nulle et des segments en double
+           (arête commune à deux triangles coupés dans le plan).
+        3. **Chaînage** : parcours du graphe d'adjacence (format CSR) depuis les extrémités libres et les
+           jonctions (degré ≠ 2), puis des cycles restants.
+
+    **Retourne** :
+        - `polylines` (list) : Liste de tableaux (K, 2) de points ordonnés ; une polyligne fermée répète son premier point.
+
+    **Remarque** :
+        - Deux extrémités distantes de moins de `tol` mais situées de part et d'autre d'une limite de cellule ne
+          sont pas soudées : `tol` doit rester grand devant le bruit d'arrondi et petit devant les arêtes du maillage.
+    """
+    nodes, edges = _graph_edges(segments, tol)
+
+    # --> adjacence en CSR : demi-arêtes triées par nœud de départ
+    src = np.concatenate([edges[:, 0], edges[:, 1]])
+    dst = np.concatenate([edges[:, 1], edges[:, 0]])
+    edge_of = np.concatenate([np.arange(len(edges)), np.arange(len(edges))])
+
+    order = np.argsort(src, kind="stable")
+    dst, edge_of = dst[order], edge_of[order]
+    ptr = np.searchsorted(src[order], np.arange(len(nodes) + 1))
+    degree = np.diff(ptr)
+
+    used = np.zeros(shape=len(edges), dtype=bool)
+    cursor = ptr[:-1].copy()
+
+    def walk(start):
+        chain = [start]
+        node = start
+        while True:
+            # --> prochaine demi-arête non parcourue du nœud courant
+            while cursor[node] < ptr[node + 1] and used[edge_of[cursor[node]]]:
+                cursor[node] += 1
+            if cursor[node] == ptr[node + 1]:
+                return chain
+            used[edge_of[cursor[node]]] = True
+            node = dst[cursor[node]]
+            chain.append(node)
+            if degree[node] != 2:
+                return chain
+
+    polylines = []
+
+    for start in np.flatnonzero(degree != 2):
+        while cursor[start] < ptr[start + 1]:
+            chain = walk(start)
+            if len(chain) > 1:
+                polylines.append(nodes[chain])
+
+    # --> cycles (tous les nœuds de degré 2)
+    for start in np.flatnonzero(degree == 2):
+        chain = walk(start)
+        if len(chain) > 1:
+            polylines.append(nodes[chain])
+
+    return polylines
+
+    # ========================================== #
+    # ========== PROFIL 2D ===================== #
+    # ========================================== #
+
+def _slope_breaks(x, y_faces, corner_angle):
+    """
+    Indices des sommets intérieurs dont l'angle de virage dépasse `corner_angle` sur l'une des faces.
+    """
+    corner = np.zeros(shape=len(x), dtype=bool)
+    for y in y_faces:
+        phi = np.arctan2(np.diff(y), np.diff(x))
+        turn = np.abs((np.diff(phi) + np.pi) % (2 * np.pi) - np.pi)
+        corner[1:-1] |= np.nan_to_num(turn) > corner_angle
+
+    return np.flatnonzero(corner)
+
+def Get_2D_vectors_From_Segments(segments, tol: float = WELD_TOL, axis: float = None, height_tol: float = HEIGHT_TOL,
+                                 corner_angle: float = SECTION_ANGLE):
+    """
+    Construit un profil 2D exploitable par la chaîne aérodynamique à partir d'une coupe de CAO.
+
+    **Paramètres** :
+        - `segments` (array-like) : Segments (M, 2, 2) d'une coupe passant par l'axe du lanceur, points
+          (coordonnée radiale, hauteur) comme `Slice_Triangles`.
+        - `tol` (float, optionnel) : Pas de soudure des extrémités (voir `Stitch_Segments`).
+        - `axis` (float, optionnel) : Position de l'axe du lanceur sur la coordonnée radiale.
+          Par défaut, milieu de l'étendue radiale de la coupe.
+        - `height_tol` (float, optionnel) : Écart minimal entre deux hauteurs du profil (m), `HEIGHT_TOL` par défaut.
+        - `corner_angle` (float, optionnel) : Angle de virage (rad) au-delà duquel un sommet sépare deux sections,
+          `SECTION_ANGLE` par défaut.
+
+    **Traitements effectués** :
+        1. **Chaînage** des segments en polylignes (`Stitch_Segments`).
+        2. **Hauteurs du profil** : hauteurs triées de tous les sommets des polylignes, les hauteurs distantes
+           de moins de `height_tol` étant confondues.
+        3. **Enveloppe extérieure** : à chaque hauteur, distance à l'axe maximale (face supérieure) et minimale
+           (face inférieure) sur toutes les arêtes qui la recouvrent (interpolation linéaire le long de l'arête).
+        4. **Sections** : le profil est coupé aux discontinuités de pente (virage supérieur à `corner_angle` sur
+           l'une des faces), le sommet de raccord étant répété en fin et en début de section comme dans `Get_2D_vectors`.
+
+    **Retourne** :
+        - `tuple` : (x_shape, y_upper_, y_lower_, section_idx), même format que `Get_2D_vectors` et `SECTION_IDX` :
+          hauteur depuis la pointe (croissante), ordonnées des faces supérieure et inférieure et couples (début, fin)
+          des sections.
+
+    **Remarque** :
+        - Les parois intérieures (jonctions, fonds, corps secondaires masqués) sont éliminées par l'enveloppe.
+        - Les changements de corps de l'enveloppe (par exemple à la jonction coiffe des boosters / corps central)
+          tombent entre deux sommets : ils sont représentés par la corde entre ces sommets.
+        - Les facettes d'une surface courbe (virages de quelques degrés) restent dans la même section ; les arêtes
+          vives (culot, tuyères, raccords de corps) séparent les sections, ce qui évite d'étendre la pente d'un
+          panneau court à un panneau long voisin dans les sommes de la chaîne aérodynamique.
+        - Une hauteur sans aucune géométrie (corps disjoints le long de l'axe) donne NaN.
+    """
+    polylines = Stitch_Segments(segments, tol)
+
+    points = np.concatenate(polylines)
+    heights = np.unique(points[:, 1])
+    heights = heights[np.concatenate([[True], np.diff(heights) > height_tol])]
+    axis = 0.5 * (points[:, 0].min() + points[:, 0].max()) if axis is None else axis
+
+    # --> arêtes des polylignes, orientées par hauteur croissante
+    p1 = np.concatenate([line[:-1] for line in polylines])
+    p2 = np.concatenate([line[1:] for line in polylines])
+    swap = p1[:, 1] > p2[:, 1]
+    p1[swap], p2[swap] = p2[swap], p1[swap].copy()
+
+    # --> couples (arête, hauteur recouverte), interpolation radiale le long de chaque arête
+    i_lo = np.searchsorted(heights, p1[:, 1] - height_tol, side="left")
+    i_hi = np.searchsorted(heights, p2[:, 1] + height_tol, side="right")
+    counts = i_hi - i_lo
+
+    edge = np.repeat(np.arange(len(p1)), counts)
+    idx = np.repeat(i_lo, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+
+    dh = p2[edge, 1] - p1[edge, 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(dh > 0, np.clip((heights[idx] - p1[edge, 1]) / dh, 0.0, 1.0), 0.0)
+    r = p1[edge, 0] + t * (p2[edge, 0] - p1[edge, 0]) - axis
+
+    # --> arête à hauteur constante (à `height_tol` près) : ses deux extrémités comptent à cette hauteur
+    flat = dh <= height_tol
+    idx = np.concatenate([idx, idx[flat]])
+    r = np.concatenate([r, p2[edge[flat], 0] - axis])
+
+    y_upper_ = np.full(shape=len(heights), fill_value=-np.inf)
+    y_lower_ = np.full(shape=len(heights), fill_value=np.inf)
+    np.maximum.at(y_upper_, idx, r)
+    np.minimum.at(y_lower_, idx, r)
+
+    y_upper_[np.isinf(y_upper_)] = np.nan
+    y_lower_[np.isinf(y_lower_)] = np.nan
+
+    x_shape = heights - heights[0]
+
+    # --> sections entre discontinuités de pente (sommet de raccord répété)
+    breaks = np.concatenate([[0], _slope_breaks(x_shape, [y_upper_, y_lower_], corner_angle), [len(x_shape) - 1]])
+    keep = np.concatenate([np.arange(i0, i1 + 1) for i0, i1 in zip(breaks[:-1], breaks[1:])])
+    bounds = np.cumsum(np.concatenate([[0], np.diff(breaks) + 1]))
+    section_idx = [(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    return x_shape[keep], y_upper_[keep], y_lower_[keep], section_idx
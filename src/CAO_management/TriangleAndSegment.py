@@ -1,6 +1,97 @@
 import numpy as np
 import pandas as pd
 
+from CAO_management.STLReader import Read_STL
+
+# colonnes des sommets dans les fichiers CSV produits par `Get_CSV`
+VERTEX_COLUMNS = ["S1 X", "S1 Y", "S1 Z", "S2 X", "S2 Y", "S2 Z", "S3 X", "S3 Y", "S3 Z"]
+
+def Load_Triangles(csv_file: str):
+    """
+    Charge les triangles d'un maillage converti en CSV sous la forme d'un unique tableau.
+
+    **Paramètres** :
+        - `csv_file` (str) : Chemin du fichier CSV contenant le maillage 3D.
+
+    **Traitements effectués** :
+        1. **Lecture des colonnes des sommets** (S1, S2, S3) en un bloc.
+        2. **Retournement de l'axe Z** (Z_max - Z).
+        3. **Conversion en mètres** (multiplication par `1e-3`, données en millimètres).
+        4. **Échange des axes X et Z** pour adapter à la convention de tracé.
+
+    **Retourne** :
+        - `triangles` (numpy.ndarray) : Tableau (N, 3, 3) des triangles : triangle, sommet, coordonnée (X, Y, Z).
+    """
+    vertices = pd.read_csv(csv_file, usecols=VERTEX_COLUMNS)[VERTEX_COLUMNS].to_numpy(dtype=float).reshape(-1, 3, 3)
+
+    return _launcher_frame(vertices)
+
+def Load_STL_Triangles(stl_file: str):
+    """
+    Charge les triangles d'un maillage directement depuis un fichier STL (binaire ou ASCII), sans CSV intermédiaire.
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier STL.
+
+    **Retourne** :
+        - `triangles` (numpy.ndarray) : Tableau (N, 3, 3), mêmes traitements et même convention que `Load_Triangles`.
+
+    **Remarque** :
+        - Un fichier binaire est lu sans copie par `Read_STL` ; seule la mise dans le repère du lanceur crée un tableau.
+    """
+    vertices = np.asarray(Read_STL(stl_file)["SOMMETS"], dtype=float)
+
+    return _launcher_frame(vertices)
+
+def _launcher_frame(vertices):
+    """
+    Retournement de l'axe Z, conversion en mètres et échange des axes X et Z (sur une copie si nécessaire).
+    """
+    vertices = np.array(vertices, dtype=float)
+    vertices[..., 2] = vertices[..., 2].max() - vertices[..., 2]
+
+    return np.ascontiguousarray(vertices[..., ::-1]) * 1e-3
+
+def Slice_Triangles(triangles, Y_FIXE: float):
+    """
+    Calcule les segments d'intersection des triangles avec le plan `Y = Y_FIXE`.
+
+    **Paramètres** :
+        - `triangles` (array-like) : Triangles (N, 3, 3) (sortie de `Load_Triangles`).
+        - `Y_FIXE` (float) : Valeur de Y du plan de coupe.
+
+    **Traitements effectués** :
+        - Les trois arêtes (S1-S2, S2-S3, S3-S1) de tous les triangles sont testées en une fois :
+          une arête coupe le plan si ses extrémités sont strictement de part et d'autre.
+        - Le point d'intersection de chaque arête coupante est obtenu par interpolation linéaire.
+        - Un segment est enregistré pour chaque triangle coupé en exactement deux points.
+
+    **Retourne** :
+        - `segments` (numpy.ndarray) : Tableau (M, 2, 2) des segments, chaque point étant donné en (X, Z).
+    """
+    triangles = np.asarray(triangles, dtype=float)
+
+    p1 = triangles
+    p2 = np.roll(triangles, -1, axis=1)
+    y1, y2 = p1[..., 1], p2[..., 1]
+
+    crossing = ((y1 < Y_FIXE) & (y2 > Y_FIXE)) | ((y1 > Y_FIXE) & (y2 < Y_FIXE))
+    cut = crossing.sum(axis=1) == 2
+
+    p1, p2, y1, y2, crossing = p1[cut], p2[cut], y1[cut], y2[cut], crossing[cut]
+
+    # --> points d'intersection des arêtes des triangles coupés (les arêtes non coupantes sont ignorées),
+    #     coordonnées (3e, 1re) des sommets, soit (X, Z) dans le repère d'origine du maillage
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (Y_FIXE - y1) / (y2 - y1)
+        points = p1[..., ::-2] + t[..., np.newaxis] * (p2[..., ::-2] - p1[..., ::-2])
+
+    # --> les deux arêtes coupantes, dans l'ordre des arêtes du triangle
+    edges = np.argsort(~crossing, axis=1, kind="stable")[:, :2]
+    segments = np.take_along_axis(points, edges[..., np.newaxis], axis=1)
+
+    return segments
+
 def TransformCSV(csv_file: str, Y_FIXE: float):
     """
     Transforme un fichier CSV contenant un maillage 3D en une structure exploitable pour l'affichage 3D et 2D.
@@ -14,60 +105,32 @@ def TransformCSV(csv_file: str, Y_FIXE: float):
         - `Y_FIXE` (float) : Valeur de Y pour laquelle la coupe 2D sera extraite.
 
     **Traitements effectués** :
-        1. **Lecture du fichier CSV** et extraction des coordonnées des triangles (S1, S2, S3).
-        2. **Conversion en mètres** (multiplication par `1e-3` si les données sont en millimètres).
-        3. **Échange des axes X et Z** pour adapter à la convention de tracé.
-        4. **Détermination des segments d'intersection avec le plan `Y = Y_FIXE`** :
-           - Chaque arête des triangles est testée pour voir si elle coupe ce plan.
-           - Si oui, le point d'intersection est calculé.
-           - Si un triangle coupe le plan en deux points, un segment est enregistré.
+        1. **Lecture du fichier CSV** et extraction des coordonnées des triangles (`Load_Triangles`).
+        2. **Détermination des segments d'intersection avec le plan `Y = Y_FIXE`** (`Slice_Triangles`),
+           toutes les arêtes étant traitées en une seule opération vectorisée.
+
+    **Retourne** :
+        - `triangles` (numpy.ndarray) : Triangles du maillage 3D, tableau (N, 3, 3) de sommets `[S1, S2, S3]`.
+        - `segments` (numpy.ndarray) : Segments 2D de la coupe dans le plan `Y = Y_FIXE`, tableau (M, 2, 2) de points (X, Z).
+    """
+    triangles = Load_Triangles(csv_file)
+    segments = Slice_Triangles(triangles, Y_FIXE)
+
+    return triangles, segments
+
+def TransformSTL(stl_file: str, Y_FIXE: float):
+    """
+    Équivalent de `TransformCSV` lisant directement un fichier STL (`Load_STL_Triangles`).
+
+    **Paramètres** :
+        - `stl_file` (str) : Chemin du fichier STL.
+        - `Y_FIXE` (float) : Valeur de Y pour laquelle la coupe 2D sera extraite.
 
     **Retourne** :
-        - `triangles` (list) : Liste des triangles du maillage 3D sous forme de listes de trois sommets `[S1, S2, S3]`.
-        - `segments` (list) : Liste des segments 2D résultant de la coupe du modèle dans le plan `Y = Y_FIXE`.
+        - `triangles` (numpy.ndarray) : Triangles du maillage 3D, tableau (N, 3, 3).
+        - `segments` (numpy.ndarray) : Segments 2D de la coupe dans le plan `Y = Y_FIXE`, tableau (M, 2, 2) de points (X, Z).
     """
+    triangles = Load_STL_Triangles(stl_file)
+    segments = Slice_Triangles(triangles, Y_FIXE)
 
-    df = pd.read_csv(csv_file)
-
-    Z_max = max(df["S1 Z"].max(), df["S2 Z"].max(), df["S3 Z"].max())
-    df["S1 Z"] = Z_max - df["S1 Z"]
-    df["S2 Z"] = Z_max - df["S2 Z"]
-    df["S3 Z"] = Z_max - df["S3 Z"]
-
-    triangles = []
-    for index, row in df.iterrows():
-        sommet1 = np.array([row["S1 X"], row["S1 Y"], row["S1 Z"]]) * 1e-3
-        sommet2 = np.array([row["S2 X"], row["S2 Y"], row["S2 Z"]]) * 1e-3
-        sommet3 = np.array([row["S3 X"], row["S3 Y"], row["S3 Z"]]) * 1e-3
-        triangles.append([sommet1, sommet2, sommet3])
-
-    for i in range(len(triangles)):
-        for j in range(3):
-            triangles[i][j][0], triangles[i][j][2] = triangles[i][j][2], triangles[i][j][0]
-
-
-    def intersection_plan_y(p1, p2, y_fixe):
-        if (p1[1] < y_fixe and p2[1] > y_fixe) or (p1[1] > y_fixe and p2[1] < y_fixe):
-            t = (y_fixe - p1[1]) / (p2[1] - p1[1])
-            x_inter = p1[0] + t * (p2[0] - p1[0])
-            z_inter = p1[2] + t * (p2[2] - p1[2])
-            return np.array([x_inter, z_inter])
-        return None
-
-    segments = []
-    for tri in triangles:
-        points_inter = []
-        for i in range(3):
-            p1, p2 = tri[i], tri[(i + 1) % 3]
-            inter = intersection_plan_y(p1, p2, Y_FIXE)
-            if inter is not None:
-                points_inter.append(inter)
-        
-        if len(points_inter) == 2:
-            segments.append(points_inter)
-
-    for i in range(len(segments)):
-        for j in range(2): 
-            segments[i][j][0], segments[i][j][1] = segments[i][j][1], segments[i][j][0]
-
-    return triangles, segments
\ No newline at end of file
+    return triangles, segments
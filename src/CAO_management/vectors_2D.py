@@ -38,30 +38,52 @@ shape_params = {
     }
 }
 
-def Get_2D_vectors():
+# paramètres de `shape_params` réellement lus par `Get_2D_vectors` (les autres ne modifient pas le profil)
+SHAPE_KEYS = [
+    ("COIFFE", "RADIUS"), ("COIFFE", "X_START"), ("COIFFE", "X_END"),
+    ("MAIN_FUSELAGE", "X_START"), ("MAIN_FUSELAGE", "X_END"), ("MAIN_FUSELAGE", "Y"),
+    ("TRANSITION", "RADIUS"),
+    ("PENTE", "X_START"), ("PENTE", "X_END"), ("PENTE", "Y_START"), ("PENTE", "Y_END"),
+    ("BOOSTER_FUSELAGE", "X_START"), ("BOOSTER_FUSELAGE", "X_END"), ("BOOSTER_FUSELAGE", "Y"),
+]
 
-    x_cover = np.linspace(shape_params["COIFFE"]["X_START"], shape_params["COIFFE"]["X_END"], 1000)
+# couples (début, fin) des sections du profil de `Get_2D_vectors` (coiffe, fuselage, transition, pente, booster)
+SECTION_IDX = [(0, 1000), (1000, 2000), (2000, 2200), (2200, 3000), (3000, 4000)]
+
+def Get_2D_vectors(params=None):
+    """
+    Construit le profil 2D analytique d'Ariane V (coiffe, fuselage, transition, pente et fuselage booster).
+
+    **Paramètres** :
+        - `params` (dict, optionnel) : Paramètres de forme, même structure que `shape_params` (utilisé si None).
+
+    **Retourne** :
+        - `tuple` : (x_shape, y_upper_, y_lower_), chacun de forme (4000,).
+    """
+    params = shape_params if params is None else params
+
+    x_cover = np.linspace(params["COIFFE"]["X_START"], params["COIFFE"]["X_END"], 1000)
     theta_cover = np.arccos(1 - 2*x_cover/x_cover[-1])
-    y_cover = shape_params["COIFFE"]["RADIUS"] * np.sqrt(theta_cover - 0.5*np.sin(2*theta_cover) + (1/3)*np.sin(theta_cover)**3) / np.sqrt(np.pi)
+    y_cover = params["COIFFE"]["RADIUS"] * np.sqrt(theta_cover - 0.5*np.sin(2*theta_cover) + (1/3)*np.sin(theta_cover)**3) / np.sqrt(np.pi)
 
     # --> fuselage principal Ariane V
-    x_fuselage = np.linspace(shape_params["MAIN_FUSELAGE"]["X_START"], shape_params["MAIN_FUSELAGE"]["X_END"], 1000)
-    y_fuselage = np.full(shape=len(x_fuselage), fill_value=shape_params["MAIN_FUSELAGE"]["Y"])
+    x_fuselage = np.linspace(params["MAIN_FUSELAGE"]["X_START"], params["MAIN_FUSELAGE"]["X_END"], 1000)
+    y_fuselage = np.full(shape=len(x_fuselage), fill_value=params["MAIN_FUSELAGE"]["Y"])
 
     # --> transition fuselage - booster
     theta_transition = np.linspace(np.pi, np.pi/2, 200) 
-    x_transition = shape_params["TRANSITION"]["RADIUS"] * np.cos(theta_transition) + shape_params["PENTE"]["X_START"]
-    y_transition = shape_params["TRANSITION"]["RADIUS"] * np.sin(theta_transition) + shape_params["COIFFE"]["RADIUS"]
+    x_transition = params["TRANSITION"]["RADIUS"] * np.cos(theta_transition) + params["PENTE"]["X_START"]
+    y_transition = params["TRANSITION"]["RADIUS"] * np.sin(theta_transition) + params["COIFFE"]["RADIUS"]
 
     # --> pente booster
-    slope = (shape_params["PENTE"]["Y_END"] - shape_params["PENTE"]["Y_START"]) / (shape_params["PENTE"]["X_END"] - shape_params["PENTE"]["X_START"]) 
-    b_slope = shape_params["PENTE"]["Y_START"] - slope * shape_params["PENTE"]["X_START"]
-    x_slope = np.linspace(shape_params["PENTE"]["X_START"], shape_params["PENTE"]["X_END"], 800)
+    slope = (params["PENTE"]["Y_END"] - params["PENTE"]["Y_START"]) / (params["PENTE"]["X_END"] - params["PENTE"]["X_START"]) 
+    b_slope = params["PENTE"]["Y_START"] - slope * params["PENTE"]["X_START"]
+    x_slope = np.linspace(params["PENTE"]["X_START"], params["PENTE"]["X_END"], 800)
     y_slope = slope * x_slope + b_slope
 
     # --> fuselage booster
-    x_booster = np.linspace(shape_params["BOOSTER_FUSELAGE"]["X_START"], shape_params["BOOSTER_FUSELAGE"]["X_END"], 1000)
-    y_booster = np.full(shape=len(x_booster), fill_value=shape_params["BOOSTER_FUSELAGE"]["Y"])
+    x_booster = np.linspace(params["BOOSTER_FUSELAGE"]["X_START"], params["BOOSTER_FUSELAGE"]["X_END"], 1000)
+    y_booster = np.full(shape=len(x_booster), fill_value=params["BOOSTER_FUSELAGE"]["Y"])
 
     x_shape = np.concatenate([x_cover, x_fuselage, x_transition, x_slope, x_booster])
     y_upper_ = np.concatenate([y_cover, y_fuselage, y_transition, y_slope, y_booster])
@@ -0,0 +1,274 @@
+import os
+import json
+import hashlib
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+from thermo_property.thermo_properties import Compute_ThermoProperties, Sutherland
+from aero_property.SurfacePipeline import Get_Surface_Coefficients_Batch
+
+# coefficients enregistrés pour chaque cellule (Mach, AoA, altitude), pris en bout de profil
+DATABASE_KEYS = ["CD_FROTTEMENT", "CD_PRESSION", "CD_ONDE", "CD_TOTAL", "CL"]
+AXES_KEYS = ["MACH", "AOA", "ALTITUDE"]
+
+META_FILE = "meta.json"
+DONE_FILE = "DONE.npy"
+
+# géométrie partagée et paramètres du calcul, attachés une fois par processus de travail
+_worker_state = {}
+
+    # ========================================== #
+    # ========== ÉCOULEMENT LIBRE ============== #
+    # ========================================== #
+
+def Compute_FreeStream_Grid(Mach, altitude):
+    """
+    Calcule les conditions de l'écoulement libre pour des couples (Mach, altitude).
+
+    Paramètres :
+    ------------
+    Mach : array-like
+        Nombres de Mach.
+    altitude : array-like
+        Altitudes (m), diffusables avec `Mach`.
+
+    Retourne :
+    ----------
+    FreeStream : dict
+        Mêmes clés que `Compute_FreeStream` ("ALTITUDE", "VITESSE", "TEMPERATURE", "PRESSION",
+        "MASSE VOLUMIQUE", "VITESSE DU SON", "VISCOSITÉ", "MACH"), la vitesse étant déduite du Mach.
+    """
+    Mach, altitude = np.broadcast_arrays(np.asarray(Mach, dtype=float), np.asarray(altitude, dtype=float))
+
+    atmosphere = Compute_ThermoProperties(altitude)
+
+    FreeStream = {
+        "ALTITUDE": altitude,
+        "VITESSE": Mach * atmosphere["VITESSE DU SON"],
+        "TEMPERATURE": atmosphere["TEMPERATURE"],
+        "PRESSION": atmosphere["PRESSION"],
+        "MASSE VOLUMIQUE": atmosphere["MASSE VOLUMIQUE"],
+        "VITESSE DU SON": atmosphere["VITESSE DU SON"],
+        "VISCOSITÉ": Sutherland(atmosphere["TEMPERATURE"]),
+        "MACH": Mach,
+    }
+
+    return FreeStream
+
+    # ========================================== #
+    # ========== CALCUL D'UN BLOC ============== #
+    # ========================================== #
+
+def _chunk_bounds(chunk_id, chunk_size, n_cells):
+    start = chunk_id * chunk_size
+    return start, min(start + chunk_size, n_cells)
+
+def _evaluate_chunk(chunk_id, geometry, meta):
+    """
+    Évalue les cellules d'un bloc avec `Get_Surface_Coefficients_Batch` et retourne les coefficients de bout de profil.
+    """
+    axes = [np.asarray(meta["AXES"][key], dtype=float) for key in AXES_KEYS]
+    shape = tuple(len(axis) for axis in axes)
+
+    start, stop = _chunk_bounds(chunk_id, meta["CHUNK_SIZE"], int(np.prod(shape)))
+    i_mach, i_aoa, i_alt = np.unravel_index(np.arange(start, stop), shape)
+
+    FreeStream = Compute_FreeStream_Grid(Mach=axes[0][i_mach], altitude=axes[2][i_alt])
+    FreeStream["S_REF"] = meta["S_REF"]
+
+    with np.errstate(all="ignore"):
+        AeroResults = Get_Surface_Coefficients_Batch(x_shape=geometry[0], y_upper_=geometry[1], y_lower_=geometry[2], FreeStream=FreeStream,
+                                                     AoA=axes[1][i_aoa], basic_gamma=meta["BASIC_GAMMA"], section_idx=meta["SECTION_IDX"])
+
+    total = AeroResults["TOTAL"]
+    results = {
+        "CD_FROTTEMENT": total["FROTTEMENT"][:, -1],
+        "CD_PRESSION": total["PRESSION"][:, -1],
+        "CD_ONDE": total["ONDE"][:, -1],
+        "CD_TOTAL": total["ALL"][:, -1],
+        "CL": total["PORTANCE"][:, -1],
+    }
+
+    return chunk_id, results
+
+def _init_worker(shm_name, geometry_shape, meta):
+    """
+    Initialise un processus de travail : la géométrie est lue directement dans la mémoire partagée.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state["SHM"] = shm
+    _worker_state["GEOMETRY"] = np.ndarray(geometry_shape, dtype=np.float64, buffer=shm.buf)
+    _worker_state["META"] = meta
+
+def _worker_chunk(chunk_id):
+    return _evaluate_chunk(chunk_id, _worker_state["GEOMETRY"], _worker_state["META"])
+
+    # ========================================== #
+    # ========== BASE SUR DISQUE =============== #
+    # ========================================== #
+
+def _geometry_key(geometry):
+    return hashlib.sha1(np.ascontiguousarray(geometry).tobytes()).hexdigest()[:16]
+
+def _open_database(db_dir, meta):
+    """
+    Crée (ou rouvre) les fichiers de la base : un .npy par coefficient (Mach × AoA × altitude) et un drapeau par bloc.
+
+    Le fichier `META_FILE` est écrit en dernier, une fois les tableaux créés et initialisés : une base n'est
+    reprise que si ce fichier et tous les tableaux existent, sinon elle est recréée.
+    """
+    meta_path = os.path.join(db_dir, META_FILE)
+    paths = [os.path.join(db_dir, f"{key}.npy") for key in DATABASE_KEYS] + [os.path.join(db_dir, DONE_FILE)]
+
+    resume = False
+    if os.path.exists(meta_path):
+        with open(meta_path, "r", encoding="utf-8") as f:
+            saved_meta = json.load(f)
+        if saved_meta != meta:
+            raise ValueError(f"La base {db_dir} a été construite avec une autre grille, géométrie ou configuration.")
+        resume = all(os.path.exists(path) for path in paths)
+
+    mode = "r+" if resume else "w+"
+    os.makedirs(db_dir, exist_ok=True)
+
+    shape = tuple(len(meta["AXES"][key]) for key in AXES_KEYS)
+    n_chunks = -(-int(np.prod(shape)) // meta["CHUNK_SIZE"])
+
+    tables = {}
+    for key, path in zip(DATABASE_KEYS, paths):
+        tables[key] = np.lib.format.open_memmap(path, mode=mode, dtype=np.float64, shape=shape if mode == "w+" else None)
+    done = np.lib.format.open_memmap(paths[-1], mode=mode, dtype=np.uint8, shape=(n_chunks,) if mode == "w+" else None)
+
+    if not resume:
+        for key in DATABASE_KEYS:
+            tables[key][...] = np.nan
+            tables[key].flush()
+        done[...] = 0
+        done.flush()
+
+        # --> méta-données écrites en dernier (renommage atomique)
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=1)
+        os.replace(tmp_path, meta_path)
+
+    return tables, done
+
+def _write_chunk(tables, done, chunk_id, chunk_size, results):
+    """
+    Écrit les résultats d'un bloc puis le marque comme terminé (les données sont vidées sur disque avant le drapeau).
+    """
+    for key in DATABASE_KEYS:
+        flat = tables[key].reshape(-1)
+        start, stop = _chunk_bounds(chunk_id, chunk_size, flat.size)
+        flat[start:stop] = results[key]
+        tables[key].flush()
+
+    done[chunk_id] = 1
+    done.flush()
+
+def Run_AeroDatabase(db_dir, x_shape, y_upper_, y_lower_, Mach, AoA, altitude, S_ref, basic_gamma=1.4, section_idx=None, chunk_size=64, n_workers=None):
+    """
+    Construit (ou complète) une base de coefficients aérodynamiques sur une grille Mach × AoA × altitude.
+
+    Paramètres :
+    ------------
+    db_dir : str
+        Dossier de la base (créé si nécessaire).
+    x_shape, y_upper_, y_lower_ : array-like
+        Géométrie du profil (N,).
+    Mach : array-like
+        Axe des nombres de Mach.
+    AoA : array-like
+        Axe des angles d'attaque (même convention que `AoA_Effect`).
+    altitude : array-like
+        Axe des altitudes (m).
+    S_ref : float
+        Surface de référence (m²).
+    basic_gamma : float, optionnel (par défaut = 1.4)
+        Valeur de γ utilisée pour un écoulement standard.
+    section_idx : array-like, optionnel (par défaut = None)
+        Couples (début, fin) des sections du profil.
+    chunk_size : int, optionnel (par défaut = 64)
+        Nombre de cellules évaluées (en un appel vectorisé) par tâche.
+    n_workers : int, optionnel (par défaut = None)
+        Nombre de processus. None : nombre de cœurs ; 1 : calcul dans le processus courant.
+
+    Retourne :
+    ----------
+    database : dict
+        Sortie de `Load_AeroDatabase`.
+
+    Remarque :
+    ----------
+    - La géométrie est placée une seule fois en mémoire partagée ; chaque tâche ne transmet qu'un numéro de bloc.
+    - Chaque coefficient est stocké dans un fichier .npy (Mach × AoA × altitude) ouvert en mémoire (memmap) ;
+      un bloc n'est marqué terminé qu'une fois ses résultats écrits sur disque.
+    - Relancer la fonction sur le même dossier reprend le calcul : les blocs déjà terminés sont ignorés.
+      Une grille, une géométrie ou une configuration différente lève une erreur.
+    """
+    geometry = np.ascontiguousarray(np.stack([np.asarray(x_shape, dtype=float), np.asarray(y_upper_, dtype=float), np.asarray(y_lower_, dtype=float)]))
+
+    meta = {
+        "AXES": {"MACH": np.asarray(Mach, dtype=float).tolist(), "AOA": np.asarray(AoA, dtype=float).tolist(), "ALTITUDE": np.asarray(altitude, dtype=float).tolist()},
+        "GEOMETRY": _geometry_key(geometry),
+        "S_REF": float(S_ref),
+        "BASIC_GAMMA": float(basic_gamma),
+        "SECTION_IDX": None if section_idx is None else np.asarray(section_idx, dtype=int).tolist(),
+        "CHUNK_SIZE": int(chunk_size),
+    }
+
+    tables, done = _open_database(db_dir, meta)
+    todo = np.flatnonzero(done == 0).tolist()
+
+    if n_workers == 1:
+        for chunk_id in todo:
+            _, results = _evaluate_chunk(chunk_id, geometry, meta)
+            _write_chunk(tables, done, chunk_id, chunk_size, results)
+
+    elif todo:
+        shm = shared_memory.SharedMemory(create=True, size=geometry.nbytes)
+        try:
+            np.ndarray(geometry.shape, dtype=np.float64, buffer=shm.buf)[...] = geometry
+
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(shm.name, geometry.shape, meta)) as pool:
+                futures = [pool.submit(_worker_chunk, chunk_id) for chunk_id in todo]
+                for future in as_completed(futures):
+                    chunk_id, results = future.result()
+                    _write_chunk(tables, done, chunk_id, chunk_size, results)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    del tables, done
+
+    return Load_AeroDatabase(db_dir)
+
+def Load_AeroDatabase(db_dir, mmap_mode="r"):
+    """
+    Ouvre une base construite par `Run_AeroDatabase`.
+
+    Paramètres :
+    ------------
+    db_dir : str
+        Dossier de la base.
+    mmap_mode : str, optionnel (par défaut = "r")
+        Mode d'ouverture des tableaux (voir `np.load`).
+
+    Retourne :
+    ----------
+    database : dict
+        - "MACH", "AOA", "ALTITUDE" : axes de la grille.
+        - `DATABASE_KEYS` : coefficients de forme (n_Mach, n_AoA, n_altitude) (NaN pour les cellules non calculées).
+        - "COMPLET" : True si tous les blocs ont été calculés.
+    """
+    with open(os.path.join(db_dir, META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+
+    database = {key: np.asarray(meta["AXES"][key]) for key in AXES_KEYS}
+    for key in DATABASE_KEYS:
+        database[key] = np.load(os.path.join(db_dir, f"{key}.npy"), mmap_mode=mmap_mode)
+    database["COMPLET"] = bool(np.all(np.load(os.path.join(db_dir, DONE_FILE)) == 1))
+
+    return database
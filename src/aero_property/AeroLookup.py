@@ -0,0 +1,172 @@
+import warnings
+from bisect import bisect_right
+import numpy as np
+
+from aero_property.AeroDatabase import Load_AeroDatabase, DATABASE_KEYS, AXES_KEYS
+
+# types traités par le chemin scalaire (Python pur)
+_SCALARS = (int, float, np.integer, np.floating)
+
+def Load_AeroLookup(db_dir):
+    """
+    Ouvre une base de coefficients (`Run_AeroDatabase`) pour des interrogations rapides.
+
+    Paramètres :
+    ------------
+    db_dir : str
+        Dossier de la base.
+
+    Retourne :
+    ----------
+    lookup : dict
+        - "DB_DIR" : dossier de la base.
+        - "AXES" : axes (Mach, AoA, altitude) sous forme de tableaux.
+        - "AXES_LIST" : mêmes axes sous forme de listes (chemin scalaire).
+        - "SHAPE", "STRIDES" : forme de la grille et pas des indices à plat.
+        - "TABLES" : coefficients (`DATABASE_KEYS`) à plat, vues `np.ndarray` des fichiers ouverts en lecture seule (memmap).
+
+    Remarque :
+    ----------
+    - Les tableaux sont ouverts en mode "r" : plusieurs processus peuvent partager la même base sans
+      copie. Pour un pool de processus, transmettre `db_dir` et appeler `Load_AeroLookup` dans chaque
+      processus (l'ouverture ne lit aucune donnée).
+    - Un avertissement est émis si la base n'est pas complète (les cellules manquantes valent NaN).
+    """
+    database = Load_AeroDatabase(db_dir, mmap_mode="r")
+
+    if not database["COMPLET"]:
+        warnings.warn(f"La base {db_dir} n'est pas complète : certaines interrogations retourneront NaN.")
+
+    axes = [np.asarray(database[key], dtype=float) for key in AXES_KEYS]
+    shape = tuple(len(axis) for axis in axes)
+
+    lookup = {
+        "DB_DIR": db_dir,
+        "AXES": axes,
+        "AXES_LIST": [axis.tolist() for axis in axes],
+        "SHAPE": shape,
+        "STRIDES": (shape[1] * shape[2], shape[2], 1),
+        "TABLES": {key: database[key].reshape(-1).view(np.ndarray) for key in DATABASE_KEYS},
+    }
+
+    return lookup
+
+    # =========================================== #
+    # ========== POIDS D'INTERPOLATION ========== #
+    # =========================================== #
+
+def _axis_weights(axis, x, method):
+    """
+    Indices et poids d'interpolation le long d'un axe (valeurs hors de l'axe ramenées aux bornes).
+
+    Retourne :
+    ----------
+    idx, w : np.ndarray
+        Tableaux de forme (n, p) : p = 2 (linéaire), 4 (cubique) ou 1 (axe à un seul point).
+    """
+    n = len(axis)
+    x = np.clip(x, axis[0], axis[-1])
+
+    if n == 1:
+        return np.zeros((x.size, 1), dtype=np.intp), np.ones((x.size, 1))
+
+    i = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, n - 2)
+
+    if method == "linear" or n < 4:
+        t = (x - axis[i]) / (axis[i + 1] - axis[i])
+        return np.stack([i, i + 1], axis=-1), np.stack([1 - t, t], axis=-1)
+
+    # --> cubique : polynôme de Lagrange sur les 4 nœuds encadrant x (décalés aux extrémités)
+    start = np.clip(i - 1, 0, n - 4)
+    idx = start[:, np.newaxis] + np.arange(4)
+    nodes = axis[idx]
+
+    w = np.ones(idx.shape)
+    for k in range(4):
+        for m in range(4):
+            if m != k:
+                w[:, k] *= (x - nodes[:, m]) / (nodes[:, k] - nodes[:, m])
+
+    return idx, w
+
+def _lookup_scalar_linear(lookup, point, keys):
+    """
+    Interpolation trilinéaire d'un seul point, en Python pur (pas de tableau temporaire).
+    """
+    flats, weights = [0], [1.0]
+
+    for axis, x, stride in zip(lookup["AXES_LIST"], point, lookup["STRIDES"]):
+        n = len(axis)
+        if n == 1:
+            continue
+
+        x = min(max(x, axis[0]), axis[-1])
+        i = min(max(bisect_right(axis, x) - 1, 0), n - 2)
+        t = (x - axis[i]) / (axis[i + 1] - axis[i])
+
+        low, high = i * stride, (i + 1) * stride
+        flats = [f + low for f in flats] + [f + high for f in flats]
+        weights = [w * (1 - t) for w in weights] + [w * t for w in weights]
+
+    coeffs = {}
+    for key in keys:
+        item = lookup["TABLES"][key].item
+        coeffs[key] = sum([w * item(f) for f, w in zip(flats, weights)])
+
+    return coeffs
+
+def Get_AeroCoeff_Lookup(lookup, Mach, AoA, altitude, keys=("CD_TOTAL", "CL"), method="linear"):
+    """
+    Interpole les coefficients aérodynamiques de la base en des points (Mach, AoA, altitude) quelconques.
+
+    Paramètres :
+    ------------
+    lookup : dict
+        Sortie de `Load_AeroLookup`.
+    Mach : float ou array-like
+        Nombre(s) de Mach.
+    AoA : float ou array-like
+        Angle(s) d'attaque (même convention que la base).
+    altitude : float ou array-like
+        Altitude(s) (m).
+    keys : tuple, optionnel (par défaut = ("CD_TOTAL", "CL"))
+        Coefficients à interpoler (parmi `DATABASE_KEYS`).
+    method : str, optionnel (par défaut = "linear")
+        "linear" (trilinéaire) ou "cubic" (Lagrange cubique par axe, produit tensoriel 4 × 4 × 4).
+
+    Retourne :
+    ----------
+    coeffs : dict
+        Coefficient interpolé pour chaque clé : float pour une interrogation scalaire, sinon tableau
+        de la forme diffusée de (Mach, AoA, altitude).
+
+    Remarque :
+    ----------
+    - Les points hors de la grille sont ramenés sur ses bornes (pas d'extrapolation).
+    - Une interrogation scalaire linéaire n'utilise que du Python pur (quelques microsecondes) ;
+      les interrogations par lots sont entièrement vectorisées.
+    """
+    if method not in ("linear", "cubic"):
+        raise ValueError(f"Méthode d'interpolation inconnue : {method}")
+
+    if method == "linear" and isinstance(Mach, _SCALARS) and isinstance(AoA, _SCALARS) and isinstance(altitude, _SCALARS):
+        return _lookup_scalar_linear(lookup, (float(Mach), float(AoA), float(altitude)), keys)
+
+    points = np.broadcast_arrays(np.asarray(Mach, dtype=float), np.asarray(AoA, dtype=float), np.asarray(altitude, dtype=float))
+    shape = points[0].shape
+
+    # --> indices à plat et poids du produit tensoriel, de forme (n, p_Mach, p_AoA, p_altitude)
+    flat, weight = 0, 1.0
+    for d, (axis, x, stride) in enumerate(zip(lookup["AXES"], points, lookup["STRIDES"])):
+        idx, w = _axis_weights(axis, x.reshape(-1), method)
+        expand = [slice(None)] + [np.newaxis] * 3
+        expand[d + 1] = slice(None)
+        flat = flat + idx[tuple(expand)] * stride
+        weight = weight * w[tuple(expand)]
+
+    coeffs = {}
+    for key in keys:
+        values = np.sum(np.asarray(lookup["TABLES"][key][flat]) * weight, axis=(1, 2, 3)).reshape(shape)
+        coeffs[key] = values[()] if values.ndim == 0 else values
+
+    return coeffs
@@ -0,0 +1,199 @@
+import os
+import glob
+import hashlib
+import zipfile
+import numpy as np
+from functools import lru_cache
+
+from aero_property.SurfacePipeline import Get_Surface_Coefficients
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "case_cache")
+
+# taille maximale du cache par défaut (octets)
+CACHE_MAX_BYTES = 512 * 1024**2
+
+# modules dont le code source entre dans l'empreinte des cas (toute modification invalide le cache)
+CODE_DIRS = ["aero_property", "thermo_property", "shock_management", "kernel_management", "profil_config"]
+
+# séparateur des clés imbriquées dans les fichiers .npz
+KEY_SEP = "/"
+
+    # ========================================== #
+    # ========== EMPREINTE D'UN CAS ============ #
+    # ========================================== #
+
+@lru_cache(maxsize=1)
+def Get_CodeVersion():
+    """
+    Retourne l'empreinte du code source de la chaîne de calcul (modules de `CODE_DIRS`).
+    """
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+    digest = hashlib.sha1()
+    for code_dir in CODE_DIRS:
+        for path in sorted(glob.glob(os.path.join(src_dir, code_dir, "*.py"))):
+            digest.update(os.path.basename(path).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+
+    return digest.hexdigest()[:16]
+
+def _update_digest(digest, value):
+    arr = np.asarray(value)
+
+    if arr.dtype == object:
+        digest.update(repr(value).encode("utf-8"))
+    else:
+        digest.update(f"{arr.dtype.str}{arr.shape}".encode("utf-8"))
+        digest.update(np.ascontiguousarray(arr).tobytes())
+
+def Get_CaseKey(x_shape, y_upper_, y_lower_, inf_cst, AoA, basic_gamma, section_idx=None):
+    """
+    Calcule l'empreinte (hash) d'un cas : géométrie, écoulement libre, incidence, γ et version du code.
+
+    Retourne :
+    ----------
+    str
+        Empreinte hexadécimale (40 caractères).
+    """
+    digest = hashlib.sha1(Get_CodeVersion().encode("utf-8"))
+
+    for arr in (x_shape, y_upper_, y_lower_):
+        _update_digest(digest, np.asarray(arr, dtype=float))
+
+    for key in sorted(inf_cst):
+        digest.update(key.encode("utf-8"))
+        _update_digest(digest, inf_cst[key])
+
+    _update_digest(digest, float(AoA))
+    _update_digest(digest, float(basic_gamma))
+    _update_digest(digest, None if section_idx is None else np.asarray(section_idx, dtype=int))
+
+    return digest.hexdigest()
+
+    # ========================================== #
+    # ========== STOCKAGE ====================== #
+    # ========================================== #
+
+def _flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, prefix + key + KEY_SEP))
+        else:
+            flat[prefix + key] = np.asarray(value)
+
+    return flat
+
+def _unflatten(flat):
+    results = {}
+    for path, value in flat.items():
+        *parents, key = path.split(KEY_SEP)
+        node = results
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[key] = value[()] if value.ndim == 0 else value
+
+    return results
+
+def _evict(cache_dir, max_bytes):
+    """
+    Supprime les entrées les moins récemment utilisées jusqu'à ce que le cache tienne dans `max_bytes`.
+    """
+    entries = [entry for entry in os.scandir(cache_dir) if entry.name.endswith(".npz")]
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+
+    total = sum(entry.stat().st_size for entry in entries)
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        try:
+            size = entry.stat().st_size
+            os.remove(entry.path)
+            total -= size
+        except FileNotFoundError:
+            pass
+
+def Load_CaseCache(key, cache_dir=None):
+    """
+    Relit une entrée du cache (None si elle est absente ou illisible) et la marque comme récemment utilisée.
+    """
+    cache_dir = CACHE_DIR if cache_dir is None else cache_dir
+    path = os.path.join(cache_dir, f"{key}.npz")
+
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            flat = {name: data[name] for name in data.files}
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, zipfile.BadZipFile):
+        os.remove(path)
+        return None
+
+    return _unflatten(flat)
+
+def Save_CaseCache(key, results, cache_dir=None, max_bytes=CACHE_MAX_BYTES):
+    """
+    Enregistre une entrée (.npz compressé, écriture atomique) puis applique l'éviction LRU.
+    """
+    cache_dir = CACHE_DIR if cache_dir is None else cache_dir
+    os.makedirs(cache_dir, exist_ok=True)
+
+    path = os.path.join(cache_dir, f"{key}.npz")
+
+    # écriture dans un fichier temporaire puis renommage atomique (processus concurrents)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, **_flatten(results))
+    os.replace(tmp_path, path)
+
+    _evict(cache_dir, max_bytes)
+
+def Clear_CaseCache(cache_dir=None):
+    """
+    Vide le cache des cas.
+    """
+    cache_dir = CACHE_DIR if cache_dir is None else cache_dir
+
+    for path in glob.glob(os.path.join(cache_dir, "*.npz")):
+        os.remove(path)
+
+    # ========================================== #
+    # ========== CHAÎNE MISE EN CACHE ========== #
+    # ========================================== #
+
+def Get_Surface_Coefficients_Cached(x_shape, y_upper_, y_lower_, inf_cst, AoA, basic_gamma, section_idx=None, cache_dir=None, max_bytes=CACHE_MAX_BYTES):
+    """
+    Version mise en cache sur disque de `Get_Surface_Coefficients`.
+
+    Paramètres :
+    ------------
+    x_shape, y_upper_, y_lower_, inf_cst, AoA, basic_gamma, section_idx :
+        Voir `Get_Surface_Coefficients`.
+    cache_dir : str, optionnel (par défaut = None)
+        Répertoire du cache. Par défaut `docs/case_cache`.
+    max_bytes : int, optionnel (par défaut = `CACHE_MAX_BYTES`)
+        Taille maximale du cache : au-delà, les entrées les moins récemment utilisées sont supprimées.
+
+    Retourne :
+    ----------
+    AeroResults : dict
+        Même contenu que `Get_Surface_Coefficients`.
+
+    Remarque :
+    ----------
+    - Une entrée est identifiée par l'empreinte de la géométrie, de `inf_cst`, de l'incidence, de γ et du
+      code source de la chaîne (`Get_CodeVersion`) : modifier l'un d'eux produit un nouveau cas.
+    - Les tableaux relus sont des copies indépendantes du fichier ; la date de modification du fichier
+      sert de date de dernière utilisation pour l'éviction.
+    """
+    key = Get_CaseKey(x_shape, y_upper_, y_lower_, inf_cst, AoA, basic_gamma, section_idx)
+
+    AeroResults = Load_CaseCache(key, cache_dir=cache_dir)
+    if AeroResults is None:
+        AeroResults = Get_Surface_Coefficients(x_shape=x_shape, y_upper_=y_upper_, y_lower_=y_lower_, inf_cst=inf_cst,
+                                               AoA=AoA, basic_gamma=basic_gamma, section_idx=section_idx)
+        Save_CaseCache(key, AeroResults, cache_dir=cache_dir, max_bytes=max_bytes)
+
+    return AeroResults
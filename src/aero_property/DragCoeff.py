@@ -1,5 +1,6 @@
 import numpy as np
-from thermo_property.GammaManagement import calculate_gamma_rarefied
+from thermo_property.GammaManagement import Get_Gamma
+from kernel_management.FlowKernels import Kernel_FrotCoeff
 
 def Reynolds(rho, velocity, viscosity, s_x):
     """
@@ -30,14 +31,15 @@ def Get_Frot_Coeff(Reynold, Mach):
     Paramètres :
     ------------
     Reynold : array-like
-        Tableau contenant les nombres de Reynolds.
-    Mach : float
-        Nombre de Mach de l'écoulement.
+        Nombres de Reynolds, de forme (N,) pour un cas ou (n_cas, N) pour plusieurs cas de vol.
+    Mach : float ou array-like
+        Nombre de Mach de l'écoulement : scalaire, un Mach par cas (forme (n_cas,)) ou un Mach
+        par panneau (même forme que `Reynold`).
 
     Retourne :
     ---------
     np.ndarray :
-        Tableau des coefficients de frottement Cf.
+        Tableau des coefficients de frottement Cf, de même forme que `Reynold`.
     
     Remarque :
     ----------
@@ -46,18 +48,17 @@ def Get_Frot_Coeff(Reynold, Mach):
         * Sinon, l'écoulement est turbulent et le coefficient est estimé avec une loi de puissance.
     - Pour Mach ≥ 1.0 :
         * Le coefficient de frottement est calculé selon une loi empirique prenant en compte les effets compressibles.
+    - Les régimes sont sélectionnés par masques sur tout le tableau (aucune boucle Python) ; le calcul
+      est délégué à `Kernel_FrotCoeff` (backend NumPy ou Numba, voir `FlowKernels`).
     """
-    Cf_arr = np.zeros(shape=len(Reynold))
+    Reynold = np.asarray(Reynold, dtype=float)
+    Mach = np.asarray(Mach, dtype=float)
 
-    for idx, Re in enumerate(Reynold):
+    # --> un Mach par cas : diffusion sur l'axe des panneaux
+    if Reynold.ndim == 2 and Mach.ndim == 1:
+        Mach = Mach[:, np.newaxis]
 
-        if Mach < 1.0:
-            if Re < 5e5: # --> laminaire
-                Cf_arr[idx] = 1.328 / np.sqrt(Re)
-            else:
-                Cf_arr[idx] = 0.072 / (Re**(1/5))
-        else:
-            Cf_arr[idx] = 0.455 / ((np.log10(Re))**2.58 * (1 + 0.144 * Mach**2)**0.65)
+    Cf_arr = Kernel_FrotCoeff(Reynold, Mach)
 
     return Cf_arr
 
@@ -93,7 +94,7 @@ def Get_Wall_Constraint(Mach, Cf, rho, velocity, Temperature):
     else:
         return 0.5 * Cf * rho * velocity**2 * (Temperature["LOCAL"] / Temperature["T_INF"])**(-0.2)
 
-def Get_Drag_Coeff(tau_w, Cp, x_arr, y_arr, ds_x_arr, inf_cst, dev_angle):
+def Get_Drag_Coeff(tau_w, Cp, x_arr, y_arr, ds_x_arr, inf_cst, dev_angle, gamma=None):
     """
     Calcule les coefficients de traînée (frottement, pression et onde) pour un écoulement autour d'un profil.
 
@@ -119,6 +120,9 @@ def Get_Drag_Coeff(tau_w, Cp, x_arr, y_arr, ds_x_arr, inf_cst, dev_angle):
         - "TEMPERATURE" : Température de l'écoulement libre (K).
     dev_angle : array-like
         Angles de déviation du profil.
+    gamma : float ou array-like, optionnel (par défaut = None)
+        Rapport des capacités thermiques du cas, scalaire ou par panneau. Si None, la valeur
+        mémorisée `Get_Gamma` (partagée avec `Get_Local_Params`) est utilisée.
 
     Retourne :
     ---------
@@ -135,33 +139,34 @@ def Get_Drag_Coeff(tau_w, Cp, x_arr, y_arr, ds_x_arr, inf_cst, dev_angle):
     - La traînée de frottement est prise en compte uniquement pour Mach < 1.
     - La traînée de pression est calculée différemment selon Mach.
     - La traînée d'onde apparaît uniquement pour Mach ≥ 0.8 et évolue selon le régime subsonique, transsonique et supersonique.
+    - Les faces empilées (tableaux de forme (2, N), `x_arr` de forme (N,)) sont intégrées ligne par ligne en un seul appel.
     """
-    S_ref, rho, V, mach, gamma, T_inf = inf_cst["S_REF"], inf_cst["MASSE VOLUMIQUE"], inf_cst["VITESSE"], inf_cst["MACH"], inf_cst["GAMMA"], inf_cst["TEMPERATURE"]
+    S_ref, rho, V, mach, basic_gamma, T_inf = inf_cst["S_REF"], inf_cst["MASSE VOLUMIQUE"], inf_cst["VITESSE"], inf_cst["MACH"], inf_cst["GAMMA"], inf_cst["TEMPERATURE"]
 
     q_inf = 0.5 * rho * V**2 
-    theta = np.arctan(np.gradient(y_arr, x_arr))
+    theta = np.arctan(np.gradient(y_arr, x_arr, axis=-1))
 
-    if mach < 3:
-        gamma_mach = gamma
+    if gamma is None:
+        gamma_mach = Get_Gamma(Mach_inf=mach, T_inf=T_inf, basic_gamma=basic_gamma)
     else:
-        gamma_mach = calculate_gamma_rarefied(M_infty=mach, T_infty=T_inf)
+        gamma_mach = np.asarray(gamma, dtype=float)
 
         # --> traînée de frottement
     dF_x_frott = tau_w * np.cos(dev_angle) * ds_x_arr if mach < 1 else 0.0
     if mach < 1:
-        Cd_frott_arr = np.cumsum(dF_x_frott) / (q_inf * S_ref)
+        Cd_frott_arr = np.cumsum(dF_x_frott, axis=-1) / (q_inf * S_ref)
     else:
-        Cd_frott_arr = np.zeros(shape=len(dev_angle))
+        Cd_frott_arr = np.zeros(shape=np.shape(dev_angle))
 
         # --> traînée de pression
     if mach < 0.8:
-        Cd_press_arr = np.cumsum((1/S_ref) * Cp * np.cos(dev_angle) * ds_x_arr) *1e-2
+        Cd_press_arr = np.cumsum((1/S_ref) * Cp * np.cos(dev_angle) * ds_x_arr, axis=-1) *1e-2
     else:
-        Cd_press_arr = (4/(gamma_mach * mach**2)) * np.cumsum((1/x_arr[-1]) * np.sin(dev_angle)**2 * ds_x_arr)
+        Cd_press_arr = np.cumsum((4/(gamma_mach * mach**2)) * (1/x_arr[-1]) * np.sin(dev_angle)**2 * ds_x_arr, axis=-1)
 
         # --> traînée d'onde
     if mach < 0.8:
-        Cd_wave_arr = np.full(shape=len(x_arr), fill_value=0.0)
+        Cd_wave_arr = np.full(shape=np.shape(dev_angle), fill_value=0.0)
     elif 0.8 <= mach and mach < 1.2:
         Cd_wave_arr = 0.25 * (2/(gamma_mach * mach**2)) * np.sin(dev_angle)**2
     else:
@@ -170,6 +175,85 @@ def Get_Drag_Coeff(tau_w, Cp, x_arr, y_arr, ds_x_arr, inf_cst, dev_angle):
 
     return Cd_frott_arr, Cd_press_arr, Cd_wave_arr
 
+def Get_Wall_Constraint_Batch(Mach, Cf, rho, velocity, Temperature):
+    """
+    Version par lots de `Get_Wall_Constraint` : un nombre de Mach par cas, diffusé sur les panneaux.
+
+    Paramètres :
+    ------------
+    Mach : array-like
+        Nombres de Mach de l'écoulement libre (typiquement de forme (n_cas, 1)).
+    Cf : array-like
+        Coefficients de frottement pariétal, de forme (n_cas, ..., N).
+    rho : array-like
+        Densité de l'écoulement libre par cas (kg/m³).
+    velocity : array-like
+        Vitesse de l'écoulement libre par cas (m/s).
+    Temperature : dict
+        Température locale ("LOCAL") et température de l'écoulement libre ("T_INF").
+
+    Retourne :
+    ---------
+    np.ndarray :
+        Contraintes pariétales en N/m², de forme (n_cas, ..., N).
+    """
+    tau_w = 0.5 * Cf * rho * velocity**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(Mach < 1.0, tau_w, tau_w * (Temperature["LOCAL"] / Temperature["T_INF"])**(-0.2))
+
+def Get_Drag_Coeff_Batch(tau_w, Cp, x_arr, ds_x_arr, inf_cst, dev_angle, gamma):
+    """
+    Version par lots de `Get_Drag_Coeff` : les coefficients de traînée de plusieurs cas sont calculés en un appel.
+
+    Paramètres :
+    ------------
+    tau_w : array-like
+        Contraintes pariétales, de forme (n_cas, ..., N).
+    Cp : array-like
+        Coefficients de pression, de forme (n_cas, ..., N).
+    x_arr : array-like
+        Coordonnées x des points du profil (N,), ou par cas (diffusables avec les panneaux, par exemple (n_cas, 1, N)).
+    ds_x_arr : array-like
+        Éléments de surface élémentaires, de forme (n_cas, ..., N).
+    inf_cst : dict
+        Constantes de l'écoulement par cas ("S_REF", "MASSE VOLUMIQUE", "VITESSE", "MACH"), diffusables
+        avec les panneaux (typiquement de forme (n_cas, 1)).
+    dev_angle : array-like
+        Angles de déviation du profil, de forme (n_cas, ..., N).
+    gamma : array-like
+        Rapport des capacités thermiques par cas ou par panneau.
+
+    Retourne :
+    ---------
+    tuple :
+        (Cd_frott_arr, Cd_press_arr, Cd_wave_arr), chacun de forme (n_cas, ..., N).
+
+    Remarque :
+    ----------
+    - Les formules et les seuils de Mach sont ceux de `Get_Drag_Coeff` ; le choix du régime est fait
+      cas par cas par masques, et les intégrations sont faites le long du dernier axe.
+    """
+    S_ref, rho, V, mach = inf_cst["S_REF"], inf_cst["MASSE VOLUMIQUE"], inf_cst["VITESSE"], np.asarray(inf_cst["MACH"], dtype=float)
+
+    q_inf = 0.5 * rho * V**2
+    sin2_dev = np.sin(dev_angle)**2
+    shape = np.broadcast_shapes(np.shape(dev_angle), np.shape(Cp), mach.shape)
+
+        # --> traînée de frottement (Mach < 1 uniquement)
+    Cd_frott_arr = np.where(mach < 1, np.cumsum(tau_w * np.cos(dev_angle) * ds_x_arr, axis=-1) / (q_inf * S_ref), 0.0)
+
+        # --> traînée de pression
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Cd_press_sub = np.cumsum((1/S_ref) * Cp * np.cos(dev_angle) * ds_x_arr, axis=-1) *1e-2
+        Cd_press_sup = np.cumsum((4/(gamma * mach**2)) * (1/x_arr[..., -1:]) * sin2_dev * ds_x_arr, axis=-1)
+        Cd_press_arr = np.where(mach < 0.8, Cd_press_sub, Cd_press_sup)
+
+        # --> traînée d'onde (facteur 0.25 en transsonique)
+        Cd_wave_arr = np.where(mach < 0.8, 0.0, np.where(mach < 1.2, 0.25, 1.0) * (2/(gamma * mach**2)) * sin2_dev)
+
+    return np.broadcast_to(Cd_frott_arr, shape), np.broadcast_to(Cd_press_arr, shape), np.broadcast_to(Cd_wave_arr, shape)
+
 def Get_Total_Drag(Cd_frott, Cd_press, Cd_wave):
     """
     Calcule la traînée totale en sommant les contributions de frottement, de pression et d'onde.
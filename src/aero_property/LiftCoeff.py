@@ -19,7 +19,7 @@ def Get_LiftCoeff(Cp_dict, ds_dict, theta_dict, x_arr):
         - "UPP" : Face supérieure du profil.
         - "LOW" : Face inférieure du profil.
     x_arr : array-like
-        Coordonnées x des points du profil.
+        Coordonnées x des points du profil, de forme (N,) ou (n_cas, N).
 
     Retourne :
     ---------
@@ -35,7 +35,8 @@ def Get_LiftCoeff(Cp_dict, ds_dict, theta_dict, x_arr):
     ----------
     - La portance est calculée à partir des coefficients de pression et des angles de déviation.
     - Les contributions de la face supérieure et inférieure sont calculées séparément avant d’être additionnées.
-    - La somme cumulée est utilisée pour intégrer la portance le long du profil.
+    - La somme cumulée est utilisée pour intégrer la portance le long du profil (dernier axe, ce qui permet
+      de passer des tableaux de forme (n_cas, N)).
     """
     Cp_upper = Cp_dict["UPP"]
     Cp_lower = Cp_dict["LOW"]
@@ -46,16 +47,19 @@ def Get_LiftCoeff(Cp_dict, ds_dict, theta_dict, x_arr):
     dev_angle_upper = theta_dict["UPP"]
     dev_angle_lower = theta_dict["LOW"]
 
-    dCl_dx_upper = (1/x_arr[-1]) * Cp_upper * np.cos(dev_angle_upper) * ds_x_upper
-    dCl_dx_lower = (1/x_arr[-1]) * Cp_lower * np.cos(dev_angle_lower) * ds_x_lower
+    # --> longueur du profil (une par cas si `x_arr` est de forme (n_cas, N))
+    x_len = np.asarray(x_arr)[..., -1:]
+
+    dCl_dx_upper = (1/x_len) * Cp_upper * np.cos(dev_angle_upper) * ds_x_upper
+    dCl_dx_lower = (1/x_len) * Cp_lower * np.cos(dev_angle_lower) * ds_x_lower
 
         # --> Coefficient de portance face supérieure
-    Cl_x_upper = np.cumsum(dCl_dx_upper)
+    Cl_x_upper = np.cumsum(dCl_dx_upper, axis=-1)
 
         # --> Coefficient de portance face inférieure
-    Cl_x_lower = np.cumsum(dCl_dx_lower)
+    Cl_x_lower = np.cumsum(dCl_dx_lower, axis=-1)
 
         # --> Coefficient de portance totale
-    CL_x = np.cumsum((Cp_upper * np.cos(dev_angle_upper) - Cp_lower * np.cos(dev_angle_lower)) * (ds_x_upper + ds_x_lower)) / x_arr[-1]
+    CL_x = np.cumsum((Cp_upper * np.cos(dev_angle_upper) - Cp_lower * np.cos(dev_angle_lower)) * (ds_x_upper + ds_x_lower), axis=-1) / x_len
 
     return CL_x, Cl_x_upper, Cl_x_lower
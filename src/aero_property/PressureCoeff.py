@@ -56,4 +56,42 @@ def Get_Pressure_Coeff(Mach, inf_cst, P):
         return (P - P_inf) / (0.5 * rho_inf * v_inf**2)
     
     else:
-        return 0
\ No newline at end of file
+        return 0
+
+def Get_Pressure_Coeff_Batch(Mach, inf_cst, P):
+    """
+    Version par lots de `Get_Pressure_Coeff` : un nombre de Mach (et un état d'écoulement libre) par cas.
+
+    Paramètres :
+    ------------
+    Mach : array-like
+        Nombres de Mach de l'écoulement libre, diffusables avec `P` (typiquement de forme (n_cas, 1)).
+    inf_cst : dict
+        Conditions de l'écoulement libre par cas ("PRESSION", "MASSE VOLUMIQUE", "VITESSE"), même convention de forme.
+    P : array-like
+        Pressions locales (Pa), de forme (n_cas, ..., N).
+
+    Retourne :
+    ---------
+    np.ndarray :
+        Coefficients de pression Cp, de forme (n_cas, ..., N).
+
+    Remarque :
+    ----------
+    - Les corrections (Prandtl-Glauert, Karman-Tsien) sont sélectionnées cas par cas selon les mêmes
+      seuils que `Get_Pressure_Coeff` ; un Mach non défini (NaN) donne Cp = 0.
+    """
+    Mach = np.asarray(Mach, dtype=float)
+
+    Cp_inc = (P - inf_cst["PRESSION"]) / (0.5 * inf_cst["MASSE VOLUMIQUE"] * inf_cst["VITESSE"]**2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.sqrt(1 - Mach**2)
+
+        Cp = np.select(
+            [Mach < 0.3, Mach < 0.7, Mach < 1, Mach >= 1],
+            [Cp_inc, Cp_inc / beta, Cp_inc / (beta + (Mach**2 * Cp_inc)/(2*(1 + beta))), Cp_inc],
+            default=0.0
+        )
+
+    return Cp
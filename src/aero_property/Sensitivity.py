@@ -0,0 +1,122 @@
+import copy
+import numpy as np
+
+from CAO_management.vectors_2D import Get_2D_vectors, shape_params, SECTION_IDX, SHAPE_KEYS
+from aero_property.AeroDatabase import Compute_FreeStream_Grid, DATABASE_KEYS
+from aero_property.SurfacePipeline import Get_Surface_Coefficients_Batch
+
+# correspondance entre les coefficients de la base et les totaux de `Get_Surface_Coefficients_Batch`
+TOTAL_KEYS = dict(zip(DATABASE_KEYS, ["FROTTEMENT", "PRESSION", "ONDE", "ALL", "PORTANCE"]))
+
+def _perturbed_params(params, shape_key, delta):
+    section, key = shape_key
+    perturbed = copy.deepcopy(params)
+    perturbed[section][key] += delta
+
+    return perturbed
+
+def Get_AeroJacobian(Mach, AoA, altitude, S_ref, shape_keys=(), params=None, basic_gamma=1.4, section_idx=None,
+                     outputs=("CD_TOTAL", "CL"), rel_step=1e-4, scheme="central"):
+    """
+    Calcule par différences finies la jacobienne des coefficients aérodynamiques en un point de vol.
+
+    Tous les cas perturbés (Mach, AoA et paramètres de forme) sont évalués en un seul appel à
+    `Get_Surface_Coefficients_Batch`, chaque cas portant sa propre géométrie si nécessaire.
+
+    Paramètres :
+    ------------
+    Mach : float
+        Nombre de Mach du point de base.
+    AoA : float
+        Angle d'attaque du point de base (degrés, même convention que `AoA_Effect`).
+    altitude : float
+        Altitude du point de base (m).
+    S_ref : float
+        Surface de référence (m²).
+    shape_keys : list, optionnel (par défaut = ())
+        Paramètres de forme à dériver, sous forme de couples (section, clé) de `SHAPE_KEYS`,
+        par exemple [("COIFFE", "RADIUS"), ("PENTE", "Y_END")].
+    params : dict, optionnel (par défaut = None)
+        Paramètres de forme du point de base (`shape_params` si None).
+    basic_gamma : float, optionnel (par défaut = 1.4)
+        Valeur de γ utilisée pour un écoulement standard.
+    section_idx : array-like, optionnel (par défaut = None)
+        Couples (début, fin) des sections du profil (`SECTION_IDX` si None).
+    outputs : tuple, optionnel (par défaut = ("CD_TOTAL", "CL"))
+        Coefficients dérivés (parmi `DATABASE_KEYS`), pris en bout de profil.
+    rel_step : float, optionnel (par défaut = 1e-4)
+        Pas relatif : h = rel_step * max(|x|, 1) pour chaque variable.
+    scheme : str, optionnel (par défaut = "central")
+        "central" (2 cas par variable) ou "forward" (1 cas par variable).
+
+    Retourne :
+    ----------
+    sensitivity : dict
+        - "VARIABLES" : ["MACH", "AOA"] suivis des couples de `shape_keys`.
+        - "OUTPUTS" : coefficients dérivés.
+        - "VALEURS" : valeur de chaque coefficient au point de base.
+        - "JACOBIEN" : dérivées de forme (n_outputs, n_variables).
+        - "PAS" : pas utilisé pour chaque variable.
+
+    Remarque :
+    ----------
+    - Le pas complexe n'est pas utilisé : les noyaux (seuils de régime, `np.maximum`, tables) ne sont pas
+      analytiques en Mach et en angle.
+    - Un pas qui franchit un seuil de régime (Mach 0.8, 1, 1.2, 3, ...) donne une dérivée non significative.
+    - Les paramètres de forme sont perturbés indépendamment : les paramètres liés (par exemple
+      "COIFFE"/"X_END" et "MAIN_FUSELAGE"/"X_START") doivent être dérivés par l'appelant s'ils doivent rester égaux.
+    - Lève une `ValueError` pour un paramètre de forme absent de `SHAPE_KEYS` (non lu par `Get_2D_vectors`) :
+      sa dérivée serait identiquement nulle.
+    """
+    if scheme not in ("central", "forward"):
+        raise ValueError(f"Schéma de différences finies inconnu : {scheme}")
+
+    unused = [tuple(shape_key) for shape_key in shape_keys if tuple(shape_key) not in SHAPE_KEYS]
+    if unused:
+        raise ValueError(f"Paramètres de forme non utilisés par `Get_2D_vectors` : {unused}")
+
+    params = shape_params if params is None else params
+    section_idx = SECTION_IDX if section_idx is None else section_idx
+    signs = (1, -1) if scheme == "central" else (1,)
+
+    base = [float(Mach), float(AoA)] + [float(params[section][key]) for section, key in shape_keys]
+    steps = rel_step * np.maximum(np.abs(base), 1.0)
+
+    # --> cas : point de base puis, pour chaque variable, les points perturbés de ±h
+    Mach_c, AoA_c, shape_c = [base[0]], [base[1]], [None]
+    for j, h in enumerate(steps):
+        for sign in signs:
+            Mach_c.append(base[0] + sign * h if j == 0 else base[0])
+            AoA_c.append(base[1] + sign * h if j == 1 else base[1])
+            shape_c.append((shape_keys[j - 2], sign * h) if j >= 2 else None)
+
+    geometry = Get_2D_vectors(params)
+    if shape_keys:
+        geometries = [geometry if shape is None else Get_2D_vectors(_perturbed_params(params, *shape)) for shape in shape_c]
+        geometry = [np.stack(arrays) for arrays in zip(*geometries)]
+
+    FreeStream = Compute_FreeStream_Grid(Mach=np.array(Mach_c), altitude=altitude)
+    FreeStream["S_REF"] = S_ref
+
+    with np.errstate(all="ignore"):
+        AeroResults = Get_Surface_Coefficients_Batch(x_shape=geometry[0], y_upper_=geometry[1], y_lower_=geometry[2], FreeStream=FreeStream,
+                                                     AoA=np.array(AoA_c), basic_gamma=basic_gamma, section_idx=section_idx)
+
+    values = np.stack([AeroResults["TOTAL"][TOTAL_KEYS[key]][:, -1] for key in outputs])
+
+    # --> différences finies
+    perturbed = values[:, 1:].reshape(len(outputs), len(steps), len(signs))
+    if scheme == "central":
+        jacobian = (perturbed[..., 0] - perturbed[..., 1]) / (2 * steps)
+    else:
+        jacobian = (perturbed[..., 0] - values[:, :1]) / steps
+
+    sensitivity = {
+        "VARIABLES": ["MACH", "AOA"] + [tuple(shape_key) for shape_key in shape_keys],
+        "OUTPUTS": list(outputs),
+        "VALEURS": {key: values[i, 0] for i, key in enumerate(outputs)},
+        "JACOBIEN": jacobian,
+        "PAS": steps,
+    }
+
+    return sensitivity
@@ -0,0 +1,263 @@
+import numpy as np
+
+from profil_config.modelisation import AoA_Effect, Get_Local_Velocity, curv
+from thermo_property.GammaManagement import Get_Gamma, Compute_Gamma
+from thermo_property.LocalThermoProperties import Get_Local_Params, Get_Local_Params_Batch
+from aero_property.PressureCoeff import Get_Pressure_Coeff, Get_Pressure_Coeff_Batch
+from aero_property.LiftCoeff import Get_LiftCoeff
+from aero_property.DragCoeff import Reynolds, Get_Frot_Coeff, Get_Wall_Constraint, Get_Drag_Coeff, Get_Total_Drag
+from aero_property.DragCoeff import Get_Wall_Constraint_Batch, Get_Drag_Coeff_Batch
+
+# indices des faces dans les tableaux empilés de forme (2, N) (ou (n_cas, 2, N))
+UPPER, LOWER = 0, 1
+
+# conditions d'écoulement libre lues par `Get_Surface_Coefficients_Batch`
+BATCH_KEYS = ["PRESSION", "TEMPERATURE", "MASSE VOLUMIQUE", "VITESSE DU SON", "MACH", "VITESSE", "VISCOSITÉ", "S_REF"]
+
+def Surface_Dict(stacked_arr, keys=("UPP", "LOW")):
+    """
+    Sépare un tableau empilé (2, N) ou (n_cas, 2, N) en un dictionnaire {face supérieure, face inférieure} (vues, sans copie).
+    """
+    return {keys[UPPER]: stacked_arr[..., UPPER, :], keys[LOWER]: stacked_arr[..., LOWER, :]}
+
+def Get_Surface_Coefficients(x_shape, y_upper_, y_lower_, inf_cst, AoA, basic_gamma, section_idx=None):
+    """
+    Évalue en une seule passe les deux faces du profil : paramètres locaux, Cp, frottement, traînée et portance.
+
+    Paramètres :
+    ------------
+    x_shape : array-like
+        Coordonnées x du profil (N,).
+    y_upper_ : array-like
+        Coordonnées y de la face supérieure (N,).
+    y_lower_ : array-like
+        Coordonnées y de la face inférieure (N,).
+    inf_cst : dict
+        Conditions de l'écoulement libre ("PRESSION", "TEMPERATURE", "MASSE VOLUMIQUE", "VITESSE DU SON",
+        "MACH", "VITESSE", "VISCOSITÉ", "GAMMA", "S_REF").
+    AoA : float
+        Angle d'attaque (même convention que `AoA_Effect`).
+    basic_gamma : float
+        Valeur de γ utilisée pour un écoulement standard.
+    section_idx : array-like, optionnel (par défaut = None)
+        Couples (début, fin) des sections du profil pour le calcul de l'abscisse curviligne.
+        Si None, le profil est traité comme une seule section.
+
+    Retourne :
+    ----------
+    AeroResults : dict
+        Tableaux empilés de forme (2, N) (ligne `UPPER` = face supérieure, ligne `LOWER` = face inférieure) :
+        - "X_AOA", "Y_AOA", "DEV_ANGLE" : profil après incidence et angles de déviation.
+        - "DS_X", "S_X" : éléments et abscisse curviligne.
+        - "LOCAL_PARAMS" : dict ("PRESSION", "TEMPERATURE", "MASSE VOLUMIQUE").
+        - "CP", "RE", "CF", "TAU_W" : coefficient de pression, Reynolds, frottement et contrainte pariétale.
+        - "DRAG" : dict ("FROTTEMENT", "PRESSION", "ONDE") des coefficients de traînée par face.
+        - "LIFT" : coefficient de portance par face.
+        - "TOTAL" : dict ("FROTTEMENT", "PRESSION", "ONDE", "ALL", "PORTANCE") des totaux.
+        - "GAMMA" : γ du cas (partagé par toutes les étapes).
+
+    Remarque :
+    ----------
+    - Chaque fonction de la chaîne n'est appelée qu'une fois pour les deux faces : les faces ne sont
+      plus manipulées séparément, ce qui évite les erreurs de copier-coller entre les deux branches.
+    - `Split_Surfaces` reconstruit les dictionnaires attendus par `Show_ThermoProperties` et `Show_AeroCoeff`.
+    """
+    x_shape = np.asarray(x_shape, dtype=float)
+    y_shape = np.stack([np.asarray(y_upper_, dtype=float), np.asarray(y_lower_, dtype=float)])
+
+    if section_idx is None:
+        section_idx = [(0, x_shape.size)]
+
+    # --> géométrie (incidence, vitesse locale, abscisse curviligne)
+    x_AoA, y_AoA, dev_angle = AoA_Effect(x_arr=x_shape, y_arr=y_shape, AoA=AoA)
+    v_local = Get_Local_Velocity(v_inf=inf_cst["VITESSE"], EffectiveAngle=dev_angle)
+
+    curv_sections = [curv(x_arr=x_shape[start:stop], y_arr=y_AoA[:, start:stop]) for (start, stop) in section_idx]
+    ds_x = np.concatenate([ds for (ds, _) in curv_sections], axis=-1)
+    s_x = np.concatenate([s for (_, s) in curv_sections], axis=-1)
+
+    # --> paramètres thermodynamiques locaux (γ calculé une seule fois pour le cas)
+    gamma = Get_Gamma(Mach_inf=inf_cst["MACH"], T_inf=inf_cst["TEMPERATURE"], basic_gamma=basic_gamma)
+
+    Mach = {"MACH_INF": inf_cst["MACH"], "MACH_LOCAL": v_local / inf_cst["VITESSE DU SON"]}
+    Velocity = {"V_INF": inf_cst["VITESSE"], "V_LOCAL": v_local}
+
+    local_params = Get_Local_Params(inf_cst=inf_cst, Mach=Mach, Velocity=Velocity, deviation_angle=dev_angle, basic_gamma=basic_gamma, gamma=gamma)
+    local_params = {key: np.broadcast_to(value, dev_angle.shape) for key, value in local_params.items()}
+
+    # --> coefficients de pression et de frottement
+    Cp = Get_Pressure_Coeff(Mach=inf_cst["MACH"], inf_cst=inf_cst, P=local_params["PRESSION"])
+
+    Re = Reynolds(rho=inf_cst["MASSE VOLUMIQUE"], velocity=inf_cst["VITESSE"], viscosity=inf_cst["VISCOSITÉ"], s_x=s_x)
+    Cf = Get_Frot_Coeff(Reynold=Re, Mach=inf_cst["MACH"])
+
+    Temperature = {"LOCAL": local_params["TEMPERATURE"], "T_INF": inf_cst["TEMPERATURE"]}
+    tau_w = Get_Wall_Constraint(Mach=inf_cst["MACH"], Cf=Cf, rho=inf_cst["MASSE VOLUMIQUE"], velocity=inf_cst["VITESSE"], Temperature=Temperature)
+
+    # --> traînée et portance
+    Cd_frott, Cd_press, Cd_wave = Get_Drag_Coeff(tau_w=tau_w, Cp=Cp, x_arr=x_shape, y_arr=y_AoA, ds_x_arr=ds_x,
+                                                 inf_cst=inf_cst, dev_angle=dev_angle, gamma=gamma)
+
+    Cd_tot, Cd_tot_frott, Cd_tot_pression, Cd_tot_wave = Get_Total_Drag(Cd_frott=Surface_Dict(Cd_frott), Cd_press=Surface_Dict(Cd_press),
+                                                                         Cd_wave=Surface_Dict(Cd_wave))
+
+    CL_x, Cl_x_upper, Cl_x_lower = Get_LiftCoeff(Cp_dict=Surface_Dict(Cp), ds_dict=Surface_Dict(ds_x), theta_dict=Surface_Dict(dev_angle), x_arr=x_shape)
+
+    AeroResults = {
+        "X_AOA": x_AoA,
+        "Y_AOA": y_AoA,
+        "DEV_ANGLE": dev_angle,
+        "DS_X": ds_x,
+        "S_X": s_x,
+        "LOCAL_PARAMS": local_params,
+        "CP": Cp,
+        "RE": Re,
+        "CF": Cf,
+        "TAU_W": tau_w,
+        "DRAG": {"FROTTEMENT": Cd_frott, "PRESSION": Cd_press, "ONDE": Cd_wave},
+        "LIFT": np.stack([Cl_x_upper, Cl_x_lower], axis=-2),
+        "TOTAL": {"FROTTEMENT": Cd_tot_frott, "PRESSION": Cd_tot_pression, "ONDE": Cd_tot_wave, "ALL": Cd_tot, "PORTANCE": CL_x},
+        "GAMMA": gamma,
+    }
+
+    return AeroResults
+
+def Split_Surfaces(AeroResults):
+    """
+    Convertit le résultat de `Get_Surface_Coefficients` au format des fonctions d'affichage.
+
+    Paramètres :
+    ------------
+    AeroResults : dict
+        Résultat de `Get_Surface_Coefficients` ou de `Get_Surface_Coefficients_Batch`.
+
+    Retourne :
+    ----------
+    tuple :
+        - LocalParams : dict {"UPPER", "LOWER"} des paramètres locaux (pour `Show_ThermoProperties`).
+        - PressureCoeff : dict {"UPPER", "LOWER"} des coefficients de pression.
+        - DragCoeff : dict {"UPPER", "LOWER", "TOTAL"} des coefficients de traînée (pour `Show_AeroCoeff`).
+        - LiftCoeff : dict {"UPPER", "LOWER", "TOTAL"} des coefficients de portance.
+        - DragComponent : dict {"UPPER", "LOWER"} contenant "CF", "TAU_W" et "RE".
+    """
+    keys = ("UPPER", "LOWER")
+    total = AeroResults["TOTAL"]
+
+    LocalParams = {face: {key: value[..., idx, :] for key, value in AeroResults["LOCAL_PARAMS"].items()} for idx, face in enumerate(keys)}
+    PressureCoeff = Surface_Dict(AeroResults["CP"], keys=keys)
+
+    DragCoeff = {face: {key: value[..., idx, :] for key, value in AeroResults["DRAG"].items()} for idx, face in enumerate(keys)}
+    DragCoeff["TOTAL"] = {key: total[key] for key in ("FROTTEMENT", "PRESSION", "ONDE", "ALL")}
+
+    LiftCoeff = Surface_Dict(AeroResults["LIFT"], keys=keys)
+    LiftCoeff["TOTAL"] = total["PORTANCE"]
+
+    DragComponent = {face: {key: AeroResults[key][..., idx, :] for key in ("CF", "TAU_W", "RE")} for idx, face in enumerate(keys)}
+
+    return LocalParams, PressureCoeff, DragCoeff, LiftCoeff, DragComponent
+
+def Get_Surface_Coefficients_Batch(x_shape, y_upper_, y_lower_, FreeStream, AoA, basic_gamma, section_idx=None):
+    """
+    Version par lots de `Get_Surface_Coefficients` : de nombreuses conditions de vol évaluées en un seul appel.
+
+    Paramètres :
+    ------------
+    x_shape : array-like
+        Coordonnées x du profil (N,), ou une géométrie par cas (n_cas, N).
+    y_upper_ : array-like
+        Coordonnées y de la face supérieure (N,) ou (n_cas, N).
+    y_lower_ : array-like
+        Coordonnées y de la face inférieure (N,) ou (n_cas, N).
+    FreeStream : dict
+        Conditions de l'écoulement libre, un élément par cas (tableaux de forme (n_cas,)) ou scalaires
+        communs à tous les cas : clés `BATCH_KEYS` (par exemple la sortie de `Compute_FreeStream` complétée de "S_REF").
+    AoA : float ou array-like
+        Angle(s) d'attaque, scalaire ou un par cas.
+    basic_gamma : float
+        Valeur de γ utilisée pour un écoulement standard.
+    section_idx : array-like, optionnel (par défaut = None)
+        Couples (début, fin) des sections du profil pour le calcul de l'abscisse curviligne.
+
+    Retourne :
+    ----------
+    AeroResults : dict
+        Mêmes clés que `Get_Surface_Coefficients`, avec un axe des cas en tête : les tableaux par panneau
+        sont de forme (n_cas, 2, N), les totaux de forme (n_cas, N) et "GAMMA" de forme (n_cas,).
+
+    Remarque :
+    ----------
+    - Les cas sont regroupés par régime de Mach à l'intérieur de chaque étape (`Get_Local_Params_Batch`,
+      `Get_Pressure_Coeff_Batch`, `Get_Drag_Coeff_Batch`) : il n'y a aucune boucle Python sur les cas.
+    - Avec une géométrie par cas (même nombre de points N pour tous les cas), des profils différents
+      sont évalués dans le même appel (voir `Get_AeroJacobian`).
+    """
+    x_shape = np.asarray(x_shape, dtype=float)
+    y_shape = np.stack([np.asarray(y_upper_, dtype=float), np.asarray(y_lower_, dtype=float)], axis=-2)
+
+    # --> abscisses diffusables avec les tableaux (n_cas, 2, N) : (N,) ou (n_cas, 1, N)
+    x_faces = x_shape if x_shape.ndim == 1 else x_shape[..., np.newaxis, :]
+
+    if section_idx is None:
+        section_idx = [(0, x_shape.shape[-1])]
+
+    # --> conditions par cas mises sous la forme (n_cas, 1, 1) pour la diffusion sur (faces, panneaux)
+    def case_axis(value):
+        value = np.asarray(value, dtype=float)
+        return value.reshape((-1, 1, 1)) if value.ndim else value
+
+    inf_cst = {key: case_axis(FreeStream[key]) for key in BATCH_KEYS}
+    n_cases = np.broadcast_shapes(*[np.shape(value) for value in inf_cst.values()], np.shape(case_axis(AoA)), y_shape.shape[:-2] or (1,))[0]
+
+    # --> géométrie (incidence par cas, vitesse locale, abscisse curviligne)
+    x_AoA, y_AoA, dev_angle = AoA_Effect(x_arr=x_faces, y_arr=y_shape, AoA=case_axis(AoA))
+    x_AoA, y_AoA, dev_angle = (np.broadcast_to(arr, (n_cases,) + y_shape.shape[-2:]) for arr in (x_AoA, y_AoA, dev_angle))
+    v_local = Get_Local_Velocity(v_inf=inf_cst["VITESSE"], EffectiveAngle=dev_angle)
+
+    curv_sections = [curv(x_arr=x_faces[..., start:stop], y_arr=y_AoA[..., start:stop]) for (start, stop) in section_idx]
+    ds_x = np.concatenate([ds for (ds, _) in curv_sections], axis=-1)
+    s_x = np.concatenate([s for (_, s) in curv_sections], axis=-1)
+
+    # --> paramètres thermodynamiques locaux (γ calculé une fois par cas)
+    gamma = Compute_Gamma(Mach=inf_cst["MACH"], Temperature=inf_cst["TEMPERATURE"], basic_gamma=basic_gamma)
+
+    Mach = {"MACH_INF": inf_cst["MACH"], "MACH_LOCAL": v_local / inf_cst["VITESSE DU SON"]}
+    Velocity = {"V_INF": inf_cst["VITESSE"], "V_LOCAL": v_local}
+
+    local_params = Get_Local_Params_Batch(inf_cst=inf_cst, Mach=Mach, Velocity=Velocity, deviation_angle=dev_angle, basic_gamma=basic_gamma, gamma=gamma)
+
+    # --> coefficients de pression et de frottement
+    Cp = Get_Pressure_Coeff_Batch(Mach=inf_cst["MACH"], inf_cst=inf_cst, P=local_params["PRESSION"])
+
+    Re = Reynolds(rho=inf_cst["MASSE VOLUMIQUE"], velocity=inf_cst["VITESSE"], viscosity=inf_cst["VISCOSITÉ"], s_x=s_x)
+    Cf = Get_Frot_Coeff(Reynold=Re, Mach=inf_cst["MACH"])
+
+    Temperature = {"LOCAL": local_params["TEMPERATURE"], "T_INF": inf_cst["TEMPERATURE"]}
+    tau_w = Get_Wall_Constraint_Batch(Mach=inf_cst["MACH"], Cf=Cf, rho=inf_cst["MASSE VOLUMIQUE"], velocity=inf_cst["VITESSE"], Temperature=Temperature)
+
+    # --> traînée et portance
+    Cd_frott, Cd_press, Cd_wave = Get_Drag_Coeff_Batch(tau_w=tau_w, Cp=Cp, x_arr=x_faces, ds_x_arr=ds_x,
+                                                       inf_cst=inf_cst, dev_angle=dev_angle, gamma=gamma)
+
+    Cd_tot, Cd_tot_frott, Cd_tot_pression, Cd_tot_wave = Get_Total_Drag(Cd_frott=Surface_Dict(Cd_frott), Cd_press=Surface_Dict(Cd_press),
+                                                                         Cd_wave=Surface_Dict(Cd_wave))
+
+    CL_x, Cl_x_upper, Cl_x_lower = Get_LiftCoeff(Cp_dict=Surface_Dict(Cp), ds_dict=Surface_Dict(ds_x), theta_dict=Surface_Dict(dev_angle), x_arr=x_shape)
+
+    AeroResults = {
+        "X_AOA": x_AoA,
+        "Y_AOA": y_AoA,
+        "DEV_ANGLE": dev_angle,
+        "DS_X": ds_x,
+        "S_X": s_x,
+        "LOCAL_PARAMS": local_params,
+        "CP": Cp,
+        "RE": Re,
+        "CF": Cf,
+        "TAU_W": tau_w,
+        "DRAG": {"FROTTEMENT": Cd_frott, "PRESSION": Cd_press, "ONDE": Cd_wave},
+        "LIFT": np.stack([Cl_x_upper, Cl_x_lower], axis=-2),
+        "TOTAL": {"FROTTEMENT": Cd_tot_frott, "PRESSION": Cd_tot_pression, "ONDE": Cd_tot_wave, "ALL": Cd_tot, "PORTANCE": CL_x},
+        "GAMMA": np.broadcast_to(gamma, (n_cases, 1, 1)).reshape(n_cases),
+    }
+
+    return AeroResults
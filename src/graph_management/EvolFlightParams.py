@@ -0,0 +1,153 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.gridspec import GridSpec
+
+def Show_Atmosphere(ThermoProperties_dict, Z):
+    """
+    Affiche l'évolution des paramètres atmosphériques en fonction de l'altitude.
+
+    Cette fonction trace, sur une figure 2x2, la température, la vitesse du son, la pression
+    et la masse volumique calculées par `Compute_ThermoProperties`.
+
+    Paramètres :
+    ------------
+    ThermoProperties_dict : dict
+        Dictionnaire retourné par `Compute_ThermoProperties` :
+        - 'TEMPERATURE' : Tableau des températures (K).
+        - 'PRESSION' : Tableau des pressions (Pa).
+        - 'MASSE VOLUMIQUE' : Tableau des masses volumiques (kg/m³).
+        - 'VITESSE DU SON' : Tableau des vitesses du son (m/s).
+    Z : array-like
+        Altitudes (m) auxquelles les propriétés ont été évaluées.
+    """
+    Z_km = np.asarray(Z) * 1e-3
+
+    temperatures_arr = ThermoProperties_dict["TEMPERATURE"]
+    vitesse_son_arr = ThermoProperties_dict["VITESSE DU SON"]
+    pressure_arr = ThermoProperties_dict["PRESSION"]
+    density_arr = ThermoProperties_dict["MASSE VOLUMIQUE"]
+
+    fig, axs = plt.subplots(2, 2, figsize=(14, 11), sharey=True, gridspec_kw={'wspace': 0.3})
+
+    axs[0, 0].plot(temperatures_arr, Z_km, color='navy', linewidth=1.5)
+    axs[0, 0].set_xlabel("Température [$K$]", fontsize=12)
+    axs[0, 0].set_ylabel("Altitude [$km$]", fontsize=12)
+    axs[0, 0].set_title("Évolution de la température en fonction de l'altitude", fontsize=14)
+    axs[0, 0].grid(True, linestyle="-.", alpha=0.7)
+    axs[0, 0].spines['top'].set_visible(False)
+    axs[0, 0].spines['right'].set_visible(False)
+
+    axs[0, 1].plot(vitesse_son_arr, Z_km, color='darkred', linewidth=1.5)
+    axs[0, 1].set_xlabel(r"Vitesse du son [$m.s^{-1}$]", fontsize=12)
+    axs[0, 1].set_title("Évolution de la vitesse du son en fonction de l'altitude", fontsize=14)
+    axs[0, 1].grid(True, linestyle="--", alpha=0.7)
+    axs[0, 1].spines['top'].set_visible(False)
+    axs[0, 1].spines['right'].set_visible(False)
+
+    axs[1, 0].plot(pressure_arr, Z_km, color='purple', linewidth=1.5)
+    axs[1, 0].set_xlabel("Pression [$Pa$]", fontsize=12)
+    axs[1, 0].set_ylabel("Altitude [$km$]", fontsize=12)
+    axs[1, 0].set_title("Évolution de la pression en fonction de l'altitude", fontsize=14)
+    axs[1, 0].grid(True, linestyle="-.", alpha=0.7)
+    axs[1, 0].spines['top'].set_visible(False)
+    axs[1, 0].spines['right'].set_visible(False)
+
+    axs[1, 1].plot(density_arr, Z_km, color='darkgreen', linewidth=1.5)
+    axs[1, 1].set_xlabel(r"Masse volumique du son [$kg.m^{-3}$]", fontsize=12)
+    axs[1, 1].set_title("Évolution de la masse volumique en fonction de l'altitude", fontsize=14)
+    axs[1, 1].grid(True, linestyle="--", alpha=0.7)
+    axs[1, 1].spines['top'].set_visible(False)
+    axs[1, 1].spines['right'].set_visible(False)
+
+    layer_labels = ["Troposphère", "Stratosphère", "Mésosphère", "Thermosphère"]
+    layer_altitudes = [11.019, 50, 85, 110]
+
+    for ax in axs.flat:
+        for i, label in enumerate(layer_labels):
+            ax.axhline(layer_altitudes[i], color='gray', linestyle=":", alpha=0.6)
+            ax.text(ax.get_xlim()[1], layer_altitudes[i] - 2, label, fontsize=10, color="gray",
+                    verticalalignment='top', horizontalalignment='right')
+
+    axs[0, 0].set_xlim(min(temperatures_arr) - 10, max(temperatures_arr) + 10)
+    axs[0, 1].set_xlim(min(vitesse_son_arr) - 5, max(vitesse_son_arr) + 5)
+
+    plt.suptitle("Évolution des paramètres Atmosphériques en Fonction de l'Altitude", fontsize=16)
+    plt.show()
+
+def Show_RelativeSpeed(Pos):
+    """
+    Affiche l'évolution de l'altitude et de la vitesse relative d'Ariane 5 en fonction du temps.
+
+    Paramètres :
+    ------------
+    Pos : dict
+        Dictionnaire retourné par `Compute_RelativeSpeed` :
+        - 'ALTITUDE' : Tableau des altitudes interpolées.
+        - 'VITESSE' : Tableau des vitesses interpolées (m/s).
+        - 'TEMPS' : Tableau du temps (s).
+    """
+    x = Pos["TEMPS"]
+    y_alt = Pos["ALTITUDE"]
+    y_vit = Pos["VITESSE"]
+
+    fig = plt.figure(figsize=(14, 6))
+    gs = GridSpec(1, 2, figure=fig, width_ratios=[1, 1], wspace=0.3)
+
+    ax1 = fig.add_subplot(gs[0])
+    ax1.plot(x, y_alt, "y-", label="Altitude")
+    ax1.set_xlabel('Temps (s)')
+    ax1.set_ylabel('Altitude (m)')
+    ax1.set_title("Évolution de l'altitude d'Ariane 5 en fonction du temps")
+    ax1.legend()
+    ax1.grid('on', alpha=0.75, linestyle='-.')
+
+    ax2 = fig.add_subplot(gs[1])
+    ax2.plot(x, y_vit, "y-", label="Vitesse relative")
+    ax2.set_xlabel('Temps (s)')
+    ax2.set_ylabel('Vitesse (m/s)')
+    ax2.set_title("Évolution de la vitesse d'Ariane 5 en fonction du temps")
+    ax2.legend()
+    ax2.grid('on', alpha=0.75, linestyle='-.')
+
+    plt.show()
+
+def Show_MachAltitude(temps, Nbr_mach, altitude):
+    """
+    Affiche l'évolution du nombre de Mach et de l'altitude en fonction du temps.
+
+    Les régimes d'écoulement (subsonique incompressible, subsonique compressible, supersonique
+    et hypersonique) sont mis en évidence par des zones colorées.
+
+    Paramètres :
+    ------------
+    temps : array-like
+        Temps en secondes.
+    Nbr_mach : array-like
+        Nombre de Mach en fonction du temps.
+    altitude : array-like
+        Altitude en mètres.
+    """
+    fig, ax1 = plt.subplots(figsize=(14, 5))
+
+    ax1.plot(temps, Nbr_mach, label="Mach", color="red")
+    ax1.fill_between(temps, Nbr_mach, 5, where=Nbr_mach >= 5, color='purple', alpha=0.3, label="Hypersonique")
+    ax1.fill_between(temps, Nbr_mach, 1, where=(Nbr_mach >= 1) & (Nbr_mach <= 5), color='orange', alpha=0.3, label="Supersonique")
+    ax1.fill_between(temps, Nbr_mach, 0.1, where=(Nbr_mach <= 1), color='blue', alpha=0.3, label="Subsonique compressible")
+    ax1.fill_between(temps, Nbr_mach, 0, where=(Nbr_mach <= 0.1), color='red', alpha=0.3, label="Subsonique incompressible")
+    ax1.axhline(y=1, color='b', linestyle='-')
+    ax1.axhline(y=5, color='b', linestyle='-')
+    ax1.axhline(y=0.1, color='b', linestyle='-')
+    ax1.set_xlabel("Temps (s)")
+    ax1.set_ylabel("Nombre de Mach", color='red')
+    ax1.tick_params(axis='y', labelcolor='red')
+    ax1.legend(loc="upper left")
+    ax1.grid(True)
+
+    ax2 = ax1.twinx()
+    ax2.plot(temps, altitude, label="Altitude (m)", color="yellow")
+    ax2.set_ylabel("Altitude (m)", color='purple')
+    ax2.tick_params(axis='y', labelcolor='purple')
+    ax2.legend(loc="upper right")
+
+    plt.title("Graphique représentant le nombre de Mach et l'altitude en fonction du temps")
+    plt.show()
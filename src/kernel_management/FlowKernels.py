@@ -0,0 +1,265 @@
+import os
+import warnings
+import numpy as np
+
+    # ========================================= #
+    # ========== CHOIX DU BACKEND ============= #
+    # ========================================= #
+
+# "numpy" (par défaut), "numba" (boucles compilées) ou "check" (les deux, avec comparaison)
+KERNEL_BACKENDS = ("numpy", "numba", "check")
+KERNEL_BACKEND = os.environ.get("AERO_KERNEL_BACKEND", "numpy").lower()
+
+# tolérance relative utilisée par le mode "check"
+CHECK_RTOL = 1e-10
+
+_numba_kernels = None
+
+def Set_KernelBackend(backend):
+    """
+    Sélectionne le backend utilisé par les noyaux de calcul de l'écoulement.
+
+    Paramètres :
+    ------------
+    backend : str
+        - "numpy" : expressions NumPy (backend par défaut, toujours disponible).
+        - "numba" : chaque formule est compilée en une seule boucle (aucun tableau temporaire).
+        - "check" : les deux backends sont évalués et comparés (mode de vérification).
+
+    Remarque :
+    ----------
+    - Le backend initial peut être choisi avec la variable d'environnement `AERO_KERNEL_BACKEND`.
+    - Si Numba n'est pas installé, le backend "numpy" est conservé et un avertissement est émis.
+    """
+    global KERNEL_BACKEND
+
+    backend = backend.lower()
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Backend inconnu : {backend} (choix possibles : {', '.join(KERNEL_BACKENDS)})")
+
+    KERNEL_BACKEND = backend
+
+def Get_KernelBackend():
+    """
+    Retourne le nom du backend effectivement utilisé ("numpy", "numba" ou "check").
+    """
+    if KERNEL_BACKEND in ("numba", "check") and _load_numba() is None:
+        return "numpy"
+
+    return KERNEL_BACKEND if KERNEL_BACKEND in KERNEL_BACKENDS else "numpy"
+
+    # ====================================== #
+    # ========== NOYAUX NUMPY ============== #
+    # ====================================== #
+
+def _np_aftershock(mach_n, gamma):
+    mach_after_shock_n = np.sqrt((2 + (gamma - 1) * mach_n**2) / (2 * gamma * mach_n**2 + (1 - gamma)))
+    pression_ratio = ((2 * gamma) / (gamma + 1)) * mach_n**2 - ((gamma - 1) / (gamma + 1))
+    temperature_ratio = (1 + 0.5 * (gamma - 1) * mach_n**2) / (1 + 0.5 * (gamma - 1) * mach_after_shock_n**2)
+    rho_ratio = ((gamma + 1) * mach_n**2) / (2 + (gamma - 1) * mach_n**2)
+    return mach_after_shock_n, pression_ratio, temperature_ratio, rho_ratio
+
+def _np_prandtl_meyer(mach, gamma):
+    return np.sqrt((gamma + 1) / (gamma - 1)) * np.arctan(np.sqrt(((gamma - 1) / (gamma + 1)) * (mach**2 - 1))) - np.arctan(np.sqrt(mach**2 - 1))
+
+def _np_shock_residual(beta, Mach_inf, theta, gamma):
+    left_side = np.tan(theta)
+    right_side = 2 * ((Mach_inf * np.sin(beta))**2 - 1) / (np.tan(beta) * (2 + Mach_inf**2 * (gamma + np.cos(2 * beta))))
+    return left_side - right_side
+
+def _np_frot_coeff(Re, Mach):
+    Cf = np.empty(Re.shape)
+
+    # --> masques de régime (chaque corrélation n'est évaluée que sur ses propres panneaux)
+    subsonic = Mach < 1.0
+    laminar = subsonic & (Re < 5e5)
+    turbulent = subsonic & ~laminar
+    compressible = ~subsonic
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Cf[laminar] = 1.328 / np.sqrt(Re[laminar])
+        Cf[turbulent] = 0.072 / (Re[turbulent]**(1/5))
+        Cf[compressible] = 0.455 / ((np.log10(Re[compressible]))**2.58 * (1 + 0.144 * Mach[compressible]**2)**0.65)
+    return Cf
+
+def _np_isentropic(Mach_ref, Mach, gamma):
+    T_ratio = (1 + (gamma - 1) / 2 * Mach_ref**2) / (1 + (gamma - 1) / 2 * Mach**2)
+    return T_ratio, T_ratio**(gamma / (gamma - 1)), T_ratio**(1 / (gamma - 1))
+
+_NUMPY_KERNELS = {
+    "aftershock": _np_aftershock,
+    "prandtl_meyer": _np_prandtl_meyer,
+    "shock_residual": _np_shock_residual,
+    "frot_coeff": _np_frot_coeff,
+    "isentropic": _np_isentropic,
+}
+
+    # ====================================== #
+    # ========== NOYAUX NUMBA ============== #
+    # ====================================== #
+
+def _load_numba():
+    """
+    Compile (une seule fois, à la première utilisation) les noyaux Numba.
+
+    Retourne :
+    ----------
+    dict ou None
+        Noyaux compilés, ou None si Numba n'est pas installé.
+    """
+    global _numba_kernels
+
+    if _numba_kernels is not None:
+        return _numba_kernels or None
+
+    try:
+        from numba import njit
+    except ImportError:
+        warnings.warn("Numba n'est pas installé : le backend NumPy est utilisé.")
+        _numba_kernels = {}
+        return None
+
+    @njit(cache=True)
+    def aftershock(mach_n, gamma):
+        n = mach_n.size
+        mach_after, P_ratio, T_ratio, rho_ratio = np.empty(n), np.empty(n), np.empty(n), np.empty(n)
+        for i in range(n):
+            M2, g = mach_n[i]**2, gamma[i]
+            M2_after = (2 + (g - 1) * M2) / (2 * g * M2 + (1 - g))
+            mach_after[i] = np.sqrt(M2_after)
+            P_ratio[i] = ((2 * g) / (g + 1)) * M2 - ((g - 1) / (g + 1))
+            T_ratio[i] = (1 + 0.5 * (g - 1) * M2) / (1 + 0.5 * (g - 1) * M2_after)
+            rho_ratio[i] = ((g + 1) * M2) / (2 + (g - 1) * M2)
+        return mach_after, P_ratio, T_ratio, rho_ratio
+
+    @njit(cache=True)
+    def prandtl_meyer(mach, gamma):
+        n = mach.size
+        nu = np.empty(n)
+        for i in range(n):
+            g, M2 = gamma[i], mach[i]**2
+            nu[i] = np.sqrt((g + 1) / (g - 1)) * np.arctan(np.sqrt(((g - 1) / (g + 1)) * (M2 - 1))) - np.arctan(np.sqrt(M2 - 1))
+        return nu
+
+    @njit(cache=True)
+    def shock_residual(beta, Mach_inf, theta, gamma):
+        n = beta.size
+        residual = np.empty(n)
+        for i in range(n):
+            b, M = beta[i], Mach_inf[i]
+            residual[i] = np.tan(theta[i]) - 2 * ((M * np.sin(b))**2 - 1) / (np.tan(b) * (2 + M**2 * (gamma[i] + np.cos(2 * b))))
+        return residual
+
+    @njit(cache=True)
+    def frot_coeff(Re, Mach):
+        n = Re.size
+        Cf = np.empty(n)
+        for i in range(n):
+            if Mach[i] < 1.0:
+                if Re[i] < 5e5:
+                    Cf[i] = 1.328 / np.sqrt(Re[i])
+                else:
+                    Cf[i] = 0.072 / (Re[i]**(1/5))
+            else:
+                Cf[i] = 0.455 / ((np.log10(Re[i]))**2.58 * (1 + 0.144 * Mach[i]**2)**0.65)
+        return Cf
+
+    @njit(cache=True)
+    def isentropic(Mach_ref, Mach, gamma):
+        n = Mach.size
+        T_ratio, P_ratio, rho_ratio = np.empty(n), np.empty(n), np.empty(n)
+        for i in range(n):
+            g = gamma[i]
+            r = (1 + (g - 1) / 2 * Mach_ref[i]**2) / (1 + (g - 1) / 2 * Mach[i]**2)
+            T_ratio[i] = r
+            P_ratio[i] = r**(g / (g - 1))
+            rho_ratio[i] = r**(1 / (g - 1))
+        return T_ratio, P_ratio, rho_ratio
+
+    _numba_kernels = {
+        "aftershock": aftershock,
+        "prandtl_meyer": prandtl_meyer,
+        "shock_residual": shock_residual,
+        "frot_coeff": frot_coeff,
+        "isentropic": isentropic,
+    }
+
+    return _numba_kernels
+
+    # ======================================= #
+    # ========== APPEL DES NOYAUX =========== #
+    # ======================================= #
+
+def _run_numba(kernels, name, arrays):
+    shape = arrays[0].shape
+    flat = [np.ascontiguousarray(a, dtype=np.float64).ravel() for a in arrays]
+    out = kernels[name](*flat)
+
+    if isinstance(out, tuple):
+        return tuple(o.reshape(shape) for o in out)
+    return out.reshape(shape)
+
+def _run(name, *args):
+    """
+    Évalue le noyau `name` avec le backend sélectionné.
+
+    Les arguments sont diffusés (broadcasting) entre eux ; un résultat de dimension nulle
+    est retourné sous forme de scalaire.
+    """
+    arrays = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in args])
+    backend = Get_KernelBackend()
+
+    if backend == "numpy":
+        out = _NUMPY_KERNELS[name](*arrays)
+    elif backend == "numba":
+        out = _run_numba(_load_numba(), name, arrays)
+    else:
+        out = _NUMPY_KERNELS[name](*arrays)
+        out_numba = _run_numba(_load_numba(), name, arrays)
+        for ref, other in zip(out if isinstance(out, tuple) else (out,), out_numba if isinstance(out_numba, tuple) else (out_numba,)):
+            if not np.allclose(ref, other, rtol=CHECK_RTOL, atol=0.0, equal_nan=True):
+                raise RuntimeError(f"Écart entre les backends NumPy et Numba pour le noyau '{name}'.")
+
+    if isinstance(out, tuple):
+        return tuple(o[()] if o.ndim == 0 else o for o in out)
+    return out[()] if out.ndim == 0 else out
+
+def Kernel_AfterShock(mach_n, gamma):
+    """
+    Relations de choc droit appliquées au nombre de Mach normal.
+
+    Retourne :
+    ----------
+    tuple
+        (Mach normal après le choc, rapport de pression, rapport de température, rapport de masse volumique).
+    """
+    return _run("aftershock", mach_n, gamma)
+
+def Kernel_PrandtlMeyer(mach, gamma):
+    """
+    Fonction de Prandtl-Meyer ν(M) (en radians).
+    """
+    return _run("prandtl_meyer", mach, gamma)
+
+def Kernel_ShockResidual(beta, Mach_inf, theta, gamma):
+    """
+    Résidu de la relation θ-β-M : tan(θ) - 2 cot(β) (M² sin²β - 1) / (M² (γ + cos 2β) + 2).
+    """
+    return _run("shock_residual", beta, Mach_inf, theta, gamma)
+
+def Kernel_FrotCoeff(Re, Mach):
+    """
+    Coefficient de frottement (Blasius laminaire, loi de puissance turbulente ou loi compressible).
+    """
+    return _run("frot_coeff", Re, Mach)
+
+def Kernel_Isentropic(Mach_ref, Mach, gamma):
+    """
+    Rapports isentropiques entre un état de Mach `Mach` et un état de référence de Mach `Mach_ref`.
+
+    Retourne :
+    ----------
+    tuple
+        (T / T_ref, P / P_ref, rho / rho_ref).
+    """
+    return _run("isentropic", Mach_ref, Mach, gamma)
@@ -1,5 +1,41 @@
 import numpy as np
 
+def Gradient_Rows(f_arr, x_arr):
+    """
+    Dérivée df/dx le long du dernier axe, ligne par ligne (équivalent de `np.gradient` pour des profils empilés).
+
+    Paramètres :
+    ------------
+    f_arr : array-like
+        Valeurs à dériver, de forme (N,) ou (..., N).
+    x_arr : array-like
+        Abscisses, de forme (N,) (communes à toutes les lignes) ou de même forme que `f_arr`.
+
+    Retourne :
+    ----------
+    df_dx : np.ndarray
+        Dérivée de même forme que `f_arr` (différences centrées à l'intérieur, décentrées aux bords).
+    """
+    f_arr, x_arr = np.asarray(f_arr, dtype=float), np.asarray(x_arr, dtype=float)
+
+    if x_arr.ndim == 1:
+        return np.gradient(f_arr, x_arr, axis=-1)
+
+    # --> abscisses propres à chaque ligne : même schéma non uniforme que np.gradient
+    dx = np.diff(x_arr, axis=-1)
+    dx1, dx2 = dx[..., :-1], dx[..., 1:]
+
+    df_dx = np.empty(shape=np.broadcast_shapes(f_arr.shape, x_arr.shape))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = -(dx2) / (dx1 * (dx1 + dx2))
+        b = (dx2 - dx1) / (dx1 * dx2)
+        c = dx1 / (dx2 * (dx1 + dx2))
+        df_dx[..., 1:-1] = a * f_arr[..., :-2] + b * f_arr[..., 1:-1] + c * f_arr[..., 2:]
+        df_dx[..., 0] = (f_arr[..., 1] - f_arr[..., 0]) / dx[..., 0]
+        df_dx[..., -1] = (f_arr[..., -1] - f_arr[..., -2]) / dx[..., -1]
+
+    return df_dx
+
 def AoA_Effect(x_arr, y_arr, AoA):
     """
     Applique un angle d'attaque (AoA) à un profil et calcule l'angle de déviation local.
@@ -10,9 +46,9 @@ def AoA_Effect(x_arr, y_arr, AoA):
     Paramètres :
     ------------
     x_arr : array-like
-        Coordonnées x du profil avant rotation.
+        Coordonnées x du profil avant rotation, de forme (N,) ou (..., N).
     y_arr : array-like
-        Coordonnées y du profil avant rotation.
+        Coordonnées y du profil avant rotation, de forme (N,) ou (..., N) (faces empilées).
     AoA : float
         Angle d'attaque en degrés.
 
@@ -29,19 +65,20 @@ def AoA_Effect(x_arr, y_arr, AoA):
     ----------
     - La rotation est effectuée dans le sens trigonométrique.
     - Si des valeurs NaN apparaissent dans `dev_angle`, elles sont remplacées par la dernière valeur valide précédente.
+    - Les faces empilées (forme (2, N)) sont traitées en une seule passe, chaque ligne étant dérivée séparément.
     """
     AoA_rad = np.radians(AoA)
     
     x_AoA = x_arr * np.cos(AoA_rad) - y_arr * np.sin(AoA_rad)
     y_AoA = x_arr * np.sin(AoA_rad) + y_arr * np.cos(AoA_rad)
 
-    dy_dx = np.gradient(y_AoA, x_AoA)
+    dy_dx = Gradient_Rows(y_AoA, x_AoA)
     dev_angle = np.arctan(dy_dx)
 
-    index_nan = np.where(np.isnan(dev_angle))[0]
-    for idx in index_nan:
-        if idx > 0:
-            dev_angle[idx] = dev_angle[idx - 1]
+    # --> remplacement des NaN par la dernière valeur valide précédente (le long de chaque ligne)
+    index_valid = np.where(np.isnan(dev_angle), 0, np.arange(dev_angle.shape[-1]))
+    index_valid = np.maximum.accumulate(index_valid, axis=-1)
+    dev_angle = np.take_along_axis(dev_angle, index_valid, axis=-1)
 
     return x_AoA, y_AoA, dev_angle
 
@@ -74,9 +111,9 @@ def curv(x_arr, y_arr):
     Paramètres :
     ------------
     x_arr : array-like
-        Coordonnées x du profil.
+        Coordonnées x du profil, de forme (N,) ou (..., N).
     y_arr : array-like
-        Coordonnées y du profil.
+        Coordonnées y du profil, de forme (N,) ou (..., N) (faces empilées).
 
     Retourne :
     ----------
@@ -90,9 +127,9 @@ def curv(x_arr, y_arr):
     - La longueur de l'arc est calculée en utilisant la norme du gradient de `y_arr` par rapport à `x_arr`.
     - La fonction `np.cumsum(ds_x)` est utilisée pour obtenir la longueur totale accumulée.
     """
-    dy_dx = np.gradient(y_arr, x_arr)
-    dx = np.gradient(x_arr)
+    dy_dx = Gradient_Rows(y_arr, x_arr)
+    dx = np.gradient(x_arr, axis=-1)
 
     ds_x = np.sqrt(1 + (dy_dx)**2) * dx
 
-    return ds_x, np.cumsum(ds_x)
\ No newline at end of file
+    return ds_x, np.cumsum(ds_x, axis=-1)
\ No newline at end of file
@@ -1,12 +1,12 @@
+import os
 import matplotlib.pyplot as plt
 
 from CAO_management.vectors_2D import Get_2D_vectors
-from CAO_management.STL_to_CSV import Get_CSV
-from CAO_management.TriangleAndSegment import TransformCSV
+from CAO_management.STL_to_CSV import STL_DIR
+from CAO_management.TriangleAndSegment import TransformSTL
 from CAO_management.ShowFigure import ShowLaunchersFigure
 
-csv_file = Get_CSV(stl_name="ArianeV.stl", csv_name="ArianeV.csv")
-triangles_ArianeV, segments_ArianeV = TransformCSV(csv_file=csv_file, Y_FIXE=0.0)
+triangles_ArianeV, segments_ArianeV = TransformSTL(stl_file=os.path.join(STL_DIR, "ArianeV.stl"), Y_FIXE=0.0)
 Z_launcher, X_launcher = ShowLaunchersFigure(trianglesLauncher=triangles_ArianeV, segmentsLauncher=segments_ArianeV)
 
 x_shape, y_upper_, y_lower_ = Get_2D_vectors()
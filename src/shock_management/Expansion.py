@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.optimize import root_scalar, newton
+from kernel_management.FlowKernels import Kernel_PrandtlMeyer
 
 def PrandtlMeyer(mach, gamma):
     """
@@ -20,7 +21,7 @@ def PrandtlMeyer(mach, gamma):
     float
         L'angle de Prandtl-Meyer (en radians).
     """
-    return np.sqrt((gamma + 1) / (gamma - 1)) * np.arctan(np.sqrt(((gamma - 1) / (gamma + 1)) * (mach**2 - 1))) - np.arctan(np.sqrt(mach**2 - 1))
+    return Kernel_PrandtlMeyer(mach, gamma)
 
 def inv_PrandtlMeyer(mach, gamma, nu):
     """
@@ -85,6 +86,69 @@ def solve_mach_from_nu(nu_target, mach_guess, gamma):
     """
     return safe_newton(inv_PrandtlMeyer, mach_guess, args=(gamma, nu_target))
 
+def Get_Mach_From_PrandtlMeyer(nu, gamma, tol=1e-12, maxiter=20):
+    """
+    Inverse la fonction de Prandtl-Meyer (ν → M) pour un tableau entier d'angles.
+
+    L'estimation initiale est l'approximation explicite de Hall (1975), puis quelques itérations
+    de Newton vectorisées sont appliquées simultanément à tous les éléments, avec la dérivée
+    analytique dν/dM = sqrt(M² - 1) / (M (1 + (γ-1)/2 M²)).
+
+    Paramètres :
+    ------------
+    nu : float ou array-like
+        Angle(s) de Prandtl-Meyer cible(s) (en radians).
+    gamma : float ou array-like
+        Rapport des capacités thermiques (Cp/Cv) du gaz.
+    tol : float, optionnel (par défaut = 1e-12)
+        Tolérance sur le résidu |ν(M) - ν| (radians).
+    maxiter : int, optionnel (par défaut = 20)
+        Nombre maximal d'itérations de Newton.
+
+    Retourne :
+    ----------
+    mach : np.ndarray
+        Nombre de Mach correspondant à chaque angle (infini si ν ≥ ν_max).
+    converged : np.ndarray
+        Masque booléen des éléments ayant convergé.
+
+    Remarque :
+    ----------
+    - ν_max = π/2 (sqrt((γ+1)/(γ-1)) - 1) correspond à une détente jusqu'au vide (M → ∞).
+    - Pour ν ≤ 0, le nombre de Mach retourné vaut 1.
+    """
+    nu, gamma = np.broadcast_arrays(np.asarray(nu, dtype=float), np.asarray(gamma, dtype=float))
+    shape = nu.shape
+    nu, gamma = nu.ravel(), gamma.ravel()
+    nu_max = 0.5 * np.pi * (np.sqrt((gamma + 1) / (gamma - 1)) - 1)
+
+    valid = nu < nu_max
+    nu_c = np.clip(nu, 0.0, nu_max)
+
+        # --> approximation explicite de Hall (ν ≥ ν_max masqué : y = 1 annulerait le dénominateur)
+    y = (np.where(valid, nu_c, 0.0) / nu_max)**(2 / 3)
+    mach = (1 + 1.3604 * y + 0.0962 * y**2 - 0.5127 * y**3) / (1 - 0.6722 * y - 0.3278 * y**2)
+    mach = np.where(valid, np.maximum(mach, 1.0), np.inf)
+
+        # --> itérations de Newton vectorisées
+    converged = ~valid | (nu_c <= 0)
+    mach = np.where(nu_c <= 0, 1.0, mach)
+    for _ in range(maxiter):
+        active = ~converged
+        if not np.any(active):
+            break
+
+        M, g = mach[active], gamma[active]
+        residual = PrandtlMeyer(M, g) - nu_c[active]
+        slope = np.sqrt(M**2 - 1) / (M * (1 + 0.5 * (g - 1) * M**2))
+        mach[active] = np.maximum(M - residual / np.maximum(slope, 1e-300), 1 + 0.5 * (M - 1))
+
+        converged[active] = np.abs(residual) < tol
+
+    converged &= valid
+
+    return mach.reshape(shape), converged.reshape(shape)
+
 def max_PrandtlMeyer_Mach(gamma, mach_max=20):
     """ 
     Calcule la valeur maximale de la fonction de Prandtl-Meyer pour un Mach donné.
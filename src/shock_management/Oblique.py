@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.optimize import fsolve
+from kernel_management.FlowKernels import Kernel_ShockResidual
 
 def ShockAngleEquation(beta, Mach_inf, theta, gamma):
     """
@@ -25,17 +25,96 @@ def ShockAngleEquation(beta, Mach_inf, theta, gamma):
         Différence entre les deux côtés de l'équation du choc oblique.
         Cette valeur doit être minimisée pour obtenir l'angle de choc β correct.
     """
-    left_side = np.tan(theta)
-    right_side = 2 * ((Mach_inf * np.sin(beta))**2 - 1) / (np.tan(beta) * (2 + Mach_inf**2 * (gamma + np.cos(2 * beta))))
-    return left_side - right_side
+    return Kernel_ShockResidual(beta, Mach_inf, theta, gamma)
 
 
+def Get_ShockAngle_Weak(Mach_inf, theta_array, gamma=1.4):
+    """
+    Calcule l'angle de choc β de la solution faible pour un tableau d'angles de déviation θ.
+
+    La relation θ-β-M est résolue de façon exacte et entièrement vectorisée à l'aide de la
+    solution analytique de l'équation cubique en tan(β) (forme trigonométrique de Thompson),
+    sans appel à un solveur scalaire : la solution est ensuite affinée par trois itérations
+    de Newton appliquées simultanément à tout le tableau.
+
+    Paramètres :
+    ------------
+    Mach_inf : float ou array_like
+        Nombre de Mach de l'écoulement en amont (diffusé avec `theta_array`).
+    theta_array : array_like
+        Tableau contenant les valeurs d'angle de déviation θ (en radians).
+    gamma : float ou array_like, optionnel
+        Rapport des capacités thermiques (Cp/Cv) du gaz. Valeur par défaut : 1.4.
+
+    Retourne :
+    ----------
+    beta : numpy.ndarray
+        Angles de choc β (en radians) de la branche faible.
+        - Pour θ ≤ 0, β est égal à l'angle de Mach arcsin(1/M) (onde de Mach).
+        - Pour un choc détaché, β vaut 90 degrés (choc droit).
+    detached : numpy.ndarray
+        Masque booléen des panneaux pour lesquels le choc est détaché (θ > θ_max(M)).
+
+    Remarque :
+    ----------
+    - Avec λ² = (M²-1)² - 3(1 + (γ-1)/2 M²)(1 + (γ+1)/2 M²) tan²θ et
+      χ = ((M²-1)³ - 9(1 + (γ-1)/2 M²)(1 + (γ-1)/2 M² + (γ+1)/4 M⁴) tan²θ) / λ³,
+      le choc est détaché si λ² ≤ 0 ou χ < -1.
+    - tan β = (M² - 1 + 2λ cos((4π + arccos χ)/3)) / (3 (1 + (γ-1)/2 M²) tan θ).
+    - Pour θ → 0, cette expression perd sa précision par annulation : le point de départ de Newton est
+      alors l'approximation des petites déviations β ≈ μ + (γ+1) M² θ / (4 (M² - 1)) si son résidu est plus faible.
+    """
+    Mach_inf, theta, gamma = np.broadcast_arrays(
+        np.asarray(Mach_inf, dtype=float), np.asarray(theta_array, dtype=float), np.asarray(gamma, dtype=float)
+    )
+
+    M2 = Mach_inf**2
+    tan_theta = np.tan(np.maximum(theta, 0.0))
+    a = 1 + 0.5 * (gamma - 1) * M2
+
+    lambda2 = (M2 - 1)**2 - 3 * a * (1 + 0.5 * (gamma + 1) * M2) * tan_theta**2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lam = np.sqrt(np.where(lambda2 > 0, lambda2, 1.0))
+        chi = ((M2 - 1)**3 - 9 * a * (a + 0.25 * (gamma + 1) * M2**2) * tan_theta**2) / lam**3
+
+        detached = (theta > 0) & ((lambda2 <= 0) | (chi < -1) | (Mach_inf <= 1))
+        attached = (theta > 0) & ~detached
+
+        tan_beta = (M2 - 1 + 2 * lam * np.cos((4 * np.pi + np.arccos(np.clip(chi, -1.0, 1.0))) / 3)) / (3 * a * tan_theta)
+        mach_angle = np.arcsin(np.clip(1 / Mach_inf, -1.0, 1.0))
+
+        # --> pour θ → 0 la forme analytique perd sa précision (annulation) : on lui préfère,
+        #     lorsqu'elle est meilleure, l'approximation des petites déviations
+        beta_linear = mach_angle + 0.25 * (gamma + 1) * M2 * theta / (M2 - 1)
+        beta_cubic = np.clip(np.arctan(tan_beta), mach_angle, 0.5 * np.pi)
+        use_linear = np.abs(ShockAngleEquation(beta_linear, Mach_inf, theta, gamma)) < np.abs(ShockAngleEquation(beta_cubic, Mach_inf, theta, gamma))
+
+    beta = np.where(attached, np.where(use_linear, beta_linear, beta_cubic), mach_angle)
+
+    # --> itérations de Newton vectorisées pour affiner la solution (dérivée analytique du membre de droite)
+    for _ in range(3):
+        sin_b, cos_b = np.sin(beta), np.cos(beta)
+        num = 2 * (cos_b / sin_b) * (M2 * sin_b**2 - 1)
+        den = M2 * (gamma + np.cos(2 * beta)) + 2
+        d_num = -2 * (M2 * sin_b**2 - 1) / sin_b**2 + 4 * M2 * cos_b**2
+        d_den = -2 * M2 * np.sin(2 * beta)
+        slope = (d_num * den - num * d_den) / den**2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            residual = ShockAngleEquation(beta, Mach_inf, theta, gamma)
+        step = np.where(attached & (slope > 0), residual / np.where(slope > 0, slope, 1.0), 0.0)
+        beta = np.clip(beta + step, mach_angle, 0.5 * np.pi)
+
+    beta = np.where(detached, np.radians(90), beta)
+
+    return beta, detached
+
 def Get_ShockAngle_Vectorized(Mach_inf, theta_array, gamma=1.4):
     """
     Calcule l'angle de choc β pour un tableau d'angles de déviation θ.
 
-    Cette fonction utilise la méthode `fsolve` pour résoudre l'équation de l'angle de choc 
-    pour chaque valeur de θ dans un tableau.
+    Cette fonction s'appuie sur `Get_ShockAngle_Weak`, qui résout la relation θ-β-M 
+    de manière analytique pour l'ensemble du tableau en une seule passe.
 
     Paramètres :
     ------------
@@ -50,16 +129,9 @@ def Get_ShockAngle_Vectorized(Mach_inf, theta_array, gamma=1.4):
     ----------
     numpy.ndarray
         Tableau contenant les angles de choc β (en radians) correspondant à chaque θ donné.
-        Si la solution dépasse 90 degrés ou est inférieure à 0 degré, elle est remplacée par 90 degrés.
+        Si le choc est détaché, la valeur est remplacée par 90 degrés.
     """
-    beta_init = np.radians(30)  # Valeur initiale pour la résolution de l'équation
-
-    beta_solutions = np.array([
-        fsolve(ShockAngleEquation, beta_init, args=(Mach_inf, theta, gamma))[0] for theta in theta_array
-    ])
-    
-    # Correction des valeurs aberrantes
-    beta_solutions[(beta_solutions > np.radians(90)) | (beta_solutions < np.radians(0))] = np.radians(90)
+    beta_solutions, _ = Get_ShockAngle_Weak(Mach_inf, theta_array, gamma)
 
     return beta_solutions
 
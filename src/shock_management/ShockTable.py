@@ -0,0 +1,394 @@
+import os
+import hashlib
+import numpy as np
+from shock_management.Oblique import Get_ShockAngle_Weak
+
+# Table θ-β-M optionnelle. La solution analytique `Get_ShockAngle_Weak` reste la voie par défaut et la plus
+# rapide pour des requêtes ponctuelles (environ 0.2 s pour 200 000 points) : la table ne devient intéressante
+# qu'une fois construite et raffinée, puis rechargée depuis le disque (environ 0.1 s pour les mêmes points).
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "shock_tables")
+
+# nombre maximal de cellules raffinées par appel vectorisé (borne la mémoire temporaire)
+REFINE_BATCH = 1024
+
+# nombre maximal de cellules raffinées par requête : les points des cellules restantes sont évalués exactement
+REFINE_PER_QUERY = 256
+
+# version du contrôle d'erreur des cellules, incluse dans l'empreinte des fichiers de cache
+TABLE_VERSION = 2
+
+def _exact_beta(Mach_inf, theta, gamma):
+    """
+    Évalue la solution exacte de la branche faible, les chocs détachés étant notés NaN.
+    """
+    beta, detached = Get_ShockAngle_Weak(Mach_inf, theta, gamma)
+    return np.where(detached, np.nan, beta)
+
+def _cell_coords(axes, pts):
+    """
+    Localise des points dans une grille régulière 3D.
+
+    Paramètres :
+    ------------
+    axes : tuple de np.ndarray
+        Axes (Mach, θ, γ) de la grille, réguliers et croissants.
+    pts : tuple de np.ndarray
+        Coordonnées (Mach, θ, γ) des points, de même forme.
+
+    Retourne :
+    ----------
+    idx : np.ndarray
+        Indices entiers (3, n) de la cellule contenant chaque point.
+    frac : np.ndarray
+        Coordonnées locales (3, n) dans la cellule, comprises entre 0 et 1.
+    inside : np.ndarray
+        Masque des points situés dans les bornes de la grille.
+    """
+    idx = np.empty(shape=(3, pts[0].size), dtype=np.intp)
+    frac = np.empty(shape=(3, pts[0].size))
+    inside = np.ones(shape=pts[0].size, dtype=bool)
+
+    for d, (axis, p) in enumerate(zip(axes, pts)):
+        step = axis[1] - axis[0]
+        u = (p.ravel() - axis[0]) / step
+        inside &= (u >= 0) & (u <= len(axis) - 1)
+        i = np.clip(np.floor(u).astype(np.intp), 0, len(axis) - 2)
+        idx[d] = i
+        frac[d] = np.clip(u - i, 0.0, 1.0)
+
+    return idx, frac, inside
+
+def _trilinear(values, idx, frac, slot=None):
+    """
+    Interpolation trilinéaire vectorisée à partir des indices de cellule et des coordonnées locales.
+
+    Si `slot` est fourni, `values` est une pile de sous-grilles et `slot` désigne, pour chaque point,
+    la sous-grille à utiliser. Les sommets sont lus par indexation à plat du tableau.
+    """
+    n_i, n_j, n_k = values.shape[-3:]
+    flat_values = values.reshape(-1)
+
+    base = (idx[0] * n_j + idx[1]) * n_k + idx[2]
+    if slot is not None:
+        base = base + slot * (n_i * n_j * n_k)
+    u, v, w = frac
+
+    c00 = flat_values[base] * (1 - w) + flat_values[base + 1] * w
+    c01 = flat_values[base + n_k] * (1 - w) + flat_values[base + n_k + 1] * w
+    c10 = flat_values[base + n_j * n_k] * (1 - w) + flat_values[base + n_j * n_k + 1] * w
+    c11 = flat_values[base + n_j * n_k + n_k] * (1 - w) + flat_values[base + n_j * n_k + n_k + 1] * w
+
+    return (c00 * (1 - v) + c01 * v) * (1 - u) + (c10 * (1 - v) + c11 * v) * u
+
+def _corner_mean(values):
+    """
+    Moyenne des 8 sommets de chaque cellule (interpolation trilinéaire au centre), sur les trois derniers axes.
+    """
+    n_i, n_j, n_k = values.shape[-3:]
+    mean = 0.0
+    for di in (0, 1):
+        for dj in (0, 1):
+            for dk in (0, 1):
+                mean = mean + 0.125 * values[..., di:n_i - 1 + di, dj:n_j - 1 + dj, dk:n_k - 1 + dk]
+
+    return mean
+
+# poids de l'interpolation linéaire selon un axe aux positions 0, 1/2 et 1 d'une cellule : (décalage du sommet, poids)
+_HALF_WEIGHTS = {0: ((0, 1.0),), 1: ((0, 0.5), (1, 0.5)), 2: ((1, 1.0),)}
+
+def _cell_state(fine, tol):
+    """
+    Classe les cellules d'une grille selon la qualité de l'interpolation trilinéaire.
+
+    `fine` contient la solution exacte sur la grille de demi-pas (2n - 1 points par axe) : les nœuds de la
+    grille sont ses points d'indices pairs. L'erreur d'interpolation est contrôlée, pour chaque cellule, aux
+    19 points de demi-pas qui ne sont pas des sommets (centre, milieux des 6 faces et des 12 arêtes), avec
+    une marge de sécurité : une cellule n'est résolue que si l'erreur y est au plus tol / 2.
+
+    Retourne :
+    ----------
+    np.ndarray (int8)
+        - 0 : cellule résolue (erreur ≤ tol / 2 aux points de contrôle).
+        - 1 : cellule à raffiner (erreur > tol / 2, ou détachement sur une partie des points).
+        - 2 : cellule entièrement détachée (tous les sommets détachés).
+    """
+    nodes = fine[..., ::2, ::2, ::2]
+    n_i, n_j, n_k = nodes.shape[-3:]
+
+    ok = True
+    for a in (0, 1, 2):
+        for b in (0, 1, 2):
+            for c in (0, 1, 2):
+                if a % 2 == b % 2 == c % 2 == 0:
+                    continue
+
+                interp = 0.0
+                for di, wi in _HALF_WEIGHTS[a]:
+                    for dj, wj in _HALF_WEIGHTS[b]:
+                        for dk, wk in _HALF_WEIGHTS[c]:
+                            interp = interp + wi * wj * wk * nodes[..., di:n_i - 1 + di, dj:n_j - 1 + dj, dk:n_k - 1 + dk]
+
+                exact = fine[..., a:a + 2 * (n_i - 1):2, b:b + 2 * (n_j - 1):2, c:c + 2 * (n_k - 1):2]
+                with np.errstate(invalid="ignore"):
+                    ok = ok & (np.abs(interp - exact) <= 0.5 * tol)
+
+    detached = _corner_mean(np.isnan(nodes).astype(float)) == 1.0
+
+    return np.where(ok, 0, np.where(detached, 2, 1)).astype(np.int8)
+
+def Build_ShockTable(Mach_range=(1.05, 20.0), theta_range=(0.0, np.radians(50)), gamma_range=(1.05, 1.67),
+                     shape=(128, 128, 16), tol=1e-4, refine=4, prerefine=True):
+    """
+    Construit une table θ-β-M tridimensionnelle (Mach × θ × γ) de la branche faible.
+
+    Les valeurs aux nœuds sont obtenues avec la solution exacte `Get_ShockAngle_Weak`.
+    Chaque cellule dont l'erreur d'interpolation estimée dépasse `tol` (typiquement près
+    de la limite de détachement, où β varie brutalement) est raffinée dès la construction,
+    ou à la demande lors des requêtes si `prerefine` est faux.
+
+    Paramètres :
+    ------------
+    Mach_range : tuple, optionnel
+        Bornes du nombre de Mach amont.
+    theta_range : tuple, optionnel
+        Bornes de l'angle de déviation θ (radians).
+    gamma_range : tuple, optionnel
+        Bornes du rapport des capacités thermiques γ.
+    shape : tuple, optionnel
+        Nombre de nœuds selon (Mach, θ, γ).
+    tol : float, optionnel (par défaut = 1e-4)
+        Erreur absolue tolérée sur β (radians).
+    refine : int, optionnel (par défaut = 4)
+        Facteur de subdivision, selon chaque axe, des cellules raffinées.
+    prerefine : bool, optionnel (par défaut = True)
+        Raffine toutes les cellules marquées pendant la construction.
+
+    Retourne :
+    ----------
+    table : dict
+        Contient :
+        - "AXES" : Axes (Mach, θ, γ) de la grille grossière.
+        - "BETA" : Angles de choc β aux nœuds (NaN si le choc est détaché).
+        - "STATE" : État de chaque cellule (0 résolue, 1 à raffiner, 2 détachée).
+        - "SLOT" : Indice de la sous-grille de chaque cellule raffinée (-1 sinon).
+        - "SUB_BETA", "SUB_STATE" : Sous-grilles des cellules déjà raffinées.
+        - "TOL", "REFINE" : Paramètres de construction.
+
+    Remarque :
+    ----------
+    - L'erreur est contrôlée, dans chaque cellule (grossière ou raffinée), au centre et aux milieux des
+      faces et des arêtes, avec une marge de sécurité (erreur ≤ tol / 2 en ces points). Ce contrôle par
+      échantillonnage n'est pas une borne stricte : sur 200 000 requêtes aléatoires dans les bornes par
+      défaut, l'erreur maximale observée reste inférieure à `tol`.
+    - Avec les paramètres par défaut, la grille de demi-pas compte environ 2 millions de points (2 s environ)
+      et le pré-raffinement environ 100 000 cellules (70 s environ). Ce coût n'est payé qu'une fois :
+      `Load_ShockTable` enregistre la table raffinée et la recharge ensuite.
+    - Sans pré-raffinement, chaque requête raffine au plus `REFINE_PER_QUERY` cellules (0.2 s environ de raffinement) ;
+      les autres points non résolus sont évalués exactement.
+    """
+    axes = tuple(np.linspace(lo, hi, n) for (lo, hi), n in zip((Mach_range, theta_range, gamma_range), shape))
+    half_axes = [np.linspace(axis[0], axis[-1], 2 * len(axis) - 1) for axis in axes]
+    fine = _exact_beta(*np.meshgrid(*half_axes, indexing="ij"))
+
+    table = {
+        "AXES": axes,
+        "BETA": fine[::2, ::2, ::2].copy(),
+        "STATE": _cell_state(fine, tol),
+        "SLOT": np.full(shape=tuple(n - 1 for n in shape), fill_value=-1, dtype=np.intp),
+        "SUB_BETA": np.empty(shape=(0, refine + 1, refine + 1, refine + 1)),
+        "SUB_STATE": np.empty(shape=(0, refine, refine, refine), dtype=np.int8),
+        "TOL": float(tol),
+        "REFINE": int(refine),
+    }
+
+    if prerefine:
+        cells = np.stack(np.nonzero(table["STATE"] == 1))
+        for start in range(0, cells.shape[1], REFINE_BATCH):
+            _refine_cells(table, cells[:, start:start + REFINE_BATCH])
+
+    return table
+
+def _refine_cells(table, cells):
+    """
+    Construit, en un seul appel vectorisé, les sous-grilles d'un ensemble de cellules
+    et les ajoute à la table.
+
+    Paramètres :
+    ------------
+    table : dict
+        Table θ-β-M (modifiée en place).
+    cells : np.ndarray
+        Indices (3, n) des cellules à raffiner.
+    """
+    n_sub = table["REFINE"]
+    half_nodes = np.linspace(0.0, 1.0, 2 * n_sub + 1)
+
+    def sub_points(s):
+        pts = []
+        for d, (axis, c) in enumerate(zip(table["AXES"], cells)):
+            shape = [1, 1, 1]
+            shape[d] = len(s)
+            lo = axis[c].reshape(-1, 1, 1, 1)
+            step = (axis[c + 1] - axis[c]).reshape(-1, 1, 1, 1)
+            pts.append(lo + step * s.reshape(shape))
+        return np.broadcast_arrays(*pts)
+
+    fine = _exact_beta(*sub_points(half_nodes))
+    values = fine[:, ::2, ::2, ::2]
+    state = _cell_state(fine, table["TOL"])
+
+    start = len(table["SUB_BETA"])
+    table["SUB_BETA"] = np.concatenate([table["SUB_BETA"], values])
+    table["SUB_STATE"] = np.concatenate([table["SUB_STATE"], state])
+    table["SLOT"][cells[0], cells[1], cells[2]] = np.arange(start, start + cells.shape[1])
+
+def Get_ShockAngle_Table(table, Mach_inf, theta_array, gamma=1.4, max_refine=REFINE_PER_QUERY):
+    """
+    Calcule l'angle de choc β de la branche faible par interpolation dans une table θ-β-M.
+
+    Les points situés dans une cellule résolue sont interpolés (trilinéaire). Les cellules non
+    résolues (table construite sans pré-raffinement) sont raffinées à la première requête qui les
+    atteint, au plus `max_refine` par requête, puis conservées dans la table. Les points qui restent
+    non résolus (choc détaché tout proche, cellule au-delà du quota de raffinement) ou qui sortent de
+    la table sont évalués exactement par `Get_ShockAngle_Weak`.
+
+    Paramètres :
+    ------------
+    table : dict
+        Table retournée par `Build_ShockTable` ou `Load_ShockTable`.
+    Mach_inf : float ou array_like
+        Nombre de Mach de l'écoulement en amont.
+    theta_array : array_like
+        Angles de déviation θ (en radians).
+    gamma : float ou array_like, optionnel
+        Rapport des capacités thermiques. Valeur par défaut : 1.4.
+    max_refine : int, optionnel (par défaut = `REFINE_PER_QUERY`)
+        Nombre maximal de cellules raffinées pendant la requête.
+
+    Retourne :
+    ----------
+    beta : numpy.ndarray
+        Angles de choc β (en radians), 90 degrés si le choc est détaché.
+    detached : numpy.ndarray
+        Masque booléen des chocs détachés.
+    """
+    Mach_inf, theta, gamma = np.broadcast_arrays(
+        np.asarray(Mach_inf, dtype=float), np.asarray(theta_array, dtype=float), np.asarray(gamma, dtype=float)
+    )
+    pts = (Mach_inf.ravel(), theta.ravel(), gamma.ravel())
+
+    beta = np.full(shape=Mach_inf.size, fill_value=np.nan)
+    idx, frac, inside = _cell_coords(table["AXES"], pts)
+    state = np.where(inside, table["STATE"][idx[0], idx[1], idx[2]], -1)
+
+        # --> cellules grossières résolues
+    ok = state == 0
+    beta[ok] = _trilinear(table["BETA"], idx[:, ok], frac[:, ok])
+
+        # --> cellules raffinées (construites à la demande)
+    pending = np.flatnonzero(state == 1)
+    if pending.size:
+        cell_idx = idx[:, pending]
+        new_cells = np.unique(cell_idx[:, table["SLOT"][cell_idx[0], cell_idx[1], cell_idx[2]] < 0], axis=1)[:, :max_refine]
+        for start in range(0, new_cells.shape[1], REFINE_BATCH):
+            _refine_cells(table, new_cells[:, start:start + REFINE_BATCH])
+
+        n_sub = table["REFINE"]
+        slot = table["SLOT"][cell_idx[0], cell_idx[1], cell_idx[2]]
+        u = frac[:, pending] * n_sub
+        sub_idx = np.clip(np.floor(u).astype(np.intp), 0, n_sub - 1)
+        sub_frac = u - sub_idx
+
+        good = slot >= 0
+        good[good] = table["SUB_STATE"][slot[good], sub_idx[0, good], sub_idx[1, good], sub_idx[2, good]] == 0
+        beta[pending[good]] = _trilinear(table["SUB_BETA"], sub_idx[:, good], sub_frac[:, good], slot=slot[good])
+
+        # --> solution exacte pour les points restants (détachement, hors table)
+    remaining = np.isnan(beta)
+    exact, detached = Get_ShockAngle_Weak(pts[0][remaining], pts[1][remaining], pts[2][remaining])
+    beta[remaining] = exact
+
+    detached_all = np.zeros(shape=beta.shape, dtype=bool)
+    detached_all[remaining] = detached
+
+    return beta.reshape(Mach_inf.shape), detached_all.reshape(Mach_inf.shape)
+
+def _table_file(table_dir, Mach_range, theta_range, gamma_range, shape, tol, refine):
+    """
+    Chemin du fichier de cache d'une table, nommé d'après l'empreinte de ses paramètres.
+    """
+    signature = repr((TABLE_VERSION, tuple(map(float, Mach_range)), tuple(map(float, theta_range)), tuple(map(float, gamma_range)),
+                      tuple(shape), float(tol), int(refine)))
+    key = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+
+    return os.path.join(TABLE_DIR if table_dir is None else table_dir, f"shock_{key}.npz")
+
+def Save_ShockTable(table, table_dir=None):
+    """
+    Enregistre une table θ-β-M (y compris les cellules déjà raffinées) au format `.npz`.
+
+    Paramètres :
+    ------------
+    table : dict
+        Table retournée par `Build_ShockTable` ou `Load_ShockTable`.
+    table_dir : str, optionnel
+        Répertoire du cache. Par défaut `docs/shock_tables`.
+
+    Retourne :
+    ----------
+    str
+        Chemin du fichier enregistré.
+    """
+    axes = table["AXES"]
+    table_file = _table_file(table_dir, (axes[0][0], axes[0][-1]), (axes[1][0], axes[1][-1]), (axes[2][0], axes[2][-1]),
+                             table["BETA"].shape, table["TOL"], table["REFINE"])
+    os.makedirs(os.path.dirname(table_file), exist_ok=True)
+
+    # écriture dans un fichier temporaire puis renommage atomique (processus concurrents)
+    tmp_file = f"{table_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as file:
+        np.savez_compressed(
+            file,
+            mach_axis=axes[0], theta_axis=axes[1], gamma_axis=axes[2],
+            beta=table["BETA"], state=table["STATE"], slot=table["SLOT"],
+            sub_beta=table["SUB_BETA"], sub_state=table["SUB_STATE"],
+            tol=table["TOL"], refine=table["REFINE"],
+        )
+    os.replace(tmp_file, table_file)
+
+    return table_file
+
+def Load_ShockTable(Mach_range=(1.05, 20.0), theta_range=(0.0, np.radians(50)), gamma_range=(1.05, 1.67),
+                    shape=(128, 128, 16), tol=1e-4, refine=4, prerefine=True, table_dir=None):
+    """
+    Charge une table θ-β-M depuis le cache disque, ou la construit et l'enregistre si elle n'existe pas.
+
+    Les paramètres sont ceux de `Build_ShockTable`. Les cellules raffinées lors d'une session
+    précédente (et enregistrées avec `Save_ShockTable`) sont rechargées.
+
+    Retourne :
+    ----------
+    table : dict
+        Table utilisable avec `Get_ShockAngle_Table`.
+    """
+    table_file = _table_file(table_dir, Mach_range, theta_range, gamma_range, shape, tol, refine)
+
+    if not os.path.exists(table_file):
+        table = Build_ShockTable(Mach_range, theta_range, gamma_range, shape, tol, refine, prerefine)
+        Save_ShockTable(table, table_dir)
+        return table
+
+    with np.load(table_file) as data:
+        table = {
+            "AXES": (data["mach_axis"], data["theta_axis"], data["gamma_axis"]),
+            "BETA": data["beta"],
+            "STATE": data["state"],
+            "SLOT": data["slot"],
+            "SUB_BETA": data["sub_beta"],
+            "SUB_STATE": data["sub_state"],
+            "TOL": float(data["tol"]),
+            "REFINE": int(data["refine"]),
+        }
+
+    return table
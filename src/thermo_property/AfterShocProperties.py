@@ -1,4 +1,4 @@
-import numpy as np
+from kernel_management.FlowKernels import Kernel_AfterShock
 
 def AfterShock_var(mach_n, P_down, T_down, rho_down, gamma):
     """
@@ -28,21 +28,17 @@ def AfterShock_var(mach_n, P_down, T_down, rho_down, gamma):
         - `"TEMPERATURE"` : Température après le choc (K).
         - `"MASSE VOLUMIQUE"` : Masse volumique après le choc (kg/m³).
         - `"MACH"` : Nombre de Mach normalisé après le choc.
+
+    Remarque :
+    ----------
+    - Les rapports sont évalués par `Kernel_AfterShock` (backend NumPy ou Numba, voir `FlowKernels`).
     """
 
-    # --> Nombre de Mach après le choc
-    mach_after_shock_n = np.sqrt((2 + (gamma - 1) * mach_n**2) / (2 * gamma * mach_n**2 + (1 - gamma)))
+    # --> Rapports de choc droit (Mach après le choc, pression, température, masse volumique)
+    mach_after_shock_n, pression_ratio, temperature_ratio, rho_ratio = Kernel_AfterShock(mach_n, gamma)
 
-    # --> Rapport de pression
-    pression_ratio = ((2 * gamma) / (gamma + 1)) * mach_n**2 - ((gamma - 1) / (gamma + 1))
     P_shock = pression_ratio * P_down
-
-    # --> Rapport de température
-    temperature_ratio = (1 + 0.5 * (gamma - 1) * mach_n**2) / (1 + 0.5 * (gamma - 1) * mach_after_shock_n**2)
     T_shock = temperature_ratio * T_down
-
-    # --> Rapport de masse volumique
-    rho_ratio = ((gamma + 1) * mach_n**2) / (2 + (gamma - 1) * mach_n**2)
     rho_shock = rho_ratio * rho_down
 
     # Dictionnaire contenant les valeurs après le choc
@@ -0,0 +1,183 @@
+import os
+import hashlib
+import warnings
+import numpy as np
+from thermo_property.thermo_properties import Compute_ThermoProperties, temperature_layer, pressure_layer, density_layer
+
+TABLE_KEYS = ["ALTITUDE", "TEMPERATURE", "PRESSION", "MASSE VOLUMIQUE", "VITESSE DU SON"]
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "docs", "atmosphere_tables")
+
+def _table_key(Z_min, Z_max, rtol):
+    """
+    Calcule l'empreinte (hash) identifiant une table atmosphérique.
+
+    L'empreinte dépend des définitions des couches (température, pression, masse volumique),
+    de l'intervalle d'altitude et de la tolérance demandée : toute modification d'une couche
+    invalide automatiquement les tables déjà enregistrées.
+
+    Retourne :
+    ----------
+    str
+        Empreinte hexadécimale (16 caractères).
+    """
+    signature = repr((temperature_layer, pressure_layer, density_layer, float(Z_min), float(Z_max), float(rtol)))
+    return hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+
+def _table_error(Z, values):
+    """
+    Évalue l'erreur d'interpolation linéaire au milieu de chaque intervalle de la table.
+
+    Paramètres :
+    ------------
+    Z : np.ndarray
+        Altitudes de la table (m), triées.
+    values : dict
+        Propriétés tabulées aux altitudes `Z` (sortie de `Compute_ThermoProperties`).
+
+    Retourne :
+    ----------
+    Z_mid : np.ndarray
+        Milieux des intervalles.
+    err : np.ndarray
+        Erreur relative maximale (toutes propriétés confondues) de chaque intervalle.
+    """
+    Z_mid = 0.5 * (Z[:-1] + Z[1:])
+    exact = Compute_ThermoProperties(Z_mid)
+
+    err = np.zeros(shape=len(Z_mid))
+    for key in TABLE_KEYS[1:]:
+        approx = 0.5 * (values[key][:-1] + values[key][1:])
+        scale = np.maximum(np.abs(exact[key]), 1e-6 * np.max(np.abs(values[key])) + 1e-300)
+        err = np.maximum(err, np.abs(approx - exact[key]) / scale)
+
+    return Z_mid, err
+
+def Build_AtmosphereTable(rtol=1e-5, Z_min=0.0, Z_max=110000.0, n_init=64, dZ_min=1e-2, max_iter=40):
+    """
+    Construit une table atmosphérique dont l'erreur d'interpolation linéaire est bornée.
+
+    La table part d'une grille grossière contenant les frontières des couches, puis les
+    intervalles dont l'erreur au milieu dépasse `rtol` (par rapport au modèle analytique
+    par couches) sont coupés en deux jusqu'à convergence.
+
+    Paramètres :
+    ------------
+    rtol : float, optionnel (par défaut = 1e-5)
+        Erreur relative maximale tolérée sur chaque propriété.
+    Z_min, Z_max : float, optionnel
+        Bornes de la table en mètres.
+    n_init : int, optionnel (par défaut = 64)
+        Nombre de points de la grille initiale uniforme.
+    dZ_min : float, optionnel (par défaut = 1e-2)
+        Largeur minimale d'un intervalle (m) : les discontinuités du modèle ne sont pas raffinées au-delà.
+    max_iter : int, optionnel (par défaut = 40)
+        Nombre maximal de passes de raffinement.
+
+    Retourne :
+    ----------
+    table : dict
+        Contient les tableaux 'ALTITUDE', 'TEMPERATURE', 'PRESSION', 'MASSE VOLUMIQUE'
+        et 'VITESSE DU SON', ainsi que 'ERREUR' (erreur relative maximale de la table retournée).
+
+    Remarque :
+    ----------
+    - Le profil de température présente de petits sauts entre certaines couches : l'erreur n'est
+      pas bornée dans les intervalles de largeur `dZ_min` qui contiennent ces sauts.
+    - Si `rtol` n'est pas atteinte après `max_iter` passes, un avertissement est émis.
+    """
+    boundaries = np.concatenate([
+        np.asarray(temperature_layer, dtype=float)[:, 0],
+        np.asarray(pressure_layer, dtype=float)[:, 0] * 1e3,
+        np.asarray(density_layer, dtype=float)[:, 0] * 1e3,
+    ])
+    boundaries = boundaries[(boundaries > Z_min) & (boundaries < Z_max)]
+    # --> un point juste avant chaque frontière isole les sauts éventuels du modèle
+    boundaries = np.concatenate([boundaries, boundaries - dZ_min])
+    Z = np.unique(np.concatenate([np.linspace(Z_min, Z_max, n_init), boundaries]))
+
+    values = Compute_ThermoProperties(Z)
+    for _ in range(max_iter):
+        Z_mid, err = _table_error(Z, values)
+        refinable = np.diff(Z) > 2 * dZ_min
+
+        bad = (err > rtol) & refinable
+        if not np.any(bad):
+            break
+
+        Z = np.sort(np.concatenate([Z, Z_mid[bad]]))
+        values = Compute_ThermoProperties(Z)
+    else:
+        # --> `max_iter` atteint : erreur recalculée sur la grille retournée
+        Z_mid, err = _table_error(Z, values)
+        refinable = np.diff(Z) > 2 * dZ_min
+
+    err_max = float(np.max(err[refinable], initial=0.0))
+    if err_max > rtol:
+        warnings.warn(f"Table atmosphérique : tolérance rtol = {rtol:g} non atteinte après {max_iter} passes (erreur {err_max:.3g}).")
+
+    table = {"ALTITUDE": Z, **values}
+    table["ERREUR"] = err_max
+
+    return table
+
+def Load_AtmosphereTable(rtol=1e-5, Z_min=0.0, Z_max=110000.0, table_dir=None):
+    """
+    Charge (ou construit puis enregistre) une table atmosphérique mise en cache sur disque.
+
+    La table est enregistrée au format `.npy` (tableau 5 x n) dans `table_dir`, sous un nom
+    dérivé de l'empreinte des couches atmosphériques. Elle est ensuite relue avec
+    `mmap_mode='r'` : plusieurs processus partagent ainsi les mêmes pages mémoire en lecture seule.
+
+    Paramètres :
+    ------------
+    rtol : float, optionnel (par défaut = 1e-5)
+        Erreur relative maximale tolérée (voir `Build_AtmosphereTable`).
+    Z_min, Z_max : float, optionnel
+        Bornes de la table en mètres.
+    table_dir : str, optionnel
+        Répertoire du cache. Par défaut `docs/atmosphere_tables`.
+
+    Retourne :
+    ----------
+    table : dict
+        Vues (sans copie) sur le fichier mappé : 'ALTITUDE', 'TEMPERATURE', 'PRESSION',
+        'MASSE VOLUMIQUE' et 'VITESSE DU SON'.
+    """
+    table_dir = TABLE_DIR if table_dir is None else table_dir
+    table_file = os.path.join(table_dir, f"atmosphere_{_table_key(Z_min, Z_max, rtol)}.npy")
+
+    if not os.path.exists(table_file):
+        table = Build_AtmosphereTable(rtol=rtol, Z_min=Z_min, Z_max=Z_max)
+        os.makedirs(table_dir, exist_ok=True)
+
+        # écriture dans un fichier temporaire puis renommage atomique (processus concurrents)
+        tmp_file = f"{table_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as file:
+            np.save(file, np.stack([table[key] for key in TABLE_KEYS]))
+        os.replace(tmp_file, table_file)
+
+    data = np.load(table_file, mmap_mode="r")
+
+    return {key: data[i] for i, key in enumerate(TABLE_KEYS)}
+
+def Interp_Atmosphere(table, Z):
+    """
+    Interpole les propriétés atmosphériques dans une table pour un tableau d'altitudes.
+
+    Paramètres :
+    ------------
+    table : dict
+        Table retournée par `Build_AtmosphereTable` ou `Load_AtmosphereTable`.
+    Z : float ou array-like
+        Altitudes en mètres (bornées aux limites de la table).
+
+    Retourne :
+    ----------
+    dict
+        'TEMPERATURE', 'PRESSION', 'MASSE VOLUMIQUE' et 'VITESSE DU SON', de même forme que `Z`.
+    """
+    Z = np.asarray(Z, dtype=float)
+    Z_table = table["ALTITUDE"]
+
+    return {key: np.interp(Z, Z_table, table[key]) for key in TABLE_KEYS[1:]}
@@ -1,24 +1,95 @@
+import numpy as np
+from functools import lru_cache
+
+def _gamma_rarefied(M_infty, T_infty, gamma_0=1.4, T_0=300, M_0=1, a=0.005, b=0.01, c=0.001, d=0.005, e=0.001):
+    """
+    Empirical rarefied-gas model, evaluated element-wise on broadcast arrays.
+    """
+    t, m = T_infty / T_0, M_infty / M_0
+
+    # Adjust gamma to ensure it remains within a physically plausible range
+    return np.maximum(1.05, gamma_0 - a * t - b * m - c * t**2 - d * m**2 - e * t * m)
+
 def calculate_gamma_rarefied(M_infty, T_infty, gamma_0=1.4, T_0=300, M_0=1, a=0.005, b=0.01, c=0.001, d=0.005, e=0.001):
     """
     Calculate the specific heat ratio (gamma) for a rarefied atmosphere using an empirical model.
 
     Parameters:
-    M_infty (float): Free-stream Mach number (should be >= 3)
-    T_infty (float): Free-stream temperature in Kelvin
+    M_infty (float or array): Free-stream Mach number (should be >= 3)
+    T_infty (float or array): Free-stream temperature in Kelvin
     gamma_0 (float): Reference specific heat ratio
     T_0 (float): Reference temperature in Kelvin
     M_0 (float): Reference Mach number
     a, b, c, d, e (float): Empirical coefficients
 
     Returns:
-    float: Calculated specific heat ratio (gamma)
+    float or array: Calculated specific heat ratio (gamma)
     """
-    if M_infty < 1:
+    M_infty, T_infty = np.asarray(M_infty, dtype=float), np.asarray(T_infty, dtype=float)
+
+    if np.any(M_infty < 1):
         raise ValueError("Mach number should be 3 or greater for supersonic/hypersonic flow.")
 
-    # Adjust gamma to ensure it remains within a physically plausible range
-    gamma = max(1.05, gamma_0 - a * (T_infty / T_0) - b * (M_infty / M_0) -
-                 c * (T_infty / T_0)**2 - d * (M_infty / M_0)**2 -
-                 e * (T_infty / T_0) * (M_infty / M_0))
+    gamma = _gamma_rarefied(M_infty, T_infty, gamma_0, T_0, M_0, a, b, c, d, e)
+
+    return gamma[()] if gamma.ndim == 0 else gamma
+
+def Compute_Gamma(Mach, Temperature, basic_gamma=1.4, Mach_rarefied=3.0):
+    """
+    Calcule le rapport des capacités thermiques γ, éventuellement panneau par panneau.
+
+    Paramètres :
+    ------------
+    Mach : float ou array-like
+        Nombre de Mach (de l'écoulement libre ou local, par panneau).
+    Temperature : float ou array-like
+        Température associée (K), diffusée (broadcasting) avec `Mach`.
+    basic_gamma : float, optionnel (par défaut = 1.4)
+        Valeur de γ utilisée lorsque Mach < `Mach_rarefied`.
+    Mach_rarefied : float, optionnel (par défaut = 3.0)
+        Nombre de Mach à partir duquel le modèle empirique d'atmosphère raréfiée est utilisé.
 
-    return gamma
\ No newline at end of file
+    Retourne :
+    ----------
+    gamma : float ou np.ndarray
+        Rapport des capacités thermiques (scalaire si les entrées sont scalaires).
+
+    Remarque :
+    ----------
+    - Contrairement à `calculate_gamma_rarefied`, aucune erreur n'est levée pour Mach < 1 :
+      le choix du modèle se fait élément par élément.
+    """
+    Mach, Temperature = np.broadcast_arrays(np.asarray(Mach, dtype=float), np.asarray(Temperature, dtype=float))
+
+    gamma = np.where(Mach < Mach_rarefied, basic_gamma, _gamma_rarefied(Mach, Temperature))
+
+    return gamma[()] if gamma.ndim == 0 else gamma
+
+@lru_cache(maxsize=1024)
+def _gamma_freestream(Mach_inf, T_inf, basic_gamma):
+    return float(Compute_Gamma(Mach_inf, T_inf, basic_gamma))
+
+def Get_Gamma(Mach_inf, T_inf, basic_gamma=1.4):
+    """
+    Retourne le γ d'un cas de vol, mémorisé à partir de l'état de l'écoulement libre.
+
+    Paramètres :
+    ------------
+    Mach_inf : float
+        Nombre de Mach de l'écoulement libre.
+    T_inf : float
+        Température de l'écoulement libre (K).
+    basic_gamma : float, optionnel (par défaut = 1.4)
+        Valeur de γ utilisée lorsque Mach < 3.
+
+    Retourne :
+    ----------
+    gamma : float
+        Rapport des capacités thermiques du cas.
+
+    Remarque :
+    ----------
+    - Le résultat est mis en cache sur le triplet (Mach_inf, T_inf, basic_gamma) : `Get_Local_Params`
+      et `Get_Drag_Coeff` partagent ainsi la même valeur sans la recalculer.
+    """
+    return _gamma_freestream(float(Mach_inf), float(T_inf), float(basic_gamma))
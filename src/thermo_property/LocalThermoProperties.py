@@ -1,9 +1,9 @@
 import numpy as np
 from thermo_property.AfterShocProperties import AfterShock_var
-from shock_management.Expansion import PrandtlMeyer, inv_PrandtlMeyer, solve_mach_from_nu
+from shock_management.Expansion import PrandtlMeyer, Get_Mach_From_PrandtlMeyer
 from shock_management.Oblique import Get_ShockAngle_Vectorized, Correct_Beta_Vector
-from scipy.optimize import newton
-from thermo_property.GammaManagement import calculate_gamma_rarefied
+from thermo_property.GammaManagement import Get_Gamma, Compute_Gamma
+from kernel_management.FlowKernels import Kernel_Isentropic
 
 from scipy.optimize import root_scalar
 
@@ -35,7 +35,7 @@ def Shock_Growth_S(M, n=2, k=0.1):
     """
     return ((M - 1)**n) / ((M - 1)**n + k)
 
-def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
+def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma, gamma=None):
     """
     Calcule les paramètres locaux thermodynamiques en fonction du régime d'écoulement.
 
@@ -58,6 +58,9 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
         Angles de déviation locaux en radians.
     basic_gamma : float
         Valeur de \(\gamma\) utilisée pour un écoulement standard.
+    gamma : float ou array-like, optionnel (par défaut = None)
+        Rapport des capacités thermiques déjà calculé pour le cas, scalaire ou par panneau
+        (voir `Compute_Gamma`). Si None, la valeur mémorisée `Get_Gamma` de l'écoulement libre est utilisée.
 
     Retourne :
     ----------
@@ -73,15 +76,21 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
       - Pour Mach < 0.3 : Écoulement subsonique incompressible (hypothèse de Bernoulli).
       - Pour 0.3 ≤ Mach < 1 : Écoulement subsonique compressible (formules isentropiques).
       - Pour 1 ≤ Mach < 1.2 : Interpolation entre régime subsonique et supersonique avec Shock Growth Model.
-      - Pour Mach ≥ 1.2 :
+      - Pour Mach ≥ 1.2, chaque panneau est traité selon le signe de son angle de déviation :
         - Méthode des chocs obliques si l'angle de déviation est positif.
-        - Méthode de Prandtl-Meyer si l'angle de déviation est négatif (zone d'expansion).
+        - Méthode de Prandtl-Meyer si l'angle de déviation est négatif ou nul (zone d'expansion).
+        Les deux sous-ensembles sont évalués chacun en une passe vectorisée, puis replacés dans
+        des tableaux préalloués : il n'est plus nécessaire de découper le profil en sections.
 
     - Dans le régime supersonique/hypersonique, la fonction appelle d'autres sous-fonctions :
       - `Get_ShockAngle_Vectorized` pour obtenir l'angle de choc.
       - `AfterShock_var` pour déterminer les conditions après le choc.
-      - `PrandtlMeyer` pour calculer l'expansion si nécessaire.
-    - Une gestion des erreurs est incluse pour assurer la robustesse du code.
+      - `PrandtlMeyer` et `Get_Mach_From_PrandtlMeyer` pour calculer l'expansion si nécessaire.
+    - Les relations isentropiques sont évaluées par `Kernel_Isentropic` (backend NumPy ou Numba).
+    - γ peut varier d'un panneau à l'autre (argument `gamma`) ; sinon il est calculé une seule fois
+      par cas et mémorisé (`Get_Gamma`), puis partagé avec `Get_Drag_Coeff`.
+    - Une détente au-delà de ν_max (détente jusqu'au vide) donne une pression, une température
+      et une masse volumique nulles.
 
     """
     P_inf = inf_cst["PRESSION"]
@@ -95,10 +104,10 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
     v_local = Velocity["V_LOCAL"]
 
 
-    if Mach_inf < 3:
-        gamma_mach = basic_gamma
+    if gamma is None:
+        gamma_mach = Get_Gamma(Mach_inf=Mach_inf, T_inf=T_inf, basic_gamma=basic_gamma)
     else:
-        gamma_mach = calculate_gamma_rarefied(M_infty=Mach_inf, T_infty=T_inf)
+        gamma_mach = np.asarray(gamma, dtype=float)
 
     if Mach_inf < 0.3:
         # régime subsonique incompressible
@@ -118,9 +127,11 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
     elif 0.3 <= Mach_inf and Mach_inf < 1:
         # régime subsonique compressible + transsonique (mach < 1)
 
-        P_local = P_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))**(gamma_mach / (gamma_mach - 1))
-        T_local = T_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))
-        rho_local = rho_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))**(1 / (gamma_mach - 1))
+        T_ratio, P_ratio, rho_ratio = Kernel_Isentropic(Mach_inf, Mach_local, gamma_mach)
+
+        P_local = P_inf * P_ratio
+        T_local = T_inf * T_ratio
+        rho_local = rho_inf * rho_ratio
 
         local_params = {
             "PRESSION": P_local,
@@ -135,13 +146,15 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
 
         S_M = Shock_Growth_S(Mach_local)
 
-        P_sub = P_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))**(gamma_mach / (gamma_mach - 1))
+        T_ratio, P_ratio, rho_ratio = Kernel_Isentropic(Mach_inf, Mach_local, gamma_mach)
+
+        P_sub = P_inf * P_ratio
         P_sup = P_inf * (1 - 0.2 * (Mach_local - 1))
 
-        T_sub = T_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))
+        T_sub = T_inf * T_ratio
         T_sup = T_inf * (1 - 0.2 * (Mach_local - 1))
 
-        rho_sub = rho_inf * ((1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * Mach_local**2))**(1 / (gamma_mach - 1))
+        rho_sub = rho_inf * rho_ratio
         rho_sup = rho_inf * (1 - 0.2 * (Mach_local - 1))
 
         P_local = P_sub + S_M * (P_sup - P_sub)
@@ -158,53 +171,167 @@ def Get_Local_Params(inf_cst, Mach, Velocity, deviation_angle, basic_gamma):
     
     elif 1.2 <= Mach_inf:
         # Régime supersonique + hypersonique
-            
-        if np.all(deviation_angle > 0): 
-            # --> méthode des chocs
 
-            shock_angle = Correct_Beta_Vector(Get_ShockAngle_Vectorized(Mach_inf, deviation_angle, gamma_mach))
-            mach_n = Mach_inf * np.sin(shock_angle)
+        deviation_angle = np.asarray(deviation_angle, dtype=float)
+        compression = deviation_angle > 0
+        expansion = ~compression
 
-            AfterShock = AfterShock_var(mach_n=mach_n, P_down=P_inf, T_down=T_inf, rho_down=rho_inf, gamma=gamma_mach)
+        P_local = np.empty(shape=deviation_angle.shape)
+        T_local = np.empty(shape=deviation_angle.shape)
+        rho_local = np.empty(shape=deviation_angle.shape)
 
-            local_params = {
-                "PRESSION": AfterShock["PRESSION"],
-                "TEMPERATURE": AfterShock["TEMPERATURE"],
-                "MASSE VOLUMIQUE": AfterShock["MASSE VOLUMIQUE"], 
-            }
+        # --> γ par panneau (un γ scalaire est simplement diffusé)
+        gamma_panel = np.broadcast_to(gamma_mach, deviation_angle.shape)
 
-            return local_params
+        if np.any(compression):
+            # --> méthode des chocs (panneaux en compression)
 
-        else:        
-            try:
-            # Régime supersonique + hypersonique
-        
-                # --> méthode Prandtl-Meyer
+            shock_angle = Correct_Beta_Vector(Get_ShockAngle_Vectorized(Mach_inf, deviation_angle[compression], gamma_panel[compression]))
+            mach_n = Mach_inf * np.sin(shock_angle)
 
-                mach_after = np.zeros(shape=len(deviation_angle))
-                deviation_angle = np.abs(deviation_angle)
+            AfterShock = AfterShock_var(mach_n=mach_n, P_down=P_inf, T_down=T_inf, rho_down=rho_inf, gamma=gamma_panel[compression])
 
-                for idx, theta in enumerate(deviation_angle):
-                    
-                    nu_before = PrandtlMeyer(mach=Mach_inf, gamma=gamma_mach)
-                    nu_after = nu_before + theta
-                    mach_after[idx] = newton(inv_PrandtlMeyer, Mach_inf, args=(gamma_mach, nu_after), maxiter=200)
+            P_local[compression] = AfterShock["PRESSION"]
+            T_local[compression] = AfterShock["TEMPERATURE"]
+            rho_local[compression] = AfterShock["MASSE VOLUMIQUE"]
 
-                T2_T1 = (1 + (gamma_mach - 1) / 2 * Mach_inf**2) / (1 + (gamma_mach - 1) / 2 * mach_after**2)
-                P2_P1 = T2_T1 ** (gamma_mach / (gamma_mach - 1))
-                rho2_rho1 = T2_T1 ** (1 / (gamma_mach - 1))
+        if np.any(expansion):
+            # --> méthode Prandtl-Meyer (panneaux en détente, inversion vectorisée ν → M)
 
-                local_params = {
-                    "PRESSION": P2_P1 * P_inf,
-                    "TEMPERATURE": T2_T1 * T_inf,
-                    "MASSE VOLUMIQUE": rho2_rho1 * rho_inf, 
-                }
+            gamma_exp = gamma_panel[expansion] if np.ndim(gamma_mach) else gamma_mach
+            nu_before = PrandtlMeyer(mach=Mach_inf, gamma=gamma_exp)
+            nu_after = nu_before + np.abs(deviation_angle[expansion])
+            mach_after, _ = Get_Mach_From_PrandtlMeyer(nu=nu_after, gamma=gamma_exp)
 
-                return local_params
-            
-            except Exception as e:
-                print(f"Erreur détectée : {e}")  # Optionnel : pour déboguer
-                return "CONSTANT"
+            T2_T1, P2_P1, rho2_rho1 = Kernel_Isentropic(Mach_inf, mach_after, gamma_exp)
+
+            P_local[expansion] = P2_P1 * P_inf
+            T_local[expansion] = T2_T1 * T_inf
+            rho_local[expansion] = rho2_rho1 * rho_inf
+
+        local_params = {
+            "PRESSION": P_local,
+            "TEMPERATURE": T_local,
+            "MASSE VOLUMIQUE": rho_local, 
+        }
+
+        return local_params
 
     else:
-        return np.nan
\ No newline at end of file
+        return np.nan
+
+def Get_Local_Params_Batch(inf_cst, Mach, Velocity, deviation_angle, basic_gamma, gamma=None):
+    """
+    Version par lots de `Get_Local_Params` : plusieurs conditions d'écoulement libre évaluées en un seul appel.
+
+    Paramètres :
+    ------------
+    inf_cst : dict
+        Conditions de l'écoulement libre ("PRESSION", "TEMPERATURE", "MASSE VOLUMIQUE"), sous forme de
+        tableaux diffusables avec les panneaux, typiquement de forme (n_cas, 1) ou (n_cas, 1, 1).
+    Mach : dict
+        - "MACH_INF" : Nombre de Mach de l'écoulement libre (un par cas, même convention de forme).
+        - "MACH_LOCAL" : Nombre de Mach local, de forme (n_cas, ..., N).
+    Velocity : dict
+        - "V_INF" : Vitesse de l'écoulement libre (un par cas).
+        - "V_LOCAL" : Vitesse locale, de forme (n_cas, ..., N).
+    deviation_angle : array-like
+        Angles de déviation locaux en radians, diffusables avec `Mach["MACH_LOCAL"]`.
+    basic_gamma : float
+        Valeur de \(\gamma\) utilisée pour un écoulement standard.
+    gamma : float ou array-like, optionnel (par défaut = None)
+        γ par cas ou par panneau. Si None, `Compute_Gamma` est évalué pour chaque cas.
+
+    Retourne :
+    ----------
+    local_params : dict
+        "PRESSION", "TEMPERATURE" et "MASSE VOLUMIQUE", de forme (n_cas, ..., N).
+
+    Remarque :
+    ----------
+    - Les cas sont regroupés par régime de Mach (mêmes seuils que `Get_Local_Params`) ; chaque régime
+      est évalué en une passe vectorisée sur l'ensemble des panneaux des cas concernés.
+    - `Correct_Beta_Vector` n'est pas appliqué : il compare β (en radians) à 90 et ne modifie donc
+      jamais le résultat de `Get_Local_Params`.
+    - Un cas dont le Mach n'est pas défini (NaN) donne des paramètres locaux NaN.
+    """
+    Mach_inf = np.asarray(Mach["MACH_INF"], dtype=float)
+    T_inf = np.asarray(inf_cst["TEMPERATURE"], dtype=float)
+
+    if gamma is None:
+        gamma = Compute_Gamma(Mach=Mach_inf, Temperature=T_inf, basic_gamma=basic_gamma)
+
+    P_inf, T_inf, rho_inf, Mach_inf, Mach_local, v_inf, v_local, deviation_angle, gamma = np.broadcast_arrays(
+        np.asarray(inf_cst["PRESSION"], dtype=float), T_inf, np.asarray(inf_cst["MASSE VOLUMIQUE"], dtype=float), Mach_inf,
+        np.asarray(Mach["MACH_LOCAL"], dtype=float), np.asarray(Velocity["V_INF"], dtype=float), np.asarray(Velocity["V_LOCAL"], dtype=float),
+        np.asarray(deviation_angle, dtype=float), np.asarray(gamma, dtype=float)
+    )
+
+    P_local = np.full(shape=Mach_inf.shape, fill_value=np.nan)
+    T_local = np.full(shape=Mach_inf.shape, fill_value=np.nan)
+    rho_local = np.full(shape=Mach_inf.shape, fill_value=np.nan)
+
+    # --> régime subsonique incompressible
+    m = Mach_inf < 0.3
+    if np.any(m):
+        P_local[m] = P_inf[m] + 0.5 * rho_inf[m] * (v_inf[m]**2 - v_local[m]**2)
+        T_local[m] = T_inf[m]
+        rho_local[m] = rho_inf[m]
+
+    # --> régime subsonique compressible
+    m = (0.3 <= Mach_inf) & (Mach_inf < 1)
+    if np.any(m):
+        T_ratio, P_ratio, rho_ratio = Kernel_Isentropic(Mach_inf[m], Mach_local[m], gamma[m])
+
+        P_local[m] = P_inf[m] * P_ratio
+        T_local[m] = T_inf[m] * T_ratio
+        rho_local[m] = rho_inf[m] * rho_ratio
+
+    # --> régime transsonique (Shock Growth Model)
+    m = (1 <= Mach_inf) & (Mach_inf < 1.2)
+    if np.any(m):
+        S_M = Shock_Growth_S(Mach_local[m])
+        T_ratio, P_ratio, rho_ratio = Kernel_Isentropic(Mach_inf[m], Mach_local[m], gamma[m])
+        sup_ratio = 1 - 0.2 * (Mach_local[m] - 1)
+
+        P_sub, T_sub, rho_sub = P_inf[m] * P_ratio, T_inf[m] * T_ratio, rho_inf[m] * rho_ratio
+        P_sup, T_sup, rho_sup = P_inf[m] * sup_ratio, T_inf[m] * sup_ratio, rho_inf[m] * sup_ratio
+
+        P_local[m] = P_sub + S_M * (P_sup - P_sub)
+        T_local[m] = T_sub + S_M * (T_sup - T_sub)
+        rho_local[m] = rho_sub + S_M * (rho_sup - rho_sub)
+
+    # --> régime supersonique + hypersonique : chocs obliques (compression) et Prandtl-Meyer (détente)
+    supersonic = Mach_inf >= 1.2
+    compression = supersonic & (deviation_angle > 0)
+    expansion = supersonic & ~(deviation_angle > 0)
+
+    if np.any(compression):
+        m = compression
+        shock_angle = Get_ShockAngle_Vectorized(Mach_inf[m], deviation_angle[m], gamma[m])
+        mach_n = Mach_inf[m] * np.sin(shock_angle)
+
+        AfterShock = AfterShock_var(mach_n=mach_n, P_down=P_inf[m], T_down=T_inf[m], rho_down=rho_inf[m], gamma=gamma[m])
+
+        P_local[m] = AfterShock["PRESSION"]
+        T_local[m] = AfterShock["TEMPERATURE"]
+        rho_local[m] = AfterShock["MASSE VOLUMIQUE"]
+
+    if np.any(expansion):
+        m = expansion
+        nu_before = PrandtlMeyer(mach=Mach_inf[m], gamma=gamma[m])
+        mach_after, _ = Get_Mach_From_PrandtlMeyer(nu=nu_before + np.abs(deviation_angle[m]), gamma=gamma[m])
+
+        T2_T1, P2_P1, rho2_rho1 = Kernel_Isentropic(Mach_inf[m], mach_after, gamma[m])
+
+        P_local[m] = P2_P1 * P_inf[m]
+        T_local[m] = T2_T1 * T_inf[m]
+        rho_local[m] = rho2_rho1 * rho_inf[m]
+
+    local_params = {
+        "PRESSION": P_local,
+        "TEMPERATURE": T_local,
+        "MASSE VOLUMIQUE": rho_local,
+    }
+
+    return local_params
@@ -1,6 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 
     # ========================================== #
     # ========== COUCHE ATMOSPHÉRIQUE ========== #
@@ -35,20 +33,66 @@ density_layer = [
     (50000, 0, 0)
 ]
 
+    # ============================================== #
+    # ========== TRAJECTOIRE DE RÉFÉRENCE ========== #
+    # ============================================== #
+
+# (temps [s], vitesse relative [m/s])
+velocity_profile = [
+    (0, 0), (11, 55.55), (22, 166.66), (33, 222), (44, 277.76), (55, 353),
+    (66, 395.016), (77, 512.5), (88, 777), (100, 1000), (125, 2000), (200, 2300)
+]
+
+# (temps [s], altitude [m])
+altitude_profile = [
+    (0, 0), (25, 2546), (50, 5538), (75, 15084), (100, 26923),
+    (125, 42552), (150, 61538), (175, 86000), (200, 107692)
+]
+
     # ============================================================================================ #
     # ========== CALCUL DE LA TEMPÉRATURE / VITESSE DU SON / PRESSION / MASSE VOLUMIQUE ========== #
     # ============================================================================================ #
 
+def _layer_lookup(Z, layers):
+    """
+    Détermine, pour chaque altitude, l'indice de la couche atmosphérique qui la contient.
+
+    La recherche est effectuée en une seule passe avec `np.searchsorted` sur les altitudes
+    de début de couche, puis les caractéristiques de chaque couche sont rassemblées par indexation.
+
+    Paramètres :
+    ------------
+    Z : float ou array-like
+        Altitude(s) dans la même unité que les bornes des couches.
+    layers : list de tuples
+        Liste des couches sous forme de triplets (Z_start, X_start, X_z).
+
+    Retourne :
+    ----------
+    Z_arr : np.ndarray
+        Altitudes converties en tableau de flottants.
+    idx : np.ndarray
+        Indice de la couche de chaque altitude (-1 si l'altitude est sous la première couche).
+    table : np.ndarray
+        Tableau (n_couches, 3) des caractéristiques des couches.
+    """
+    Z_arr = np.asarray(Z, dtype=float)
+    table = np.asarray(layers, dtype=float)
+    idx = np.searchsorted(table[:, 0], Z_arr, side="right") - 1
+
+    return Z_arr, idx, table
+
 def temperature(Z, layers):
     """
     Calcule la température en fonction de l'altitude.
 
     Cette fonction détermine la température locale en effectuant une interpolation 
-    linéaire entre les différentes couches atmosphériques.
+    linéaire entre les différentes couches atmosphériques. Elle accepte indifféremment
+    une altitude scalaire ou un tableau d'altitudes de forme quelconque.
 
     Paramètres :
     ------------
-    Z : float
+    Z : float ou array-like
         Altitude en mètres.
     layers : list de tuples
         Liste contenant les caractéristiques de chaque couche sous forme de triplet :
@@ -59,18 +103,20 @@ def temperature(Z, layers):
 
     Retourne :
     ----------
-    T : float
-        Température locale en Kelvin.
+    T : float ou np.ndarray
+        Température locale en Kelvin (même forme que `Z`).
+
+    Remarque :
+    ----------
+    - Au-delà de la dernière couche (ou sous la première), le gradient de la dernière couche est extrapolé.
     """
-    for i in range(len(layers) - 1):
-        Z_start, T_start, Tz = layers[i]
-        Z_next = layers[i + 1][0]
+    Z_arr, idx, table = _layer_lookup(Z, layers)
+    idx = np.where(idx < 0, len(table) - 1, idx)
 
-        if Z_start <= Z < Z_next:
-            return T_start + Tz * (Z - Z_start)
+    Z_start, T_start, Tz = table[idx, 0], table[idx, 1], table[idx, 2]
+    T = T_start + Tz * (Z_arr - Z_start)
 
-    Z_last, T_last, Tz_last = layers[-1]
-    return T_last + Tz_last * (Z - Z_last)
+    return T[()] if T.ndim == 0 else T
 
 def vitesse_son(gamma, R, T):
     """
@@ -97,10 +143,11 @@ def pressure(Z, layers):
     Calcule la pression en fonction de l'altitude.
 
     La pression est obtenue par interpolation exponentielle selon la stratification atmosphérique.
+    La fonction accepte une altitude scalaire ou un tableau d'altitudes de forme quelconque.
 
     Paramètres :
     ------------
-    Z : float
+    Z : float ou array-like
         Altitude en kilomètres.
     layers : list de tuples
         Liste contenant les caractéristiques de chaque couche sous forme de triplet :
@@ -111,27 +158,21 @@ def pressure(Z, layers):
 
     Retourne :
     ----------
-    P : float
-        Pression locale en Pascal.
+    P : float ou np.ndarray
+        Pression locale en Pascal (nulle en dehors des couches définies).
     """
-    for i in range(len(layers) - 1):
-        Z_start, P_start, Pz = layers[i]
-        Z_next = layers[i + 1][0]
-
-        if Z_start <= Z < Z_next:
-            return P_start * np.exp(Pz * (Z - Z_start))
-
-    return 0 
+    return _exponential_layer(Z, layers)
 
 def density(Z, layers):
     """
     Calcule la masse volumique de l'air en fonction de l'altitude.
 
     La masse volumique est obtenue par interpolation exponentielle selon la stratification atmosphérique.
+    La fonction accepte une altitude scalaire ou un tableau d'altitudes de forme quelconque.
 
     Paramètres :
     ------------
-    Z : float
+    Z : float ou array-like
         Altitude en kilomètres.
     layers : list de tuples
         Liste contenant les caractéristiques de chaque couche sous forme de triplet :
@@ -142,27 +183,88 @@ def density(Z, layers):
 
     Retourne :
     ----------
-    rho : float
-        Masse volumique de l'air en kg/m³.
+    rho : float ou np.ndarray
+        Masse volumique de l'air en kg/m³ (nulle en dehors des couches définies).
+    """
+    return _exponential_layer(Z, layers)
+
+def _exponential_layer(Z, layers):
     """
-    for i in range(len(layers) - 1):
-        Z_start, rho_start, rho_z = layers[i]
-        Z_next = layers[i + 1][0]
+    Évalue une loi exponentielle par couche, X = X_start * exp(X_z * (Z - Z_start)).
 
-        if Z_start <= Z < Z_next:
-            return rho_start * np.exp(rho_z * (Z - Z_start))
+    La dernière couche ne sert que de borne supérieure : toute altitude qui n'est pas
+    strictement comprise dans une couche définie renvoie 0.
+
+    Paramètres :
+    ------------
+    Z : float ou array-like
+        Altitude(s).
+    layers : list de tuples
+        Liste des couches (Z_start, X_start, X_z).
+
+    Retourne :
+    ----------
+    X : float ou np.ndarray
+        Grandeur évaluée (même forme que `Z`).
+    """
+    Z_arr, idx, table = _layer_lookup(Z, layers)
+    inside = (idx >= 0) & (idx < len(table) - 1)
+    idx = np.clip(idx, 0, len(table) - 1)
 
-    return 0 
+    Z_start, X_start, X_z = table[idx, 0], table[idx, 1], table[idx, 2]
+    X = np.where(inside, X_start * np.exp(X_z * (Z_arr - Z_start)), 0.0)
+
+    return X[()] if X.ndim == 0 else X
 
     # ================================= #
     # ========== PROPRIÉTÉES ========== #
     # ================================= #
 
+def Compute_ThermoProperties(Z=None):
+    """
+    Calcule les propriétés thermodynamiques de l'atmosphère en fonction de l'altitude.
+
+    Cette fonction ne fait aucun affichage et n'importe pas matplotlib : elle peut être utilisée
+    dans des calculs par lots ou côté serveur.
+
+    Paramètres :
+    ------------
+    Z : array-like, optionnel
+        Altitudes en mètres. Par défaut, 1000 points répartis entre 0 et 110 km.
+
+    Retourne :
+    ----------
+    ThermoProperties_dict : dict
+        Dictionnaire contenant :
+        - 'TEMPERATURE' : Tableau des températures (K).
+        - 'PRESSION' : Tableau des pressions (Pa).
+        - 'MASSE VOLUMIQUE' : Tableau des masses volumiques (kg/m³).
+        - 'VITESSE DU SON' : Tableau des vitesses du son (m/s).
+    """
+    if Z is None:
+        Z = np.linspace(0, 110000, 1000)
+    Z = np.asarray(Z, dtype=float)
+    Z_km = Z * 1e-3
+
+    temperatures_arr = temperature(Z, temperature_layer)
+    vitesse_son_arr = vitesse_son(1.4, (8.314/(28.966*1e-3)), temperatures_arr)
+    pressure_arr = pressure(Z_km, pressure_layer)
+    density_arr = density(Z_km, density_layer)
+
+    ThermoProperties_dict = {
+        'TEMPERATURE': np.asarray(temperatures_arr),
+        "PRESSION": np.asarray(pressure_arr),
+        "MASSE VOLUMIQUE": np.asarray(density_arr),
+        "VITESSE DU SON": np.asarray(vitesse_son_arr),
+    }
+
+    return ThermoProperties_dict
+
 def Get_ThermoProperties():
     """
     Génère et affiche les propriétés thermodynamiques en fonction de l'altitude.
 
-    Cette fonction calcule et affiche les évolutions de :
+    Cette fonction calcule (via `Compute_ThermoProperties`) et affiche les évolutions de :
     - La température
     - La vitesse du son
     - La pression
@@ -179,84 +281,32 @@ def Get_ThermoProperties():
         - 'MASSE VOLUMIQUE' : Tableau des masses volumiques (kg/m³).
         - 'VITESSE DU SON' : Tableau des vitesses du son (m/s).
     """
-    Z = np.linspace(0, 110000, 1000)
-    Z_km = Z * 1e-3
-
-    temperatures_arr = [temperature(z, temperature_layer) for z in Z]
-    vitesse_son_arr = [vitesse_son(1.4, (8.314/(28.966*1e-3)), T) for T in temperatures_arr]
-    pressure_arr = [pressure(z, pressure_layer) for z in Z_km]
-    density_arr = [density(z, density_layer) for z in Z_km]
-
-    fig, axs = plt.subplots(2, 2, figsize=(14, 11), sharey=True, gridspec_kw={'wspace': 0.3})
-
-    axs[0, 0].plot(temperatures_arr, Z_km, color='navy', linewidth=1.5)
-    axs[0, 0].set_xlabel("Température [$K$]", fontsize=12)
-    axs[0, 0].set_ylabel("Altitude [$km$]", fontsize=12)
-    axs[0, 0].set_title("Évolution de la température en fonction de l'altitude", fontsize=14)
-    axs[0, 0].grid(True, linestyle="-.", alpha=0.7)
-    axs[0, 0].spines['top'].set_visible(False)
-    axs[0, 0].spines['right'].set_visible(False)
-
-    axs[0, 1].plot(vitesse_son_arr, Z_km, color='darkred', linewidth=1.5)
-    axs[0, 1].set_xlabel(r"Vitesse du son [$m.s^{-1}$]", fontsize=12)
-    axs[0, 1].set_title("Évolution de la vitesse du son en fonction de l'altitude", fontsize=14)
-    axs[0, 1].grid(True, linestyle="--", alpha=0.7)
-    axs[0, 1].spines['top'].set_visible(False)
-    axs[0, 1].spines['right'].set_visible(False)
-
-    axs[1, 0].plot(pressure_arr, Z_km, color='purple', linewidth=1.5)
-    axs[1, 0].set_xlabel("Pression [$Pa$]", fontsize=12)
-    axs[1, 0].set_ylabel("Altitude [$km$]", fontsize=12)
-    axs[1, 0].set_title("Évolution de la pression en fonction de l'altitude", fontsize=14)
-    axs[1, 0].grid(True, linestyle="-.", alpha=0.7)
-    axs[1, 0].spines['top'].set_visible(False)
-    axs[1, 0].spines['right'].set_visible(False)
-
-    axs[1, 1].plot(density_arr, Z_km, color='darkgreen', linewidth=1.5)
-    axs[1, 1].set_xlabel(r"Masse volumique du son [$kg.m^{-3}$]", fontsize=12)
-    axs[1, 1].set_title("Évolution de la masse volumique en fonction de l'altitude", fontsize=14)
-    axs[1, 1].grid(True, linestyle="--", alpha=0.7)
-    axs[1, 1].spines['top'].set_visible(False)
-    axs[1, 1].spines['right'].set_visible(False)
-
-    layer_labels = ["Troposphère", "Stratosphère", "Mésosphère", "Thermosphère"]
-    layer_altitudes = [11.019, 50, 85, 110]
-
-    for ax in axs.flat:
-        for i, label in enumerate(layer_labels):
-            ax.axhline(layer_altitudes[i], color='gray', linestyle=":", alpha=0.6)
-            ax.text(ax.get_xlim()[1], layer_altitudes[i] - 2, label, fontsize=10, color="gray",
-                    verticalalignment='top', horizontalalignment='right')
-
-    axs[0, 0].set_xlim(min(temperatures_arr) - 10, max(temperatures_arr) + 10)
-    axs[0, 1].set_xlim(min(vitesse_son_arr) - 5, max(vitesse_son_arr) + 5)
-
-    plt.suptitle("Évolution des paramètres Atmosphériques en Fonction de l'Altitude", fontsize=16)
-    plt.show()
+    from graph_management.EvolFlightParams import Show_Atmosphere
 
-    ThermoProperties_dict = {
-        'TEMPERATURE': np.array(temperatures_arr),
-        "PRESSION": np.array(pressure_arr),
-        "MASSE VOLUMIQUE": np.array(density_arr),
-        "VITESSE DU SON": np.array(vitesse_son_arr),
-        # "ALTITUDE_Z": np.array(Z)
-    }
+    Z = np.linspace(0, 110000, 1000)
+    ThermoProperties_dict = Compute_ThermoProperties(Z)
+    Show_Atmosphere(ThermoProperties_dict=ThermoProperties_dict, Z=Z)
 
     return ThermoProperties_dict
 
-def Get_RelativeSpeed():
+def Compute_RelativeSpeed(temps=None):
     """
-    Génère et affiche l'évolution de l'altitude et de la vitesse relative d'Ariane 5.
+    Calcule l'évolution de l'altitude et de la vitesse relative d'Ariane 5, sans affichage.
 
     Cette fonction utilise une interpolation linéaire pour représenter :
     - L'évolution de l'altitude en fonction du temps.
     - L'évolution de la vitesse relative en fonction du temps.
 
+    Paramètres :
+    ------------
+    temps : array-like, optionnel
+        Instants d'évaluation (s). Par défaut, 1000 points répartis entre 0 et 200 s.
+
     Retourne :
     ----------
     Pos : dict
         Dictionnaire contenant :
-        - 'ALTITUDE' : Tableau des altitudes interpolées (m).
+        - 'ALTITUDE' : Tableau des altitudes interpolées (km).
         - 'VITESSE' : Tableau des vitesses interpolées (m/s).
         - 'TEMPS' : Tableau du temps (s).
     """
@@ -266,31 +316,10 @@ def Get_RelativeSpeed():
     xp_vit = [0, 11, 22, 33, 44, 55, 66, 77, 88, 100, 125, 200]
     yp_vit = [0, 55.55, 166.66, 222, 277.76, 353, 395.016, 512.5, 777, 1000, 2000, 2300]
 
-    x = np.linspace(0, 200, 1000)
+    x = np.linspace(0, 200, 1000) if temps is None else np.asarray(temps, dtype=float)
     y_alt = np.interp(x, xp_alt, yp_alt)
     y_vit = np.interp(x, xp_vit, yp_vit)
 
-    fig = plt.figure(figsize=(14, 6))
-    gs = GridSpec(1, 2, figure=fig, width_ratios=[1, 1], wspace=0.3)
-
-    ax1 = fig.add_subplot(gs[0])
-    ax1.plot(x, y_alt, "y-", label="Altitude")
-    ax1.set_xlabel('Temps (s)')
-    ax1.set_ylabel('Altitude (m)')
-    ax1.set_title("Évolution de l'altitude d'Ariane 5 en fonction du temps")
-    ax1.legend()
-    ax1.grid('on', alpha=0.75, linestyle='-.')
-
-    ax2 = fig.add_subplot(gs[1])
-    ax2.plot(x, y_vit, "y-", label="Vitesse relative")
-    ax2.set_xlabel('Temps (s)')
-    ax2.set_ylabel('Vitesse (m/s)')
-    ax2.set_title("Évolution de la vitesse d'Ariane 5 en fonction du temps")
-    ax2.legend()
-    ax2.grid('on', alpha=0.75, linestyle='-.')
-
-    plt.show()
-
     Pos = {
         "ALTITUDE": y_alt,
         "VITESSE": y_vit,
@@ -299,20 +328,106 @@ def Get_RelativeSpeed():
 
     return Pos
 
+def Get_RelativeSpeed():
+    """
+    Génère et affiche l'évolution de l'altitude et de la vitesse relative d'Ariane 5.
+
+    Les données sont calculées par `Compute_RelativeSpeed` puis tracées par `Show_RelativeSpeed`.
+
+    Retourne :
+    ----------
+    Pos : dict
+        Dictionnaire contenant :
+        - 'ALTITUDE' : Tableau des altitudes interpolées (km).
+        - 'VITESSE' : Tableau des vitesses interpolées (m/s).
+        - 'TEMPS' : Tableau du temps (s).
+    """
+    from graph_management.EvolFlightParams import Show_RelativeSpeed
+
+    Pos = Compute_RelativeSpeed()
+    Show_RelativeSpeed(Pos=Pos)
+
+    return Pos
+
     # =================================== #
     # ========== MACH ALTITUDE ========== #
     # =================================== #
 
-def Get_MachAltitude(ThermoProperties_dict):
+def Compute_FreeStream(temps):
     """
-    Calcule et affiche l'évolution du nombre de Mach et de l'altitude en fonction du temps.
+    Calcule les conditions de l'écoulement libre le long de la trajectoire de référence.
 
-    Cette fonction interpole les valeurs de température, vitesse du son et pression pour 
-    déterminer l'évolution :
+    Pour un tableau de temps de taille quelconque, la vitesse et l'altitude sont interpolées sur
+    `velocity_profile` et `altitude_profile`, puis l'atmosphère est évaluée directement à ces
+    altitudes (sans table intermédiaire). Tous les calculs sont vectorisés.
+
+    Paramètres :
+    ------------
+    temps : float ou array-like
+        Instants d'évaluation en secondes.
+
+    Retourne :
+    ----------
+    FreeStream : dict
+        Dictionnaire de tableaux de même forme que `temps` :
+        - 'TEMPS' : Temps (s).
+        - 'ALTITUDE' : Altitude (m).
+        - 'VITESSE' : Vitesse relative (m/s).
+        - 'TEMPERATURE' : Température (K).
+        - 'PRESSION' : Pression (Pa).
+        - 'MASSE VOLUMIQUE' : Masse volumique (kg/m³).
+        - 'VITESSE DU SON' : Vitesse du son (m/s).
+        - 'VISCOSITÉ' : Viscosité dynamique par la loi de Sutherland (Pa.s).
+        - 'MACH' : Nombre de Mach.
+        - 'PRESSION DYNAMIQUE' : Pression dynamique (Pa).
+
+    Remarque :
+    ----------
+    - Les clés reprennent celles du dictionnaire `inf_cst` utilisé dans le reste du code.
+    """
+    temps = np.asarray(temps, dtype=float)
+
+    xp_vit, yp_vit = np.asarray(velocity_profile, dtype=float).T
+    xp_alt, yp_alt = np.asarray(altitude_profile, dtype=float).T
+
+    y_vit = np.interp(temps, xp_vit, yp_vit)
+    y_alt = np.interp(temps, xp_alt, yp_alt)
+
+    T = temperature(y_alt, temperature_layer)
+    a = vitesse_son(1.4, (8.314/(28.966*1e-3)), T)
+    P = pressure(y_alt * 1e-3, pressure_layer)
+    rho_air = density(y_alt * 1e-3, density_layer)
+
+    FreeStream = {
+        "TEMPS": temps,
+        "ALTITUDE": y_alt,
+        "VITESSE": y_vit,
+        "TEMPERATURE": T,
+        "PRESSION": P,
+        "MASSE VOLUMIQUE": rho_air,
+        "VITESSE DU SON": a,
+        "VISCOSITÉ": Sutherland(T),
+        "MACH": y_vit / a,
+        "PRESSION DYNAMIQUE": 0.5 * rho_air * y_vit**2,
+    }
+
+    return FreeStream
+
+def Compute_MachAltitude(ThermoProperties_dict=None):
+    """
+    Calcule l'évolution du nombre de Mach et de l'altitude en fonction du temps, sans affichage.
+
+    Cette fonction évalue, via `Compute_FreeStream`, l'évolution :
     - Du nombre de Mach
     - De l'altitude
     - De la pression dynamique
 
+    Paramètres :
+    ------------
+    ThermoProperties_dict : dict, optionnel
+        Conservé pour compatibilité : l'atmosphère est désormais évaluée directement
+        aux altitudes de la trajectoire.
+
     Retourne :
     ----------
     temps : array
@@ -324,59 +439,31 @@ def Get_MachAltitude(ThermoProperties_dict):
     dynamique_pressure : array
         Pression dynamique en Pascals.
     """
-    xp_vit = np.array([0, 11, 22, 33, 44, 55, 66, 77, 88, 100, 125, 200])
-    yp_vit = np.array([0, 55.55, 166.66, 222, 277.76, 353, 395.016, 512.5, 777, 1000, 2000, 2300])
-
-    xp_alt = np.array([0, 25, 50, 75, 100, 125, 150, 175, 200])
-    yp_alt = np.array([0, 2546, 5538, 15084, 26923, 42552, 61538, 86000, 107692])
-
-    xp_alt_interp = np.linspace(xp_alt.min(), xp_alt.max(), 1000)
-    yp_alt_interp = np.interp(xp_alt_interp, xp_alt, yp_alt)
-
-    B = np.linspace(0, 200, 1000)
-
-    altitude = np.zeros_like(B)
-    Nbr_mach = np.zeros_like(B)
-    dynamique_pressure = np.zeros_like(B)
-
-    for i, b in enumerate(B):
-        y_vit = np.interp(b, xp_vit, yp_vit)
-        y_alt = np.interp(b, xp_alt, yp_alt)
-        altitude[i] = y_alt
-        
-        T = np.interp(y_alt, yp_alt_interp, ThermoProperties_dict['TEMPERATURE'])
-        a = np.interp(y_alt, yp_alt_interp, ThermoProperties_dict['VITESSE DU SON'])
-        P = np.interp(y_alt, yp_alt_interp, ThermoProperties_dict['PRESSION'])
-        rho_air = np.interp(y_alt, yp_alt_interp, ThermoProperties_dict['MASSE VOLUMIQUE'])
-        
-        Nbr_mach[i] = y_vit / a
-        dynamique_pressure[i] = 0.5 * rho_air * y_vit**2
-
-    fig, ax1 = plt.subplots(figsize=(14, 5))
-
-    temps = B
-    ax1.plot(temps, Nbr_mach, label="Mach", color="red")
-    ax1.fill_between(temps, Nbr_mach, 5, where=Nbr_mach >= 5, color='purple', alpha=0.3, label="Hypersonique")
-    ax1.fill_between(temps, Nbr_mach, 1, where=(Nbr_mach >= 1) & (Nbr_mach <= 5), color='orange', alpha=0.3, label="Supersonique")
-    ax1.fill_between(temps, Nbr_mach, 0.1, where=(Nbr_mach <= 1), color='blue', alpha=0.3, label="Subsonique compressible")
-    ax1.fill_between(temps, Nbr_mach, 0, where=(Nbr_mach <= 0.1), color='red', alpha=0.3, label="Subsonique incompressible")
-    ax1.axhline(y=1, color='b', linestyle='-')
-    ax1.axhline(y=5, color='b', linestyle='-')
-    ax1.axhline(y=0.1, color='b', linestyle='-')
-    ax1.set_xlabel("Temps (s)")
-    ax1.set_ylabel("Nombre de Mach", color='red')
-    ax1.tick_params(axis='y', labelcolor='red')
-    ax1.legend(loc="upper left")
-    ax1.grid(True)
-
-    ax2 = ax1.twinx()
-    ax2.plot(temps, altitude, label="Altitude (m)", color="yellow")
-    ax2.set_ylabel("Altitude (m)", color='purple')
-    ax2.tick_params(axis='y', labelcolor='purple')
-    ax2.legend(loc="upper right")
-
-    plt.title("Graphique représentant le nombre de Mach et l'altitude en fonction du temps")
-    plt.show()
+    FreeStream = Compute_FreeStream(np.linspace(0, 200, 1000))
+
+    return FreeStream["TEMPS"], FreeStream["MACH"], FreeStream["ALTITUDE"], FreeStream["PRESSION DYNAMIQUE"]
+
+def Get_MachAltitude(ThermoProperties_dict):
+    """
+    Calcule et affiche l'évolution du nombre de Mach et de l'altitude en fonction du temps.
+
+    Les données sont calculées par `Compute_MachAltitude` puis tracées par `Show_MachAltitude`.
+
+    Retourne :
+    ----------
+    temps : array
+        Temps en secondes.
+    Nbr_mach : array
+        Nombre de Mach en fonction du temps.
+    altitude : array
+        Altitude en mètres.
+    dynamique_pressure : array
+        Pression dynamique en Pascals.
+    """
+    from graph_management.EvolFlightParams import Show_MachAltitude
+
+    temps, Nbr_mach, altitude, dynamique_pressure = Compute_MachAltitude(ThermoProperties_dict)
+    Show_MachAltitude(temps=temps, Nbr_mach=Nbr_mach, altitude=altitude)
 
     return temps, Nbr_mach, altitude, dynamique_pressure
 
@@ -0,0 +1,300 @@
+import numpy as np
+from scipy.integrate import solve_ivp
+
+# indices des composantes de l'état (VR, γ, Z, X)
+STATE_KEYS = ["VITESSE RELATIVE", "PENTE", "ALTITUDE", "DISTANCE"]
+
+R_T = 6378000               # rayon de la Terre (m)
+MU_T = 39.86e13             # constante gravitationnelle terrestre (m³/s²)
+OMEGA_T = 2 * np.pi / 86164 # vitesse angulaire de rotation de la Terre (rad/s)
+
+    # ========================================== #
+    # ========== TABLES PAR MORCEAUX =========== #
+    # ========================================== #
+
+def Compile_Schedule(pieces):
+    """
+    Compile une loi horaire polynomiale par morceaux en table de points de rupture.
+
+    Paramètres :
+    ------------
+    pieces : list
+        Liste de triplets (t_debut, t_origine, coeffs) triés par t_debut : sur [t_debut, t_debut suivant[,
+        la loi vaut Σ coeffs[k] * (t - t_origine)**k. Le premier morceau s'étend jusqu'à -∞
+        (son t_debut est ignoré), le dernier jusqu'à +∞.
+
+    Retourne :
+    ----------
+    schedule : dict
+        - "BREAKPOINTS" : débuts des morceaux 2 à n.
+        - "ORIGINS" : origine des temps de chaque morceau.
+        - "COEFFS" : coefficients (n_morceaux, degré + 1), complétés par des zéros.
+    """
+    degree = max(len(coeffs) for _, _, coeffs in pieces)
+
+    coeff_arr = np.zeros(shape=(len(pieces), degree))
+    for i, (_, _, coeffs) in enumerate(pieces):
+        coeff_arr[i, :len(coeffs)] = coeffs
+
+    schedule = {
+        "BREAKPOINTS": np.array([t_start for t_start, _, _ in pieces[1:]], dtype=float),
+        "ORIGINS": np.array([t_origin for _, t_origin, _ in pieces], dtype=float),
+        "COEFFS": coeff_arr,
+    }
+
+    return schedule
+
+def Evaluate_Schedule(schedule, t):
+    """
+    Évalue une loi compilée par `Compile_Schedule` (recherche du morceau par `searchsorted`, schéma de Horner).
+
+    Paramètres :
+    ------------
+    schedule : dict
+        Sortie de `Compile_Schedule`.
+    t : float ou array-like
+        Instant(s) (s).
+
+    Retourne :
+    ----------
+    value : float ou np.ndarray
+        Valeur(s) de la loi, de la forme de `t`.
+    """
+    i = np.searchsorted(schedule["BREAKPOINTS"], t, side="right")
+    dt = t - schedule["ORIGINS"][i]
+    coeffs = schedule["COEFFS"][i]
+
+    value = coeffs[..., -1]
+    for k in range(coeffs.shape[-1] - 2, -1, -1):
+        value = value * dt + coeffs[..., k]
+
+    return value
+
+    # ========================================== #
+    # ========== MODÈLE DU LANCEUR ============= #
+    # ========================================== #
+
+def Get_AscentModel(t_vertical=20.0, atmosphere=None):
+    """
+    Construit le modèle de montée d'Ariane V (masse, poussée, assiette et traînée) sous forme de tables.
+
+    Paramètres :
+    ------------
+    t_vertical : float, optionnel (par défaut = 20.0)
+        Durée de la phase verticale (s) : la pente γ n'évolue pas avant cet instant.
+    atmosphere : dict, optionnel (par défaut = None)
+        Table atmosphérique (`Load_AtmosphereTable`). None : masse volumique simplifiée du notebook.
+
+    Retourne :
+    ----------
+    model : dict
+        - "MASSE" (kg), "POUSSÉE" (N), "ASSIETTE" (rad) : lois compilées par `Compile_Schedule`.
+        - "RHO_Z", "RHO_0", "RHO_Z0", "RHO_K" : couches de masse volumique ρ = ρ_0 exp(k (Z - Z_0)) (bornes en m).
+        - "S_Z", "S_REF" : surface de référence (m²) selon l'altitude.
+        - "CX_V", "CX" : coefficient de traînée selon la vitesse relative (m/s).
+        - "T_VERTICAL" : durée de la phase verticale (s).
+        - "ATMOSPHERE" : table atmosphérique utilisée pour la masse volumique (ou None).
+
+    Remarque :
+    ----------
+    - Les lois reprennent celles de `aero_launcher.ipynb` (fonctions `masse`, `poussee`, `theta` et `trainee`).
+    """
+    m_0, m_dot_EAP, m_dot_EPC = 780000, 2600, 3869.4
+    m_burnout = m_0 - (m_dot_EAP + m_dot_EPC) * (105 - 7)
+    m_EAP_off = m_0 - m_dot_EAP * (105 - 7)
+    F_EPC, F_EAP = 1145000, 5100000
+
+    masse = Compile_Schedule([
+        (-np.inf, 0, (m_0,)),
+        (7, 7, (m_0, -(m_dot_EAP + m_dot_EPC))),
+        (105, 0, (m_burnout,)),
+        (122, 105, (m_EAP_off, -m_dot_EPC, m_dot_EPC / 15)),
+        (137, 0, (m_EAP_off - m_dot_EPC * 15 / 2,)),
+    ])
+
+    poussee = Compile_Schedule([
+        (-np.inf, 0, (0,)),
+        (7, 0, (F_EPC + 2 * F_EAP,)),
+        (122, 137, (F_EPC, -2 * F_EAP / 15)),
+        (137, 0, (F_EPC,)),
+        (589, 0, (0,)),
+    ])
+
+    # --> assiette : tronçons linéaires (t_début, t_fin, θ_début, θ_fin) en degrés ; le tronçon 550 - 950 s
+    #     repart de 10° comme dans le notebook
+    pitch = [(20, 100, 90, 55), (100, 137, 55, 44), (137, 200, 44, 29), (200, 550, 29, 15), (550, 950, 10, 8), (950, 1299, 8, 21)]
+
+    pitch_pieces = [(-np.inf, 0, (np.radians(90),))]
+    for t_a, t_b, theta_a, theta_b in pitch:
+        pitch_pieces.append((t_a, t_a, (np.radians(theta_a), np.radians((theta_b - theta_a) / (t_b - t_a)))))
+    pitch_pieces.append((1299, 0, (np.radians(21),)))
+
+    model = {
+        "MASSE": masse,
+        "POUSSÉE": poussee,
+        "ASSIETTE": Compile_Schedule(pitch_pieces),
+        "RHO_Z": np.array([11000.0]),
+        "RHO_0": np.array([1.225, 0.0]),
+        "RHO_Z0": np.array([0.0, 11000.0]),
+        "RHO_K": np.array([-0.1064e-3, 0.0]),
+        "S_Z": np.array([13000.0]),
+        "S_REF": np.array([37.0, 22.9]),
+        "CX_V": np.array([0.9 * 340, 1.4 * 340]),
+        "CX": np.array([0.6, 2.16, 0.4]),
+        "T_VERTICAL": float(t_vertical),
+        "ATMOSPHERE": atmosphere,
+    }
+
+    return model
+
+def Compute_Density(model, Z):
+    """
+    Calcule la masse volumique (kg/m³) vue par le lanceur : table atmosphérique du modèle si elle
+    est fournie, sinon couches simplifiées du notebook.
+    """
+    if model["ATMOSPHERE"] is not None:
+        return np.interp(Z, model["ATMOSPHERE"]["ALTITUDE"], model["ATMOSPHERE"]["MASSE VOLUMIQUE"])
+
+    i_rho = np.searchsorted(model["RHO_Z"], Z, side="right")
+    return model["RHO_0"][i_rho] * np.exp(model["RHO_K"][i_rho] * (Z - model["RHO_Z0"][i_rho]))
+
+def Compute_Drag(model, VR, Z, rho=None):
+    """
+    Calcule la traînée (N) pour des vitesses relatives et des altitudes quelconques (tableaux diffusables).
+
+    Remarque :
+    ----------
+    - Les seuils sont stricts comme dans le notebook : Z < 11000 m pour ρ, Z < 13000 m pour S
+      et VR > seuil pour le coefficient de traînée.
+    - `rho` permet de fournir une masse volumique déjà calculée (par défaut `Compute_Density`).
+    """
+    rho = Compute_Density(model, Z) if rho is None else rho
+
+    S = model["S_REF"][np.searchsorted(model["S_Z"], Z, side="right")]
+    CX = model["CX"][np.searchsorted(model["CX_V"], VR, side="left")]
+
+    return 0.5 * rho * S * CX * VR**2
+
+    # ========================================== #
+    # ========== SECOND MEMBRE ================= #
+    # ========================================== #
+
+def Compute_AscentRHS(t, u, model, dispersion=None):
+    """
+    Second membre des équations de la trajectoire de montée, pour un lot d'états.
+
+    Paramètres :
+    ------------
+    t : float
+        Instant (s).
+    u : np.ndarray
+        États de forme (4, ...) : vitesse relative VR (m/s), pente γ (rad), altitude Z (m) et distance X (m),
+        chaque composante pouvant porter un nombre quelconque de trajectoires.
+    model : dict
+        Sortie de `Get_AscentModel`.
+    dispersion : dict, optionnel (par défaut = None)
+        Perturbations par trajectoire (tableaux diffusables avec `u[0]`) : facteurs "POUSSÉE", "MASSE",
+        "CX" et "MASSE VOLUMIQUE", décalage "ASSIETTE" (rad). Voir `Draw_Dispersions`.
+
+    Retourne :
+    ----------
+    du : np.ndarray
+        Dérivées, de même forme que `u`.
+    """
+    VR, gamma, Z = u[0], u[1], u[2]
+
+    # --> lois horaires : communes à toutes les trajectoires, évaluées une seule fois
+    M = Evaluate_Schedule(model["MASSE"], t)
+    acc = Evaluate_Schedule(model["POUSSÉE"], t) / M
+    Theta = Evaluate_Schedule(model["ASSIETTE"], t)
+
+    r = R_T + np.maximum(Z, 0)
+    G_eff = MU_T / r**2
+    VT = OMEGA_T * r
+
+    if dispersion is None:
+        RX = Compute_Drag(model, VR, Z)
+    else:
+        M = M * dispersion["MASSE"]
+        acc = acc * dispersion["POUSSÉE"] / dispersion["MASSE"]
+        Theta = Theta + dispersion["ASSIETTE"]
+        RX = Compute_Drag(model, VR, Z, rho=Compute_Density(model, Z) * dispersion["MASSE VOLUMIQUE"]) * dispersion["CX"]
+
+    sin_gamma, cos_gamma = np.sin(gamma), np.cos(gamma)
+
+    du = np.empty_like(u)
+    du[0] = acc - G_eff * sin_gamma - RX / M - (G_eff - OMEGA_T * VT) * sin_gamma
+
+    if t > model["T_VERTICAL"]:
+        du[1] = (1 / np.maximum(VR, 1)) * (acc * np.sin(Theta - gamma) - G_eff * cos_gamma) + 2 * OMEGA_T + OMEGA_T * (VT / VR + VR / VT) * cos_gamma
+    else:
+        du[1] = 0
+
+    du[2] = np.maximum(VR * sin_gamma, 0)
+    du[3] = VR * cos_gamma * R_T / r
+
+    return du
+
+def Get_AscentRHS(model, n_traj):
+    """
+    Retourne le second membre à plat attendu par `solve_ivp` pour `n_traj` trajectoires intégrées ensemble.
+
+    Remarque :
+    ----------
+    - L'état à plat est rangé composante par composante : y = [VR_1..VR_n, γ_1..γ_n, Z_1..Z_n, X_1..X_n].
+    - L'option `vectorized=True` de `solve_ivp` est acceptée (y de forme (4 n_traj, k)).
+    """
+    def rhs(t, y):
+        u = y.reshape((4, n_traj) + y.shape[1:])
+        return Compute_AscentRHS(t, u, model).reshape(y.shape)
+
+    return rhs
+
+def Integrate_Ascent(model, u0, t_span=(0, 200), t_eval=None, method="RK45", rtol=1e-6, atol=1e-6):
+    """
+    Intègre ensemble un lot de trajectoires de montée avec `solve_ivp`.
+
+    Paramètres :
+    ------------
+    model : dict
+        Sortie de `Get_AscentModel`.
+    u0 : array-like
+        État(s) initial(aux) (VR, γ, Z, X) de forme (4,) ou (n_traj, 4).
+    t_span : tuple, optionnel (par défaut = (0, 200))
+        Intervalle d'intégration (s).
+    t_eval : array-like, optionnel (par défaut = None)
+        Instants de sortie.
+    method : str, optionnel (par défaut = "RK45")
+        Méthode de `solve_ivp`.
+    rtol, atol : float, optionnel (par défaut = 1e-6)
+        Tolérances de `solve_ivp`.
+
+    Retourne :
+    ----------
+    trajectory : dict
+        - "TEMPS" : instants (n_t,).
+        - `STATE_KEYS` : composantes de l'état, de forme (n_traj, n_t) (ou (n_t,) pour un état initial unique).
+
+    Remarque :
+    ----------
+    - Un seul appel à `solve_ivp` fait avancer toutes les trajectoires : le pas est commun et
+      contrôlé par la trajectoire la plus exigeante.
+    - Lève une `RuntimeError` si `solve_ivp` s'arrête avant la fin de `t_span` (par exemple un pas
+      devenu trop petit pour un état initial non physique) : aucune trajectoire tronquée n'est retournée.
+    """
+    u0 = np.asarray(u0, dtype=float)
+    single = u0.ndim == 1
+    u0 = np.atleast_2d(u0)
+    n_traj = u0.shape[0]
+
+    sol = solve_ivp(Get_AscentRHS(model, n_traj), t_span, u0.T.reshape(-1), t_eval=t_eval, method=method, rtol=rtol, atol=atol)
+    if not sol.success:
+        raise RuntimeError(f"Échec de l'intégration à t = {sol.t[-1]:.6g} s (statut {sol.status}) : {sol.message}")
+
+    states = sol.y.reshape(4, n_traj, -1)
+
+    trajectory = {"TEMPS": sol.t}
+    for k, key in enumerate(STATE_KEYS):
+        trajectory[key] = states[k, 0] if single else states[k]
+
+    return trajectory
@@ -0,0 +1,149 @@
+import numpy as np
+
+from thermo_property.AtmosphereTable import Load_AtmosphereTable
+from trajectory_management.AscentRHS import Compute_AscentRHS
+
+# écarts-types par défaut : relatifs pour les facteurs, en radians pour le décalage d'assiette
+DEFAULT_SIGMA = {
+    "POUSSÉE": 0.02,
+    "MASSE": 0.01,
+    "ASSIETTE": np.radians(0.5),
+    "CX": 0.10,
+    "MASSE VOLUMIQUE": 0.05,
+}
+
+ENVELOPE_KEYS = ["ALTITUDE", "MACH", "PRESSION DYNAMIQUE"]
+
+    # ========================================== #
+    # ========== TIRAGES ======================= #
+    # ========================================== #
+
+def Draw_Dispersions(n_traj, sigma=None, seed=None):
+    """
+    Tire les perturbations de `n_traj` trajectoires (lois normales indépendantes).
+
+    Paramètres :
+    ------------
+    n_traj : int
+        Nombre de trajectoires.
+    sigma : dict, optionnel (par défaut = None)
+        Écarts-types remplaçant ceux de `DEFAULT_SIGMA` (clés "POUSSÉE", "MASSE", "ASSIETTE", "CX", "MASSE VOLUMIQUE").
+    seed : int, optionnel (par défaut = None)
+        Graine du générateur aléatoire.
+
+    Retourne :
+    ----------
+    dispersion : dict
+        Tableaux (n_traj,) : facteurs 1 + σ ξ pour la poussée, la masse, le coefficient de traînée et la
+        masse volumique, décalage σ ξ (rad) pour l'assiette.
+    """
+    sigma = {**DEFAULT_SIGMA, **({} if sigma is None else sigma)}
+    rng = np.random.default_rng(seed)
+
+    dispersion = {}
+    for key in DEFAULT_SIGMA:
+        xi = sigma[key] * rng.standard_normal(n_traj)
+        dispersion[key] = xi if key == "ASSIETTE" else 1 + xi
+
+    return dispersion
+
+    # ========================================== #
+    # ========== INTÉGRATION EN LOT ============ #
+    # ========================================== #
+
+def _rk4_step(t, u, dt, model, dispersion):
+    k1 = Compute_AscentRHS(t, u, model, dispersion)
+    k2 = Compute_AscentRHS(t + 0.5 * dt, u + 0.5 * dt * k1, model, dispersion)
+    k3 = Compute_AscentRHS(t + 0.5 * dt, u + 0.5 * dt * k2, model, dispersion)
+    k4 = Compute_AscentRHS(t + dt, u + dt * k3, model, dispersion)
+
+    return u + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+def _flight_quantities(u, model, dispersion, atmosphere):
+    """
+    Altitude (m), nombre de Mach et pression dynamique (Pa) de chaque trajectoire.
+    """
+    VR, Z = u[0], u[2]
+    rho = np.interp(Z, atmosphere["ALTITUDE"], atmosphere["MASSE VOLUMIQUE"]) * dispersion["MASSE VOLUMIQUE"]
+    a = np.interp(Z, atmosphere["ALTITUDE"], atmosphere["VITESSE DU SON"])
+
+    return {"ALTITUDE": Z, "MACH": VR / a, "PRESSION DYNAMIQUE": 0.5 * rho * VR**2}
+
+def Run_Dispersion(model, u0, t_eval, n_traj=1000, sigma=None, seed=None, n_substeps=64, percentiles=(1, 5, 50, 95, 99), atmosphere=None):
+    """
+    Intègre un ensemble de trajectoires de montée dispersées et retourne leurs enveloppes.
+
+    Paramètres :
+    ------------
+    model : dict
+        Sortie de `Get_AscentModel`.
+    u0 : array-like
+        État initial (VR, γ, Z, X) commun de forme (4,), ou états initiaux de forme (n_traj, 4).
+    t_eval : array-like
+        Instants de sortie (s), croissants ; t_eval[0] est l'instant initial.
+    n_traj : int, optionnel (par défaut = 1000)
+        Nombre de trajectoires (ignoré si `u0` est de forme (n_traj, 4)).
+    sigma : dict, optionnel (par défaut = None)
+        Écarts-types des perturbations (voir `Draw_Dispersions`).
+    seed : int, optionnel (par défaut = None)
+        Graine du générateur aléatoire.
+    n_substeps : int, optionnel (par défaut = 64)
+        Nombre de pas de Runge-Kutta (ordre 4, pas fixe) entre deux instants de sortie.
+    percentiles : tuple, optionnel (par défaut = (1, 5, 50, 95, 99))
+        Centiles des enveloppes.
+    atmosphere : dict, optionnel (par défaut = None)
+        Table atmosphérique donnant la masse volumique et la vitesse du son. None : table du modèle
+        (`model["ATMOSPHERE"]`), ou `Load_AtmosphereTable()` si le modèle n'en a pas.
+
+    Retourne :
+    ----------
+    results : dict
+        - "TEMPS" : instants de sortie (n_t,).
+        - "CENTILES" : centiles calculés.
+        - "ALTITUDE", "MACH", "PRESSION DYNAMIQUE" : enveloppes de forme (n_centiles, n_t).
+        - "DISPERSIONS" : perturbations tirées (sortie de `Draw_Dispersions`).
+        - "ETAT FINAL" : états au dernier instant, de forme (n_traj, 4).
+
+    Remarque :
+    ----------
+    - Toutes les trajectoires avancent ensemble : l'état est un seul tableau (4, n_traj) et chaque
+      évaluation du second membre traite l'ensemble en un appel vectorisé.
+    - Le pas est fixe : les seuils du modèle (coefficient de traînée selon la vitesse, surface de référence
+      selon l'altitude) tombent à l'intérieur des pas et ramènent la convergence à l'ordre 1 environ. Pour des
+      instants de sortie espacés de 1 s, l'écart d'altitude à 200 s avec `Integrate_Ascent` (rtol = 1e-11)
+      vaut environ 140 m pour n_substeps = 4, 27 m pour 16 et 4 m pour 64.
+    - Seules les enveloppes sont conservées (mémoire indépendante du nombre d'instants × trajectoires).
+    - La masse volumique de la traînée et de la pression dynamique est celle de la table `atmosphere`
+      (qui remplace celle du modèle), multipliée par la perturbation de masse volumique.
+    """
+    atmosphere = model["ATMOSPHERE"] if atmosphere is None else atmosphere
+    atmosphere = Load_AtmosphereTable() if atmosphere is None else atmosphere
+    model = {**model, "ATMOSPHERE": atmosphere}
+    t_eval = np.asarray(t_eval, dtype=float)
+
+    u0 = np.asarray(u0, dtype=float)
+    u = np.tile(u0[:, np.newaxis], (1, n_traj)) if u0.ndim == 1 else u0.T.copy()
+    n_traj = u.shape[1]
+
+    dispersion = Draw_Dispersions(n_traj, sigma=sigma, seed=seed)
+    envelopes = {key: np.empty(shape=(len(percentiles), len(t_eval))) for key in ENVELOPE_KEYS}
+
+    for i, t in enumerate(t_eval):
+        if i > 0:
+            dt = (t - t_eval[i - 1]) / n_substeps
+            for k in range(n_substeps):
+                u = _rk4_step(t_eval[i - 1] + k * dt, u, dt, model, dispersion)
+
+        quantities = _flight_quantities(u, model, dispersion, atmosphere)
+        for key in ENVELOPE_KEYS:
+            envelopes[key][:, i] = np.percentile(quantities[key], percentiles)
+
+    results = {
+        "TEMPS": t_eval,
+        "CENTILES": np.asarray(percentiles),
+        **envelopes,
+        "DISPERSIONS": dispersion,
+        "ETAT FINAL": u.T,
+    }
+
+    return results